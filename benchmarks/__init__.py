@@ -0,0 +1,7 @@
+"""
+## Benchmarks
+
+```sh
+PYTHONPATH=src python -m benchmarks --help
+```
+"""
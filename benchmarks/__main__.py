@@ -0,0 +1,95 @@
+"""
+## Benchmark Runner
+
+Runs the suite, prints every metric and optionally writes them to JSON.
+A previous JSON file can be parsed to `--compare` to print the ratio of each metric
+
+```sh
+PYTHONPATH=src python -m benchmarks --output results.json
+PYTHONPATH=src python -m benchmarks --quick --only spawn_latency chunk_split
+PYTHONPATH=src python -m benchmarks --compare results.json
+```
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+from typing import Any, Dict, List, Optional
+
+import thread
+
+from .suite import BENCHMARKS
+
+
+def run(names: List[str], scale: float) -> Dict[str, Any]:
+    """Runs the named benchmarks and returns the results with the environment they ran in"""
+    results: Dict[str, Dict[str, float]] = {}
+    for name in names:
+        t = time.perf_counter()
+        results[name] = BENCHMARKS[name](scale)
+        print('%s (%.1fs)' % (name, time.perf_counter() - t))
+        for metric, value in results[name].items():
+            print('  %-32s %14.2f' % (metric, value))
+
+    return {
+        'version': thread.__version__,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'timestamp': time.time(),
+        'scale': scale,
+        'results': results,
+    }
+
+
+def compare(current: Dict[str, Any], previous: Dict[str, Any]) -> None:
+    """Prints the ratio of every metric present in both runs"""
+    print('\ncompared to %s (%s)' % (previous['version'], previous['python']))
+    for name, metrics in current['results'].items():
+        before = previous['results'].get(name, {})
+        for metric, value in metrics.items():
+            if before.get(metric):
+                print(
+                    '  %-48s %8.2fx'
+                    % ('%s.%s' % (name, metric), value / before[metric])
+                )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks')
+    parser.add_argument(
+        '--only', nargs='+', choices=sorted(BENCHMARKS), help='benchmarks to run'
+    )
+    parser.add_argument(
+        '--scale', type=float, default=1, help='multiplies the size of every run'
+    )
+    parser.add_argument(
+        '--quick', action='store_true', help='shorthand for --scale 0.1'
+    )
+    parser.add_argument('--output', help='path to write the results to as JSON')
+    parser.add_argument('--compare', help='path to a previous JSON results file')
+    args = parser.parse_args(argv)
+
+    scale = 0.1 if args.quick else args.scale
+    if scale <= 0:
+        parser.error('--scale must be greater than 0')
+
+    report = run(args.only or list(BENCHMARKS), scale)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(report, json.load(f))
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,388 @@
+"""
+## Benchmark Suite
+
+Measures spawn latency, pool reuse, pool queue wait by priority, per-entry overhead, throughput against `max_threads`,
+schedules on a heavy-tailed workload, the process executor, memory per thread and its lazily allocated state
+and scaling of CPU and I/O bound workloads.
+Every benchmark returns flat metrics so runs can be written to JSON and compared
+
+```sh
+PYTHONPATH=src python -m benchmarks --output results.json
+```
+"""
+
+import gc
+import os
+import time
+import random
+import statistics
+import threading
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+from thread import ConcurrentProcessing, Settings, Thread, ThreadPool, threaded
+from thread.thread import _ThreadWorker
+from thread.utils.algorithm import chunk_split
+
+
+Settings.set_verbosity('quiet')
+
+Metrics = Dict[str, float]
+Benchmark = Callable[[float], Metrics]
+
+BENCHMARKS: Dict[str, Benchmark] = {}
+
+
+def benchmark(name: str) -> Callable[[Benchmark], Benchmark]:
+    """Registers a benchmark, it is called with a scale factor and returns its metrics"""
+
+    def wrapper(func: Benchmark) -> Benchmark:
+        BENCHMARKS[name] = func
+        return func
+
+    return wrapper
+
+
+def _summary(prefix: str, samples: List[float], unit: float = 1e6) -> Metrics:
+    """Median and p95 of samples, in microseconds by default"""
+    ordered = sorted(samples)
+    return {
+        f'{prefix}_median_us': statistics.median(ordered) * unit,
+        f'{prefix}_p95_us': ordered[max(0, int(len(ordered) * 0.95) - 1)] * unit,
+    }
+
+
+def _runs(base: int, scale: float) -> int:
+    return max(1, int(base * scale))
+
+
+def _identity(x: Any) -> Any:
+    return x
+
+
+def _spin(x: int) -> int:
+    total = 0
+    for i in range(2000):
+        total += i * x
+    return total
+
+
+def _count(n: int) -> int:
+    total = 0
+    for i in range(n):
+        total += i * i % 7
+    return total
+
+
+def _sleep(x: Any) -> Any:
+    time.sleep(0.001)
+    return x
+
+
+# >>>>>>>>>> Spawn <<<<<<<<<< #
+@benchmark('spawn_latency')
+def spawn_latency(scale: float) -> Metrics:
+    """Time between starting a `Thread` and its target executing, and the full start to join round trip"""
+    started: List[float] = []
+    round_trip: List[float] = []
+    for _ in range(_runs(1000, scale)):
+        began: List[float] = []
+        t = time.perf_counter()
+        job = Thread(target=lambda began=began: began.append(time.perf_counter()))
+        job.start()
+        job.join()
+        done = time.perf_counter()
+        started.append(began[0] - t)
+        round_trip.append(done - t)
+    return {**_summary('start', started), **_summary('round_trip', round_trip)}
+
+
+@benchmark('threaded_latency')
+def threaded_latency(scale: float) -> Metrics:
+    """Start to join round trip through the `@threaded` decorator"""
+
+    @threaded
+    def _run() -> None:
+        return None
+
+    samples: List[float] = []
+    for _ in range(_runs(1000, scale)):
+        t = time.perf_counter()
+        _run().join()
+        samples.append(time.perf_counter() - t)
+    return _summary('round_trip', samples)
+
+
+@benchmark('pool_reuse')
+def pool_reuse(scale: float) -> Metrics:
+    """Startup latency and small job wall time of spawning a `Thread` per job against reusing a `ThreadPool`"""
+    runs = _runs(2000, scale)
+    max_threads = 8
+    dataset = list(range(max_threads * 4))
+
+    def _startup(start: Callable[[Callable[[], None]], None]) -> List[float]:
+        samples: List[float] = []
+        for _ in range(runs):
+            began: List[float] = []
+            requested = time.perf_counter()
+            start(lambda began=began: began.append(time.perf_counter()))
+            samples.append(began[0] - requested)
+        return samples
+
+    def _spawn(target: Callable[[], None]) -> None:
+        job = Thread(target=target)
+        job.start()
+        job.join()
+
+    def _job(pool: Optional[ThreadPool]) -> List[float]:
+        samples: List[float] = []
+        for _ in range(max(1, runs // 10)):
+            t = time.perf_counter()
+            job = ConcurrentProcessing(
+                function=_identity, dataset=dataset, max_threads=max_threads, pool=pool
+            )
+            job.start()
+            job.get_return_values()
+            samples.append(time.perf_counter() - t)
+        return samples
+
+    with ThreadPool(max_workers=max_threads) as pool:
+        return {
+            **_summary('spawn_start', _startup(_spawn)),
+            **_summary(
+                'pool_start', _startup(lambda target: pool.submit(target).join())
+            ),
+            **_summary('spawn_job', _job(None)),
+            **_summary('pool_job', _job(pool)),
+        }
+
+
+@benchmark('pool_queue')
+def pool_queue(scale: float) -> Metrics:
+    """Jobs per second through a `ThreadPool` heap queue and the time they waited in it, by priority"""
+    count = _runs(5000, scale)
+    with ThreadPool(max_workers=4) as pool:
+        t = time.perf_counter()
+        jobs = [pool.submit(_identity, args=[i], priority=i % 2) for i in range(count)]
+        for job in jobs:
+            job.join()
+        elapsed = time.perf_counter() - t
+
+    def _wait(priority: int) -> List[float]:
+        return [job.stats.queue_wait or 0 for job in jobs[priority::2]]
+
+    return {
+        'jobs_per_s': count / elapsed,
+        'peak_depth': float(pool.stats.peak_depth),
+        **_summary('wait_high', _wait(1)),
+        **_summary('wait_low', _wait(0)),
+    }
+
+
+# >>>>>>>>>> Concurrent Processing <<<<<<<<<< #
+@benchmark('per_item_overhead')
+def per_item_overhead(scale: float) -> Metrics:
+    """Nanoseconds `ConcurrentProcessing` adds per entry over a plain loop, on one thread"""
+    dataset = list(range(_runs(200_000, scale)))
+
+    t = time.perf_counter()
+    baseline = [_identity(x) for x in dataset]
+    plain = time.perf_counter() - t
+
+    metrics: Metrics = {'plain_ns': plain / len(dataset) * 1e9}
+    for schedule in ('static', 'dynamic', 'guided'):
+        job = ConcurrentProcessing(
+            function=_identity, dataset=dataset, max_threads=1, schedule=schedule
+        )
+        t = time.perf_counter()
+        job.start()
+        assert job.get_return_values() == baseline
+        elapsed = time.perf_counter() - t
+        metrics[f'{schedule}_ns'] = elapsed / len(dataset) * 1e9
+        metrics[f'{schedule}_overhead_ns'] = (elapsed - plain) / len(dataset) * 1e9
+    return metrics
+
+
+@benchmark('throughput_vs_threads')
+def throughput_vs_threads(scale: float) -> Metrics:
+    """Entries per second of a trivial function as `max_threads` grows"""
+    dataset = list(range(_runs(100_000, scale)))
+    metrics: Metrics = {}
+    for max_threads in (1, 2, 4, 8, 16):
+        job = ConcurrentProcessing(
+            function=_identity, dataset=dataset, max_threads=max_threads
+        )
+        t = time.perf_counter()
+        job.start()
+        job.join()
+        metrics[f'threads_{max_threads}_items_per_s'] = len(dataset) / (
+            time.perf_counter() - t
+        )
+    return metrics
+
+
+@benchmark('schedule_heavy_tailed')
+def schedule_heavy_tailed(scale: float) -> Metrics:
+    """Wall time of each schedule when a few clustered entries cost far more than the rest"""
+    max_threads = 8
+    rng = random.Random(0)
+    # Pareto distributed per-entry cost, sorted like a sorted input file
+    dataset = sorted(
+        min(0.05, 0.0002 * rng.paretovariate(1.2)) for _ in range(_runs(2000, scale))
+    )
+
+    metrics: Metrics = {'ideal_s': sum(dataset) / max_threads}
+    for schedule in ('static', 'dynamic', 'guided'):
+        job = ConcurrentProcessing(
+            function=time.sleep,
+            dataset=dataset,
+            max_threads=max_threads,
+            schedule=schedule,
+        )
+        t = time.perf_counter()
+        job.start()
+        job.join()
+        metrics[f'{schedule}_s'] = time.perf_counter() - t
+    return metrics
+
+
+@benchmark('executor_cpu_bound')
+def executor_cpu_bound(scale: float) -> Metrics:
+    """Wall time of the `thread` and `process` executors on entries which compute in Python"""
+    dataset = [_runs(200_000, scale)] * 64
+    metrics: Metrics = {}
+    for max_threads in sorted({1, 2, 4, os.cpu_count() or 1}):
+        for executor in ('thread', 'process'):
+            job = ConcurrentProcessing(
+                function=_count,
+                dataset=dataset,
+                max_threads=max_threads,
+                executor=executor,
+            )
+            t = time.perf_counter()
+            job.start()
+            job.join()
+            metrics[f'{executor}_{max_threads}_s'] = time.perf_counter() - t
+    return metrics
+
+
+def _scaling(function: Callable[[Any], Any], length: int) -> Metrics:
+    """Speedup of each thread count over a single thread"""
+    dataset = list(range(length))
+    wall: Dict[int, float] = {}
+    for max_threads in (1, 2, 4, 8):
+        job = ConcurrentProcessing(
+            function=function, dataset=dataset, max_threads=max_threads
+        )
+        t = time.perf_counter()
+        job.start()
+        job.join()
+        wall[max_threads] = time.perf_counter() - t
+    return {
+        f'threads_{max_threads}_speedup': wall[1] / elapsed
+        for max_threads, elapsed in wall.items()
+    }
+
+
+@benchmark('scaling_io_bound')
+def scaling_io_bound(scale: float) -> Metrics:
+    """Speedup on entries which sleep, threads overlap the waits"""
+    return _scaling(_sleep, _runs(400, scale))
+
+
+@benchmark('scaling_cpu_bound')
+def scaling_cpu_bound(scale: float) -> Metrics:
+    """Speedup on entries which compute in Python, bounded by the GIL"""
+    return _scaling(_spin, _runs(2000, scale))
+
+
+# >>>>>>>>>> Memory <<<<<<<<<< #
+@benchmark('memory_per_thread')
+def memory_per_thread(scale: float) -> Metrics:
+    """Python heap allocated per idle `Thread` object and per running thread, native stacks are not counted"""
+    count = _runs(500, scale)
+    gc.collect()
+
+    tracemalloc.start()
+    try:
+        empty = tracemalloc.take_snapshot()
+        plain = [threading.Thread(target=_identity, args=[None]) for _ in range(count)]
+        before = tracemalloc.take_snapshot()
+        idle = [Thread(target=_identity, args=[None]) for _ in range(count)]
+        created = tracemalloc.take_snapshot()
+
+        event = threading.Event()
+        running = [Thread(target=event.wait, daemon=True) for _ in range(count)]
+        for job in running:
+            job.start()
+        started = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    event.set()
+    for job in running:
+        job.join()
+    del idle, plain
+
+    def _delta(a: tracemalloc.Snapshot, b: tracemalloc.Snapshot) -> float:
+        return sum(stat.size_diff for stat in b.compare_to(a, 'filename')) / count
+
+    return {
+        'created_bytes': _delta(before, created),
+        'overhead_bytes': _delta(before, created) - _delta(empty, before),
+        'running_bytes': _delta(created, started) - _delta(before, created),
+    }
+
+
+def _bytes_per_object(factory: Callable[[], Any], count: int) -> float:
+    """Heap allocated per object while `count` of them are alive"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        objects: List[Any] = [factory() for _ in range(count)]
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    assert len(objects) == count
+    return sum(stat.size_diff for stat in after.compare_to(before, 'filename')) / count
+
+
+def _touched() -> Thread:
+    """A thread whose future, token and hooks have been allocated"""
+    job = Thread(target=_identity, args=[None])
+    _ = job.future, job.cancellation_token
+    job.add_hook(print)
+    return job
+
+
+@benchmark('memory_lazy_state')
+def memory_lazy_state(scale: float) -> Metrics:
+    """Python heap per `Thread` once its lazily allocated state is touched, and per chunk worker record"""
+    count = _runs(10_000, scale)
+    plain = _bytes_per_object(lambda: threading.Thread(target=_identity), count)
+    idle = _bytes_per_object(lambda: Thread(target=_identity), count)
+    touched = _bytes_per_object(_touched, count)
+    return {
+        'plain_bytes': plain,
+        'idle_bytes': idle,
+        'touched_bytes': touched,
+        'touched_overhead_bytes': touched - idle,
+        'worker_bytes': _bytes_per_object(lambda: _ThreadWorker(None), count),  # type: ignore
+    }
+
+
+# >>>>>>>>>> Algorithms <<<<<<<<<< #
+@benchmark('chunk_split')
+def chunk_split_cost(scale: float) -> Metrics:
+    """Time to split a dataset into chunks"""
+    metrics: Metrics = {}
+    for chunks in (8, 1024):
+        samples: List[float] = []
+        for _ in range(_runs(1000, scale)):
+            t = time.perf_counter()
+            list(chunk_split(1_000_000, chunks))
+            samples.append(time.perf_counter() - t)
+        metrics.update(_summary(f'chunks_{chunks}', samples))
+    return metrics
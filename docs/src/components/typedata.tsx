@@ -4,20 +4,26 @@ export interface TypeData {
 
 export const Statuses: string[] = [
   "Idle",
+  "Queued",
   "Running",
   "Invoking hooks",
   "Completed",
   "Errored",
+  "Cancelled",
   "Kill Scheduled",
   "Killed",
 ];
 export const ThreadStatuses: TypeData = {
   Idle: "This means that the thread is idle and ready to be ran.",
+  Queued:
+    "This means that the thread is waiting in a `thread.ThreadPool` queue for a worker.",
   Running: "This means that the thread is currently running.",
   "Invoking hooks": "This means that the thread is currently invoking hooks.",
   Completed:
     "This means that the thread and hooks have completed and is no longer running.",
   Errored: "This means that the thread has errored and is no longer running.",
+  Cancelled:
+    "This means that the thread stopped early because its cancellation token was cancelled.",
   "Kill Scheduled":
     "This means that the thread has been scheduled to and will be killed when the next tick occurs.",
   Killed:
@@ -29,6 +35,9 @@ export const Exceptions: string[] = [
   "ThreadNotRunningError",
   "ThreadNotInitializedError",
   "HookRuntimeError",
+  "CancelledError",
+  "InvalidStateTransitionError",
+  "QueueFullError",
 ];
 export const ThreadExceptions: TypeData = {
   ThreadStillRunningError:
@@ -39,4 +48,10 @@ export const ThreadExceptions: TypeData = {
     "Raised when the thread is not initialized and cannot invoke the method. You can initialize the thread by calling `Thread.__init__()`.",
   HookRuntimeError:
     "Raised when an error occurs in a hook. This is usually caused by an exception in a hook. You can find the exception in `Thread.errors`.",
+  CancelledError:
+    "Raised when the thread stopped because its cancellation token was cancelled. You can cancel a thread with `Thread.cancel()`.",
+  InvalidStateTransitionError:
+    "Raised when `Thread.status` is set to a status the thread cannot reach from its current status. You can check `Thread.state.can_become()` first.",
+  QueueFullError:
+    "Raised when a thread is submitted to a `thread.ThreadPool` whose queue is full and `overflow` is `reject`. You can retry later or use the `block` or `caller_runs` overflow modes.",
 };
@@ -23,10 +23,14 @@ from . import _types as types
 from . import exceptions
 
 # Export decorators
-from .decorators import processor, threaded
+from .decorators import processor, threaded, async_processor, async_threaded
 
 # Export Core
-from .thread import ConcurrentProcessing, Thread
+from .thread import ConcurrentProcessing, Thread, kill_all, graceful_shutdown
+from .pool import ThreadPool
+from .cancellation import CancellationToken
+from .cache import ResultCache
+from .observers import Observer, add_observer, remove_observer
 
 # Configuration
 from .utils import Settings
@@ -35,8 +39,18 @@ from .utils import Settings
 __all__ = [
     'Thread',
     'ConcurrentProcessing',
+    'ThreadPool',
+    'CancellationToken',
+    'ResultCache',
+    'Observer',
+    'add_observer',
+    'remove_observer',
+    'kill_all',
+    'graceful_shutdown',
     'threaded',
     'processor',
+    'async_threaded',
+    'async_processor',
     'types',
     'exceptions',
     'Settings',
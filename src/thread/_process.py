@@ -0,0 +1,69 @@
+"""
+## Process backend helpers
+
+These run inside the worker processes of `ConcurrentProcessing(executor = 'process')`
+"""
+
+import pickle
+import multiprocessing
+from multiprocessing.context import BaseContext
+from typing import Any, Callable, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+
+_state: Tuple[
+    Callable[..., Any],
+    Any,
+    Callable[[Any, int], Any],
+    Optional[Callable[[Any, int, int], Iterable[Any]]],
+    Sequence[Any],
+    Mapping[str, Any],
+    bool,
+]
+
+
+def is_picklable(*objects: Any) -> bool:
+    """Whether every object can be shipped to a worker process"""
+    try:
+        for obj in objects:
+            pickle.dumps(obj)
+    except Exception:
+        return False
+    return True
+
+
+def get_context() -> BaseContext:
+    """
+    The context worker processes are started with\n
+    Forking the threaded parent can deadlock a worker on a lock held by another thread, so `fork` is never used
+    """
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context(
+        'forkserver' if 'forkserver' in methods else 'spawn'
+    )
+
+
+def initialize(
+    function: Callable[..., Any],
+    dataset: Any,
+    get_value: Callable[[Any, int], Any],
+    get_slice: Optional[Callable[[Any, int, int], Iterable[Any]]],
+    args: Sequence[Any],
+    kwargs: Mapping[str, Any],
+    batched: bool = False,
+) -> None:
+    """Stores the job once per worker process so only index ranges travel per batch"""
+    global _state
+    _state = (function, dataset, get_value, get_slice, args, kwargs, batched)
+
+
+def run_batch(start: int, end: int) -> List[Any]:
+    """Computes a `[start, end)` slice of the dataset in the worker process"""
+    function, dataset, get_value, get_slice, args, kwargs, batched = _state
+    if get_slice is not None:
+        data_chunk = get_slice(dataset, start, end)
+    else:
+        data_chunk = [get_value(dataset, x) for x in range(start, end)]
+
+    if batched:
+        return list(function(data_chunk, *args, **kwargs))
+    return [function(data_entry, *args, **kwargs) for data_entry in data_chunk]
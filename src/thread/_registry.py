@@ -0,0 +1,174 @@
+"""
+## Thread Registry
+
+Tracks running `Thread` objects, indexed by ident, name and status
+"""
+
+import weakref
+import threading
+
+from ._types import ThreadState, ThreadStatus
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Union,
+    TYPE_CHECKING,
+)
+
+if TYPE_CHECKING:
+    from .thread import Thread
+
+
+class _Entry:
+    __slots__ = ('ref', 'name', 'ident', 'status')
+
+    ref: 'weakref.ref[Thread]'
+    name: str
+    ident: Optional[int]
+    status: ThreadState
+
+    def __init__(
+        self,
+        ref: 'weakref.ref[Thread]',
+        name: str,
+        ident: Optional[int],
+        status: ThreadState,
+    ) -> None:
+        self.ref = ref
+        self.name = name
+        self.ident = ident
+        self.status = status
+
+
+class ThreadRegistry:
+    """
+    Thread Registry
+    ---------------
+
+    A lock-protected set of running threads.
+    Threads are held by weak reference so a thread which never unregisters cannot leak
+    """
+
+    _lock: threading.RLock
+    _entries: Dict[int, _Entry]
+    _by_ident: Dict[int, int]
+    _by_name: Dict[str, Set[int]]
+    _by_status: Dict[ThreadState, Set[int]]
+
+    def __init__(self) -> None:
+        # Re-entrant as weakref callbacks can fire during a locked allocation
+        self._lock = threading.RLock()
+        self._entries = {}
+        self._by_ident = {}
+        self._by_name = {}
+        self._by_status = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, thread: Any) -> bool:
+        entry = self._entries.get(id(thread))
+        return entry is not None and entry.ref() is thread
+
+    def __iter__(self) -> Iterator['Thread']:
+        return iter(self.snapshot())
+
+    def add(self, thread: 'Thread') -> None:
+        """Registers a running thread, its ident and name are indexed as of now"""
+        key = id(thread)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            entry = _Entry(
+                weakref.ref(thread, lambda _: self._collect(key)),
+                thread.name,
+                thread.ident,
+                thread._state,
+            )
+            self._entries[key] = entry
+            self._by_status.setdefault(entry.status, set()).add(key)
+            self._by_name.setdefault(entry.name, set()).add(key)
+            if entry.ident is not None:
+                self._by_ident[entry.ident] = key
+
+    def discard(self, thread: 'Thread') -> None:
+        """Unregisters a thread if it is registered"""
+        with self._lock:
+            if thread in self:
+                self._remove(id(thread))
+
+    def set_status(
+        self, thread: 'Thread', status: Union[ThreadStatus, ThreadState]
+    ) -> None:
+        """Writes the thread status, moving it between status indexes if registered"""
+        key = id(thread)
+        status = ThreadState.of(status)
+        with self._lock:
+            thread._state = status
+            entry = self._entries.get(key)
+            if entry is None or entry.ref() is not thread or entry.status == status:
+                return
+
+            self._discard_index(self._by_status, entry.status, key)
+            self._by_status.setdefault(status, set()).add(key)
+            entry.status = status
+
+    def get(self, ident: int) -> Optional['Thread']:
+        """The registered thread with this ident, None if there is none"""
+        with self._lock:
+            key = self._by_ident.get(ident)
+            return None if key is None else self._entries[key].ref()
+
+    def by_name(self, name: str) -> List['Thread']:
+        """The registered threads with this name"""
+        with self._lock:
+            return self._resolve(self._by_name.get(name, ()))
+
+    def by_status(self, status: Union[ThreadStatus, ThreadState]) -> List['Thread']:
+        """The registered threads with this status"""
+        with self._lock:
+            return self._resolve(self._by_status.get(ThreadState.of(status), ()))
+
+    def snapshot(self) -> List['Thread']:
+        """Every registered thread"""
+        with self._lock:
+            return self._resolve(self._entries)
+
+    def _resolve(self, keys: Iterable[int]) -> List['Thread']:
+        """Dereferences keys, the lock must be held"""
+        threads = []
+        for key in keys:
+            thread = self._entries[key].ref()
+            if thread is not None:
+                threads.append(thread)
+        return threads
+
+    def _collect(self, key: int) -> None:
+        """Weakref callback for a thread garbage collected while registered"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.ref() is None:
+                self._remove(key)
+
+    def _remove(self, key: int) -> None:
+        """Drops a key from every index, the lock must be held"""
+        entry = self._entries.pop(key)
+        self._discard_index(self._by_status, entry.status, key)
+        self._discard_index(self._by_name, entry.name, key)
+        if entry.ident is not None and self._by_ident.get(entry.ident) == key:
+            del self._by_ident[entry.ident]
+
+    @staticmethod
+    def _discard_index(index: Dict[Any, Set[int]], value: Any, key: int) -> None:
+        """Removes a key from an index bucket, dropping the bucket once empty"""
+        keys = index.get(value)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del index[value]
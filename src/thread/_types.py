@@ -2,7 +2,18 @@
 ## Types
 """
 
-from typing import Any, Literal, Callable, Union, Sized
+from enum import IntEnum
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Literal,
+    Callable,
+    Tuple,
+    Union,
+    Sized,
+    get_args,
+)
 from typing_extensions import (
     ParamSpec,
     TypeVar,
@@ -21,15 +32,120 @@ Overflow_In = Any
 # Variable Types
 ThreadStatus = Literal[
     'Idle',
+    'Queued',
     'Running',
     'Invoking hooks',
     'Completed',
     'Errored',
+    'Cancelled',
     'Kill Scheduled',
     'Killed',
 ]
 
 
+class ThreadState(IntEnum):
+    """`ThreadStatus` as an integer, in the same order, with the transitions a thread may take"""
+
+    IDLE = 0
+    QUEUED = 1
+    RUNNING = 2
+    INVOKING_HOOKS = 3
+    COMPLETED = 4
+    ERRORED = 5
+    CANCELLED = 6
+    KILL_SCHEDULED = 7
+    KILLED = 8
+
+    @property
+    def status(self) -> ThreadStatus:
+        """The `ThreadStatus` string of this state"""
+        return THREAD_STATUSES[self]
+
+    @classmethod
+    def of(cls, status: Union[ThreadStatus, 'ThreadState']) -> 'ThreadState':
+        """The state of a `ThreadStatus` string, states are returned as is"""
+        if isinstance(status, ThreadState):
+            return status
+        return _THREAD_STATES[status]
+
+    @property
+    def terminal(self) -> bool:
+        """Whether no transition leaves this state"""
+        return not _TRANSITIONS[self]
+
+    def can_become(self, state: 'ThreadState') -> bool:
+        """Whether a thread in this state may transition to `state`"""
+        return state in _TRANSITIONS[self]
+
+
+THREAD_STATUSES: Tuple[ThreadStatus, ...] = get_args(ThreadStatus)
+_THREAD_STATES: Dict[str, ThreadState] = {
+    status: ThreadState(i) for i, status in enumerate(THREAD_STATUSES)
+}
+
+# `Kill Scheduled` can still lead anywhere, `SystemExit` may land after the target returned
+# and a thread killed before `run` begins still moves to `Running`
+_TRANSITIONS: Dict[ThreadState, FrozenSet[ThreadState]] = {
+    ThreadState.IDLE: frozenset(
+        {
+            ThreadState.QUEUED,
+            ThreadState.RUNNING,
+            ThreadState.CANCELLED,
+            ThreadState.KILL_SCHEDULED,
+        }
+    ),
+    ThreadState.QUEUED: frozenset(
+        {
+            ThreadState.RUNNING,
+            ThreadState.CANCELLED,
+            ThreadState.KILL_SCHEDULED,
+            ThreadState.KILLED,
+        }
+    ),
+    ThreadState.RUNNING: frozenset(
+        {
+            ThreadState.INVOKING_HOOKS,
+            ThreadState.COMPLETED,
+            ThreadState.ERRORED,
+            ThreadState.CANCELLED,
+            ThreadState.KILL_SCHEDULED,
+            ThreadState.KILLED,
+        }
+    ),
+    ThreadState.INVOKING_HOOKS: frozenset(
+        {
+            ThreadState.COMPLETED,
+            ThreadState.KILL_SCHEDULED,
+            ThreadState.KILLED,
+        }
+    ),
+    ThreadState.COMPLETED: frozenset(),
+    ThreadState.ERRORED: frozenset(),
+    ThreadState.CANCELLED: frozenset(),
+    ThreadState.KILL_SCHEDULED: frozenset(
+        {
+            ThreadState.RUNNING,
+            ThreadState.INVOKING_HOOKS,
+            ThreadState.COMPLETED,
+            ThreadState.ERRORED,
+            ThreadState.CANCELLED,
+            ThreadState.KILL_SCHEDULED,
+            ThreadState.KILLED,
+        }
+    ),
+    ThreadState.KILLED: frozenset(),
+}
+TERMINAL_STATES: FrozenSet[ThreadState] = frozenset(
+    state for state, targets in _TRANSITIONS.items() if not targets
+)
+
+ScheduleMode = Literal['static', 'dynamic', 'guided']
+ExecutorMode = Literal['thread', 'process']
+WaitMode = Literal['FIRST_COMPLETED', 'FIRST_EXCEPTION', 'ALL_COMPLETED']
+HookMode = Literal['inline', 'async']
+OverflowMode = Literal['block', 'reject', 'caller_runs']
+
+
 # Function types
 _Target_P = ParamSpec('_Target_P')
 _Target_T = TypeVar('_Target_T')
@@ -0,0 +1,205 @@
+"""
+## Result Caching
+
+```py
+class ResultCache: ...
+```
+"""
+
+import time
+import threading
+from functools import wraps
+from collections import OrderedDict
+from concurrent.futures import Future
+
+from typing import Any, Callable, Dict, Hashable, Mapping, Optional, Sequence, Tuple
+
+
+_MISSING = object()
+_KWARGS_MARK = object()
+
+
+def make_key(args: Sequence[Any], kwargs: Mapping[str, Any]) -> Optional[Hashable]:
+    """
+    Builds a cache key from call arguments
+
+    Returns
+    -------
+    :returns: The key, None if any argument is unhashable
+    """
+    key: Tuple[Any, ...] = tuple(args)
+    if kwargs:
+        key += (_KWARGS_MARK, *sorted(kwargs.items()))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+class ResultCache:
+    """
+    Result Cache
+    ------------
+
+    A thread-safe least recently used store whose entries optionally expire.
+    `get_or_call` deduplicates concurrent misses, the first caller computes the value
+    while callers asking for the same key wait for it instead of computing it again
+    """
+
+    maxsize: Optional[int]
+    ttl: Optional[float]
+    hits: int
+    misses: int
+
+    _entries: 'OrderedDict[Hashable, Tuple[Any, Optional[float]]]'
+    _pending: Dict[Hashable, 'Future[Any]']
+    _lock: threading.Lock
+
+    def __init__(
+        self, maxsize: Optional[int] = 128, ttl: Optional[float] = None
+    ) -> None:
+        """
+        Initializes a result cache
+
+        Parameters
+        ----------
+        :param maxsize: This should be the maximum number of entries kept, the least recently used is evicted first. None to never evict
+        :param ttl: This should be the number of seconds an entry is kept after it is stored, None to keep it until evicted
+
+        Raises
+        ------
+        ValueError: `maxsize` is 0 or negative
+        ValueError: `ttl` is 0 or negative
+        """
+        if maxsize is not None and maxsize <= 0:
+            raise ValueError('`maxsize` must be greater than 0')
+        if ttl is not None and ttl <= 0:
+            raise ValueError('`ttl` must be greater than 0')
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f'<ResultCache size={len(self)} hits={self.hits} misses={self.misses}>'
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return self._lookup(key) is not _MISSING
+
+    def _lookup(self, key: Hashable) -> Any:
+        """Returns the live value of a key, dropping it if expired, the lock must be held"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISSING
+
+        value, expires = entry
+        if expires is not None and expires <= time.monotonic():
+            del self._entries[key]
+            return _MISSING
+        self._entries.move_to_end(key)
+        return value
+
+    def _store(self, key: Hashable, value: Any) -> None:
+        """Stores a value, evicting the least recently used entry if full, the lock must be held"""
+        expires = None if self.ttl is None else time.monotonic() + self.ttl
+        self._entries[key] = (value, expires)
+        self._entries.move_to_end(key)
+        if self.maxsize is not None and len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """The value stored for a key, `default` if there is none or it expired"""
+        with self._lock:
+            value = self._lookup(key)
+        return default if value is _MISSING else value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Stores a value for a key"""
+        with self._lock:
+            self._store(key, value)
+
+    def discard(self, key: Hashable, value: Any = _MISSING) -> None:
+        """Removes a key, only if it still holds `value` when it is given"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (value is _MISSING or entry[0] is value):
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Removes every entry, computations in flight still finish"""
+        with self._lock:
+            self._entries.clear()
+
+    def get_or_call(
+        self, key: Hashable, function: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Any:
+        """
+        Returns the value stored for a key, computing and storing it on a miss
+
+        Parameters
+        ----------
+        :param key: This should be a hashable key, see `make_key`
+        :param function: This should be the function computing the value, it is called with `*args` and `**kwargs`
+
+        Returns
+        -------
+        :returns: The stored or computed value
+
+        Raises
+        ------
+        Exception: What `function` raised, also raised in callers waiting on the same key. Nothing is stored
+        """
+        with self._lock:
+            value = self._lookup(key)
+            if value is not _MISSING:
+                self.hits += 1
+                return value
+
+            pending = self._pending.get(key)
+            if pending is None:
+                self.misses += 1
+                future: 'Future[Any]' = Future()
+                self._pending[key] = future
+            else:
+                self.hits += 1
+
+        if pending is not None:
+            return pending.result()
+
+        try:
+            value = function(*args, **kwargs)
+        except BaseException as e:
+            with self._lock:
+                del self._pending[key]
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            self._store(key, value)
+            del self._pending[key]
+        future.set_result(value)
+        return value
+
+    def memoize(self, function: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        Wraps a function to look up its results in this cache, keyed on all of its arguments\n
+        Calls with unhashable arguments are not cached
+        """
+
+        @wraps(function)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            key = make_key(args, kwargs)
+            if key is None:
+                return function(*args, **kwargs)
+            return self.get_or_call(key, function, *args, **kwargs)
+
+        return wrapper
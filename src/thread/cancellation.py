@@ -0,0 +1,117 @@
+"""
+## Cooperative Cancellation
+
+```py
+class CancellationToken: ...
+```
+"""
+
+import inspect
+import threading
+from weakref import WeakKeyDictionary
+
+from . import exceptions
+
+from typing import Any, Callable, List, Optional
+
+
+class CancellationToken:
+    """
+    Cancellation Token
+    ------------------
+
+    A flag shared between the caller and a running target.
+    Unlike `Thread.kill()`, the target decides where it is safe to stop,
+    so no locks are left held and blocking calls can be unblocked from a callback
+    """
+
+    cancelled: bool
+    _event: threading.Event
+    _callbacks: List[Callable[[], Any]]
+    _lock: threading.Lock
+
+    def __init__(self) -> None:
+        self.cancelled = False
+        self._event = threading.Event()
+        self._callbacks = []
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f'<CancellationToken cancelled={self.cancelled}>'
+
+    def cancel(self) -> None:
+        """Requests cancellation, invoking callbacks the first time it is called"""
+        with self._lock:
+            if self.cancelled:
+                return
+            self.cancelled = True
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+
+        for callback in callbacks:
+            callback()
+
+    def raise_if_cancelled(self) -> None:
+        """
+        Raises if cancellation was requested
+
+        Raises
+        ------
+        CancelledError: If the token was cancelled
+        """
+        if self.cancelled:
+            raise exceptions.CancelledError()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Halts the current thread execution until cancellation is requested or exceeds the timeout
+
+        Parameters
+        ----------
+        :param timeout: The maximum time allowed to halt the thread
+
+        Returns
+        -------
+        :returns bool: True if the token was cancelled
+        """
+        return self._event.wait(timeout)
+
+    def add_callback(self, callback: Callable[[], Any]) -> None:
+        """
+        Registers a function to be invoked on cancellation, immediately if already cancelled
+
+        Parameters
+        ----------
+        :param callback: This should be a function which takes no arguments, e.g. closing a socket to unblock a read
+        """
+        with self._lock:
+            if not self.cancelled:
+                self._callbacks.append(callback)
+                return
+        callback()
+
+
+# Signatures are inspected once per function, `Thread.__init__` asks on every construction
+_accepts: 'WeakKeyDictionary[Any, bool]' = WeakKeyDictionary()
+
+
+def accepts_token(target: Callable[..., Any]) -> bool:
+    """Whether `target` declares a `cancellation_token` parameter to be injected"""
+    # Bound methods are created on every attribute access, their function is stable
+    key = getattr(target, '__func__', target)
+    try:
+        return _accepts[key]
+    except (KeyError, TypeError):
+        pass
+
+    try:
+        accepts = 'cancellation_token' in inspect.signature(target).parameters
+    except (TypeError, ValueError):
+        accepts = False
+
+    try:
+        _accepts[key] = accepts
+    except TypeError:
+        # Not hashable or weakly referenceable, inspected on every call
+        pass
+    return accepts
@@ -4,3 +4,4 @@ Export decorators
 
 from ._threaded import threaded
 from ._processor import processor
+from ._async import async_threaded, async_processor
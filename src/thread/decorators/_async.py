@@ -0,0 +1,241 @@
+"""
+## Async Threaded and Processor
+"""
+
+from functools import wraps
+from ._threaded import threaded
+from ._processor import processor, Dataset
+from ..pool import ThreadPool
+
+from .._types import Overflow_In, Data_In
+from typing import (
+    Awaitable,
+    Callable,
+    List,
+    Mapping,
+    Sequence,
+    Optional,
+    Union,
+    overload,
+)
+from typing_extensions import ParamSpec, TypeVar, Concatenate
+
+
+T = TypeVar('T')
+P = ParamSpec('P')
+TargetFunction = Callable[P, T]
+
+NoParamReturn = Callable[P, Awaitable[T]]
+WithParamReturn = Callable[[TargetFunction[P, T]], NoParamReturn[P, T]]
+FullParamReturn = Callable[P, Awaitable[T]]
+
+
+_DataT = TypeVar('_DataT')
+DataFunction = Callable[Concatenate[_DataT, P], T]
+
+NoParamProcessorReturn = Callable[Concatenate[Dataset[_DataT], P], Awaitable[List[T]]]
+WithParamProcessorReturn = Callable[
+    [DataFunction[_DataT, P, T]], NoParamProcessorReturn[_DataT, P, T]
+]
+FullParamProcessorReturn = Callable[Concatenate[Dataset[_DataT], P], Awaitable[List[T]]]
+
+
+@overload
+def async_threaded(__function: TargetFunction[P, T]) -> NoParamReturn[P, T]: ...
+
+
+@overload
+def async_threaded(
+    *,
+    args: Sequence[Data_In] = (),
+    kwargs: Mapping[str, Data_In] = {},
+    ignore_errors: Sequence[type[Exception]] = (),
+    suppress_errors: bool = False,
+    **overflow_kwargs: Overflow_In,
+) -> WithParamReturn[P, T]: ...
+
+
+@overload
+def async_threaded(
+    __function: TargetFunction[P, T],
+    *,
+    args: Sequence[Data_In] = (),
+    kwargs: Mapping[str, Data_In] = {},
+    ignore_errors: Sequence[type[Exception]] = (),
+    suppress_errors: bool = False,
+    **overflow_kwargs: Overflow_In,
+) -> FullParamReturn[P, T]: ...
+
+
+def async_threaded(
+    __function: Optional[TargetFunction[P, T]] = None,
+    *,
+    args: Sequence[Data_In] = (),
+    kwargs: Mapping[str, Data_In] = {},
+    ignore_errors: Sequence[type[Exception]] = (),
+    suppress_errors: bool = False,
+    **overflow_kwargs: Overflow_In,
+) -> Union[NoParamReturn[P, T], WithParamReturn[P, T], FullParamReturn[P, T]]:
+    """
+    Decorate a function to run it in a thread and await its return value
+
+    Parameters
+    ----------
+    :param __function: The function to run in a thread
+    :param args: Keyword-Only arguments to pass into `thread.Thread`
+    :param kwargs: Keyword-Only keyword arguments to pass into `thread.Thread`
+    :param ignore_errors: Keyword-Only arguments to pass into `thread.Thread`
+    :param suppress_errors: Keyword-Only arguments to pass into `thread.Thread`
+    :param **: Keyword-Only arguments to pass into `thread.Thread`
+
+    Returns
+    -------
+    :return decorator:
+
+    Use Case
+    --------
+    Now whenever `myfunction` is invoked, it will be executed in a thread and a coroutine resolving to its return value is returned.
+    The event loop is not blocked while the thread runs, and cancelling the awaiting task cancels the thread's cancellation token
+
+    >>> @thread.async_threaded
+    >>> def myfunction(*args, **kwargs): ...
+
+    >>> await myfunction(1, 2)
+    """
+
+    if not callable(__function):
+
+        def wrapper(func: TargetFunction[P, T]) -> FullParamReturn[P, T]:
+            return async_threaded(
+                func,
+                args=args,
+                kwargs=kwargs,
+                ignore_errors=ignore_errors,
+                suppress_errors=suppress_errors,
+                **overflow_kwargs,
+            )
+
+        return wrapper
+
+    spawn = threaded(
+        __function,
+        args=args,
+        kwargs=kwargs,
+        ignore_errors=ignore_errors,
+        suppress_errors=suppress_errors,
+        **overflow_kwargs,
+    )
+
+    @wraps(__function)
+    async def wrapped(*parsed_args: P.args, **parsed_kwargs: P.kwargs) -> T:
+        return await spawn(*parsed_args, **parsed_kwargs)
+
+    return wrapped
+
+
+@overload
+def async_processor(
+    __function: DataFunction[_DataT, P, T],
+) -> NoParamProcessorReturn[_DataT, P, T]: ...
+
+
+@overload
+def async_processor(
+    *,
+    args: Sequence[Data_In] = (),
+    kwargs: Mapping[str, Data_In] = {},
+    ignore_errors: Sequence[type[Exception]] = (),
+    suppress_errors: bool = False,
+    pool: Optional[ThreadPool] = None,
+    **overflow_kwargs: Overflow_In,
+) -> WithParamProcessorReturn[_DataT, P, T]: ...
+
+
+@overload
+def async_processor(
+    __function: DataFunction[_DataT, P, T],
+    *,
+    args: Sequence[Data_In] = (),
+    kwargs: Mapping[str, Data_In] = {},
+    ignore_errors: Sequence[type[Exception]] = (),
+    suppress_errors: bool = False,
+    pool: Optional[ThreadPool] = None,
+    **overflow_kwargs: Overflow_In,
+) -> FullParamProcessorReturn[_DataT, P, T]: ...
+
+
+def async_processor(
+    __function: Optional[DataFunction[_DataT, P, T]] = None,
+    *,
+    args: Sequence[Data_In] = (),
+    kwargs: Mapping[str, Data_In] = {},
+    ignore_errors: Sequence[type[Exception]] = (),
+    suppress_errors: bool = False,
+    pool: Optional[ThreadPool] = None,
+    **overflow_kwargs: Overflow_In,
+) -> Union[
+    NoParamProcessorReturn[_DataT, P, T],
+    WithParamProcessorReturn[_DataT, P, T],
+    FullParamProcessorReturn[_DataT, P, T],
+]:
+    """
+    Decorate a function to process a dataset concurrently and await the results
+
+    Parameters
+    ----------
+    :param __function: The function to run on every data entry
+    :param args: Keyword-Only arguments to pass into `thread.ConcurrentProcessing`
+    :param kwargs: Keyword-Only keyword arguments to pass into `thread.ConcurrentProcessing`
+    :param ignore_errors: Keyword-Only arguments to pass into `thread.ConcurrentProcessing`
+    :param suppress_errors: Keyword-Only arguments to pass into `thread.ConcurrentProcessing`
+    :param pool: Keyword-Only `thread.ThreadPool` the chunks are submitted to instead of spawning new threads
+    :param **: Keyword-Only arguments to pass into `thread.ConcurrentProcessing`
+
+    Returns
+    -------
+    :return decorator:
+
+    Use Case
+    --------
+    Now whenever `myfunction` is invoked, the dataset is processed concurrently and a coroutine resolving to the results is returned
+
+    >>> @thread.async_processor
+    >>> def myfunction(data_entry, *args, **kwargs): ...
+
+    >>> await myfunction([1, 2, 3])
+    """
+
+    if not callable(__function):
+
+        def wrapper(
+            func: DataFunction[_DataT, P, T],
+        ) -> FullParamProcessorReturn[_DataT, P, T]:
+            return async_processor(
+                func,
+                args=args,
+                kwargs=kwargs,
+                ignore_errors=ignore_errors,
+                suppress_errors=suppress_errors,
+                pool=pool,
+                **overflow_kwargs,
+            )
+
+        return wrapper
+
+    spawn = processor(
+        __function,
+        args=args,
+        kwargs=kwargs,
+        ignore_errors=ignore_errors,
+        suppress_errors=suppress_errors,
+        pool=pool,
+        **overflow_kwargs,
+    )
+
+    @wraps(__function)
+    async def wrapped(
+        data: Dataset[_DataT], *parsed_args: P.args, **parsed_kwargs: P.kwargs
+    ) -> List[T]:
+        return await spawn(data, *parsed_args, **parsed_kwargs)
+
+    return wrapped
@@ -4,6 +4,8 @@
 
 from functools import wraps
 from ..thread import ConcurrentProcessing
+from ..pool import ThreadPool
+from ..cache import ResultCache
 
 from .._types import (
     Overflow_In,
@@ -52,6 +54,8 @@ def processor(
     kwargs: Mapping[str, Data_In] = {},
     ignore_errors: Sequence[type[Exception]] = (),
     suppress_errors: bool = False,
+    pool: Optional[ThreadPool] = None,
+    cache: Optional[Union[bool, ResultCache]] = None,
     **overflow_kwargs: Overflow_In,
 ) -> WithParamReturn[_DataT, _TargetP, _TargetT]: ...
 
@@ -64,6 +68,8 @@ def processor(
     kwargs: Mapping[str, Data_In] = {},
     ignore_errors: Sequence[type[Exception]] = (),
     suppress_errors: bool = False,
+    pool: Optional[ThreadPool] = None,
+    cache: Optional[Union[bool, ResultCache]] = None,
     **overflow_kwargs: Overflow_In,
 ) -> FullParamReturn[_DataT, _TargetP, _TargetT]: ...
 
@@ -75,6 +81,8 @@ def processor(
     kwargs: Mapping[str, Data_In] = {},
     ignore_errors: Sequence[type[Exception]] = (),
     suppress_errors: bool = False,
+    pool: Optional[ThreadPool] = None,
+    cache: Optional[Union[bool, ResultCache]] = None,
     **overflow_kwargs: Overflow_In,
 ) -> Union[
     NoParamReturn[_DataT, _TargetP, _TargetT],
@@ -91,6 +99,8 @@ def processor(
     :param kwargs: Keyword-Only keyword arguments to pass into `thread.Thread`
     :param ignore_errors: Keyword-Only arguments to pass into `thread.Thread`
     :param suppress_errors: Keyword-Only arguments to pass into `thread.Thread`
+    :param pool: Keyword-Only `thread.ThreadPool` the chunks are submitted to instead of spawning new threads
+    :param cache: Keyword-Only True to compute repeated data entries once per job, or a `ResultCache` to share results across jobs
     :param **: Keyword-Only arguments to pass into `thread.Thread`
 
     Returns
@@ -132,13 +142,20 @@ def processor(
                 kwargs=kwargs,
                 ignore_errors=ignore_errors,
                 suppress_errors=suppress_errors,
+                pool=pool,
+                cache=cache,
                 **overflow_kwargs,
             )
 
         return wrapper
 
     overflow_kwargs.update(
-        {'ignore_errors': ignore_errors, 'suppress_errors': suppress_errors}
+        {
+            'ignore_errors': ignore_errors,
+            'suppress_errors': suppress_errors,
+            'pool': pool,
+            'cache': cache,
+        }
     )
 
     kwargs = dict(kwargs)
@@ -4,9 +4,12 @@
 
 from functools import wraps
 from ..thread import Thread
+from ..pool import ThreadPool
+from ..cache import ResultCache, make_key
+from ..cancellation import accepts_token
 
-from .._types import Overflow_In, Data_In
-from typing import Callable, Mapping, Sequence, Optional, Union, overload
+from .._types import Overflow_In, Data_In, HookMode, OverflowMode, ThreadState
+from typing import Any, Callable, Dict, Mapping, Sequence, Optional, Union, overload
 from typing_extensions import ParamSpec, TypeVar
 
 
@@ -19,6 +22,16 @@ NoParamReturn = Callable[P, Thread[P, T]]
 WithParamReturn = Callable[[TargetFunction[P, T]], NoParamReturn[P, T]]
 FullParamReturn = Callable[P, Thread[P, T]]
 
+# Cached threads in these states are replaced by the next call
+_UNCACHED_STATES = frozenset(
+    {
+        ThreadState.ERRORED,
+        ThreadState.CANCELLED,
+        ThreadState.KILL_SCHEDULED,
+        ThreadState.KILLED,
+    }
+)
+
 
 @overload
 def threaded(__function: TargetFunction[P, T]) -> NoParamReturn[P, T]: ...
@@ -31,6 +44,14 @@ def threaded(
     kwargs: Mapping[str, Data_In] = {},
     ignore_errors: Sequence[type[Exception]] = (),
     suppress_errors: bool = False,
+    hook_mode: HookMode = 'inline',
+    cache: Optional[Union[bool, ResultCache]] = None,
+    max_concurrency: Optional[int] = None,
+    queue_size: Optional[int] = None,
+    overflow: OverflowMode = 'block',
+    pool: Optional[ThreadPool] = None,
+    priority: int = 0,
+    deadline: Optional[float] = None,
     **overflow_kwargs: Overflow_In,
 ) -> WithParamReturn[P, T]: ...
 
@@ -43,6 +64,14 @@ def threaded(
     kwargs: Mapping[str, Data_In] = {},
     ignore_errors: Sequence[type[Exception]] = (),
     suppress_errors: bool = False,
+    hook_mode: HookMode = 'inline',
+    cache: Optional[Union[bool, ResultCache]] = None,
+    max_concurrency: Optional[int] = None,
+    queue_size: Optional[int] = None,
+    overflow: OverflowMode = 'block',
+    pool: Optional[ThreadPool] = None,
+    priority: int = 0,
+    deadline: Optional[float] = None,
     **overflow_kwargs: Overflow_In,
 ) -> FullParamReturn[P, T]: ...
 
@@ -54,6 +83,14 @@ def threaded(
     kwargs: Mapping[str, Data_In] = {},
     ignore_errors: Sequence[type[Exception]] = (),
     suppress_errors: bool = False,
+    hook_mode: HookMode = 'inline',
+    cache: Optional[Union[bool, ResultCache]] = None,
+    max_concurrency: Optional[int] = None,
+    queue_size: Optional[int] = None,
+    overflow: OverflowMode = 'block',
+    pool: Optional[ThreadPool] = None,
+    priority: int = 0,
+    deadline: Optional[float] = None,
     **overflow_kwargs: Overflow_In,
 ) -> Union[NoParamReturn[P, T], WithParamReturn[P, T], FullParamReturn[P, T]]:
     """
@@ -66,12 +103,30 @@ def threaded(
     :param kwargs: Keyword-Only keyword arguments to pass into `thread.Thread`
     :param ignore_errors: Keyword-Only arguments to pass into `thread.Thread`
     :param suppress_errors: Keyword-Only arguments to pass into `thread.Thread`
+    :param hook_mode: Keyword-Only arguments to pass into `thread.Thread`
+    :param cache: Keyword-Only True or a `ResultCache` to reuse the thread of an earlier call with the same hashable arguments, a `cancellation_token` argument is not part of the key
+    :param max_concurrency: Keyword-Only maximum number of calls running at once, calls are queued on a `thread.ThreadPool` of daemonic workers shared by every call instead of spawning a thread each
+    :param queue_size: Keyword-Only maximum number of calls waiting for a worker, None for no limit. Requires `max_concurrency`
+    :param overflow: Keyword-Only what happens to a call once the queue is full, `block` waits for space, `reject` raises `QueueFullError` and `caller_runs` runs it in the calling thread
+    :param pool: Keyword-Only `thread.ThreadPool` the calls are submitted to, share one between functions to prioritise their calls against each other
+    :param priority: Keyword-Only priority of the calls in the pool queue, higher priorities are picked up first. Requires `pool` or `max_concurrency`
+    :param deadline: Keyword-Only seconds a call may wait in the pool queue before it is dropped as `Cancelled`. Requires `pool` or `max_concurrency`
     :param **: Keyword-Only arguments to pass into `thread.Thread`
 
     Returns
     -------
     :return decorator:
 
+    Raises
+    ------
+    ValueError: `max_concurrency` is 0 or negative
+    ValueError: `max_concurrency` is set with `pool`
+    ValueError: `queue_size` is set without `max_concurrency`
+    ValueError: `priority` or `deadline` is set without `pool` or `max_concurrency`
+    ValueError: `deadline` is negative
+    ValueError: `queue_size` is negative
+    ValueError: `overflow` is not a valid overflow mode
+
     Use Case
     --------
     Now whenever `myfunction` is invoked, it will be executed in a thread and the `Thread` object will be returned
@@ -94,6 +149,27 @@ def threaded(
     >>>
     >>> myfunction(4, 6).get_return_value()
     1, 4, 6
+
+    Calls with the same arguments share one thread while it runs and once it completed,
+    failed, cancelled or killed threads are not reused. Every caller gets the same `Thread`
+    >>> @thread.threaded(cache = thread.ResultCache(maxsize = 256, ttl = 60))
+    >>> def fetch(url): ...
+    >>>
+    >>> fetch('a') is fetch('a')
+    True
+
+    Bound the number of threads under load, calls beyond the limit wait in a queue
+    and still return a `Thread`-compatible handle
+    >>> @thread.threaded(max_concurrency = 16, queue_size = 1000, overflow = 'reject')
+    >>> def handle(request): ...
+
+    Share a pool to run latency sensitive calls ahead of batch work,
+    calls still queued after their deadline are dropped
+    >>> scheduler = thread.ThreadPool(max_workers = 8)
+    >>> @thread.threaded(pool = scheduler, priority = 10, deadline = 0.5)
+    >>> def lookup(key): ...
+    >>> @thread.threaded(pool = scheduler)
+    >>> def reindex(): ...
     """
 
     if not callable(__function):
@@ -105,16 +181,76 @@ def threaded(
                 kwargs=kwargs,
                 ignore_errors=ignore_errors,
                 suppress_errors=suppress_errors,
+                hook_mode=hook_mode,
+                cache=cache,
+                max_concurrency=max_concurrency,
+                queue_size=queue_size,
+                overflow=overflow,
+                pool=pool,
+                priority=priority,
+                deadline=deadline,
                 **overflow_kwargs,
             )
 
         return wrapper
 
     overflow_kwargs.update(
-        {'ignore_errors': ignore_errors, 'suppress_errors': suppress_errors}
+        {
+            'ignore_errors': ignore_errors,
+            'suppress_errors': suppress_errors,
+            'hook_mode': hook_mode,
+        }
     )
 
+    if max_concurrency is not None and max_concurrency <= 0:
+        raise ValueError('`max_concurrency` must be greater than 0')
+    if max_concurrency is not None and pool is not None:
+        raise ValueError('`max_concurrency` cannot be set with `pool`')
+    if queue_size is not None and max_concurrency is None:
+        raise ValueError('`queue_size` requires `max_concurrency`')
+    if (priority or deadline is not None) and max_concurrency is None and pool is None:
+        raise ValueError(
+            '`priority` and `deadline` require `pool` or `max_concurrency`'
+        )
+    if deadline is not None and deadline < 0:
+        raise ValueError('`deadline` cannot be negative')
+
+    if max_concurrency is not None:
+        pool = ThreadPool(
+            max_workers=max_concurrency,
+            name=getattr(__function, '__name__', None),
+            queue_size=queue_size,
+            overflow=overflow,
+        )
+
     kwargs = dict(kwargs)
+    if cache is True:
+        cache = ResultCache()
+    store = cache if isinstance(cache, ResultCache) else None
+    # A token only controls the call, calls with different tokens share a thread
+    keyed_token = store is None or not accepts_token(__function)
+
+    def spawn(
+        processed_args: Sequence[Data_In], processed_kwargs: Dict[str, Any]
+    ) -> Thread[P, T]:
+        if pool is not None:
+            return pool.submit(
+                __function,
+                processed_args,
+                processed_kwargs,
+                priority=priority,
+                deadline=deadline,
+                **overflow_kwargs,
+            )
+
+        job = Thread(
+            target=__function,
+            args=processed_args,
+            kwargs=processed_kwargs,
+            **overflow_kwargs,
+        )
+        job.start()
+        return job
 
     @wraps(__function)
     def wrapped(*parsed_args: P.args, **parsed_kwargs: P.kwargs) -> Thread[P, T]:
@@ -125,13 +261,24 @@ def threaded(
             i: v for i, v in parsed_kwargs.items() if i not in ['args', 'kwargs']
         }
 
-        job = Thread(
-            target=__function,
-            args=processed_args,
-            kwargs=processed_kwargs,
-            **overflow_kwargs,
+        if store is None:
+            return spawn(processed_args, processed_kwargs)
+
+        key = make_key(
+            processed_args,
+            processed_kwargs
+            if keyed_token
+            else {
+                i: v for i, v in processed_kwargs.items() if i != 'cancellation_token'
+            },
         )
-        job.start()
+        if key is None:
+            return spawn(processed_args, processed_kwargs)
+
+        job = store.get_or_call(key, spawn, processed_args, processed_kwargs)
+        if job.state in _UNCACHED_STATES:
+            store.discard(key, job)
+            job = store.get_or_call(key, spawn, processed_args, processed_kwargs)
         return job
 
     return wrapped
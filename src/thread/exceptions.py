@@ -39,6 +39,24 @@ class ThreadNotInitializedError(ErrorBase):
     message: str = 'Thread is not initialized, unable to invoke method.'
 
 
+class InvalidStateTransitionError(ErrorBase):
+    """Exception class for moving a thread to a status it cannot reach from its current status"""
+
+    message: str = 'Thread cannot transition to this status from its current status'
+
+
+class QueueFullError(ErrorBase):
+    """Exception class for submitting to a thread pool whose queue is full with `overflow='reject'`"""
+
+    message: str = 'Thread pool queue is full, unable to queue the thread'
+
+
+class CancelledError(ErrorBase):
+    """Exception class for a target which stopped because its cancellation token was cancelled"""
+
+    message: str = 'Cancellation was requested, the target stopped early'
+
+
 class HookRuntimeError(ErrorBase):
     """Exception class for hook runtime errors"""
 
@@ -0,0 +1,295 @@
+"""
+## Lifecycle Observers
+
+```py
+class Observer: ...
+
+
+class SpanObserver(Observer): ...
+
+
+class InMemorySpanExporter: ...
+```
+"""
+
+import time
+import threading
+
+from .utils.config import Settings
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from typing_extensions import Protocol
+
+
+class Observer:
+    """
+    Observer
+    --------
+
+    Receives lifecycle events from `Thread` and `ConcurrentProcessing`, override the events you need.
+    Events are invoked from the thread they happen in, errors raised by observers are swallowed
+    """
+
+    def on_start(self, source: Any) -> None:
+        """Invoked once `source` starts running"""
+
+    def on_finish(self, source: Any) -> None:
+        """Invoked once `source` exits, whatever its final status"""
+
+    def on_error(self, source: Any, error: BaseException) -> None:
+        """Invoked when `source` records an error which is not ignored"""
+
+    def on_kill(self, source: Any) -> None:
+        """Invoked when `source` is killed"""
+
+    def on_hook_error(self, source: Any, error: BaseException) -> None:
+        """Invoked when hooks of `source` raise, with the `HookRuntimeError` collecting them"""
+
+    def on_chunk_progress(self, source: Any, chunkStart: int, chunkEnd: int) -> None:
+        """Invoked when a `ConcurrentProcessing` thread finishes the `[chunkStart, chunkEnd)` batch"""
+
+
+class ObserverRegistry:
+    """
+    Observer Registry
+    -----------------
+
+    Holds the global observers.
+    `active` is the single flag emitters check, it stays False until an observer is added
+    globally or to a thread or job which has been started and has not finished yet
+    """
+
+    active: bool
+    _observers: Tuple[Observer, ...]
+    _attached: int
+    _lock: threading.Lock
+
+    def __init__(self) -> None:
+        self.active = False
+        self._observers = ()
+        self._attached = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._observers)
+
+    def __iter__(self):
+        return iter(self._observers)
+
+    def add(self, observer: Observer) -> None:
+        """Registers an observer for every thread and job"""
+        with self._lock:
+            self._observers = (*self._observers, observer)
+            self._update()
+
+    def remove(self, observer: Observer) -> None:
+        """
+        Unregisters a global observer
+
+        Raises
+        ------
+        ValueError: If the observer is not registered
+        """
+        with self._lock:
+            observers = list(self._observers)
+            observers.remove(observer)
+            self._observers = tuple(observers)
+            self._update()
+
+    def _attach(self) -> None:
+        """Counts a thread or job with its own observers"""
+        with self._lock:
+            self._attached += 1
+            self._update()
+
+    def _detach(self) -> None:
+        """Releases a thread or job with its own observers"""
+        with self._lock:
+            self._attached -= 1
+            self._update()
+
+    def _update(self) -> None:
+        """Recomputes the flag, the lock must be held"""
+        self.active = bool(self._observers) or self._attached > 0
+
+    def emit(
+        self, observers: Iterable[Observer], event: str, source: Any, *args: Any
+    ) -> None:
+        """Invokes an event on the global observers, then on `observers`"""
+        for observer in (*self._observers, *observers):
+            try:
+                getattr(observer, event)(source, *args)
+            except Exception as e:
+                if Settings.VERBOSITY > 'quiet':
+                    print(f'Observer {observer!r} raised in {event}: {e!r}')
+
+
+Observers = ObserverRegistry()
+
+
+def add_observer(observer: Observer) -> None:
+    """
+    Registers an observer receiving events from every thread and job
+
+    Parameters
+    ----------
+    :param observer: This should be an `Observer`
+    """
+    Observers.add(observer)
+
+
+def remove_observer(observer: Observer) -> None:
+    """
+    Unregisters a global observer
+
+    Parameters
+    ----------
+    :param observer: This should be an `Observer` registered with `add_observer`
+
+    Raises
+    ------
+    ValueError: If the observer is not registered
+    """
+    Observers.remove(observer)
+
+
+class Span:
+    """A finished or running span, recorded in the shape OpenTelemetry exporters expect"""
+
+    __slots__ = ('name', 'start_time', 'end_time', 'attributes', 'events', 'status')
+
+    name: str
+    start_time: int
+    end_time: Optional[int]
+    attributes: Dict[str, Any]
+    events: List[Tuple[str, int, Dict[str, Any]]]
+    status: str
+
+    def __init__(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> None:
+        self.name = name
+        self.start_time = time.time_ns()
+        self.end_time = None
+        self.attributes = dict(attributes or {})
+        self.events = []
+        self.status = 'UNSET'
+
+    def __repr__(self) -> str:
+        return f'<Span name={self.name!r} status={self.status}>'
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def add_event(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> None:
+        self.events.append((name, time.time_ns(), dict(attributes or {})))
+
+    def record_exception(self, error: BaseException) -> None:
+        self.add_event(
+            'exception',
+            {'exception.type': type(error).__name__, 'exception.message': str(error)},
+        )
+
+    def set_status(self, status: str) -> None:
+        self.status = status
+
+    def end(self) -> None:
+        self.end_time = time.time_ns()
+
+
+class SpanExporter(Protocol):
+    def export(self, spans: Sequence[Span]) -> Any: ...
+
+
+class InMemorySpanExporter:
+    """Keeps exported spans in memory, for tests and local debugging"""
+
+    _spans: List[Span]
+    _lock: threading.Lock
+
+    def __init__(self) -> None:
+        self._spans = []
+        self._lock = threading.Lock()
+
+    def export(self, spans: Sequence[Span]) -> None:
+        with self._lock:
+            self._spans.extend(spans)
+
+    def get_finished_spans(self) -> List[Span]:
+        """The spans exported so far"""
+        with self._lock:
+            return list(self._spans)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._spans.clear()
+
+
+class SpanObserver(Observer):
+    """
+    Span Observer
+    -------------
+
+    Records a span for every thread and job, from `on_start` to `on_finish`, and exports it once finished.
+    Errors, kills and batch progress are recorded as span events.
+    Any exporter with an OpenTelemetry-style `export(spans)` method can be used
+    """
+
+    exporter: SpanExporter
+    _spans: Dict[int, Span]
+    _lock: threading.Lock
+
+    def __init__(self, exporter: SpanExporter) -> None:
+        self.exporter = exporter
+        self._spans = {}
+        self._lock = threading.Lock()
+
+    def _span(self, source: Any) -> Optional[Span]:
+        with self._lock:
+            return self._spans.get(id(source))
+
+    def on_start(self, source: Any) -> None:
+        span = Span(
+            f'{type(source).__name__}.run',
+            {'thread.kind': type(source).__name__},
+        )
+        name = getattr(source, 'name', None)
+        if name is not None:
+            span.set_attribute('thread.name', name)
+        with self._lock:
+            self._spans[id(source)] = span
+
+    def on_finish(self, source: Any) -> None:
+        with self._lock:
+            span = self._spans.pop(id(source), None)
+        if span is None:
+            return
+
+        status: Union[str, None] = getattr(source, 'status', None)
+        span.set_attribute('thread.status', status)
+        if status == 'Completed' and span.status == 'UNSET':
+            span.set_status('OK')
+        elif status in ('Errored', 'Killed'):
+            span.set_status('ERROR')
+        span.end()
+        self.exporter.export([span])
+
+    def on_error(self, source: Any, error: BaseException) -> None:
+        span = self._span(source)
+        if span is not None:
+            span.record_exception(error)
+            span.set_status('ERROR')
+
+    def on_kill(self, source: Any) -> None:
+        span = self._span(source)
+        if span is not None:
+            span.add_event('killed')
+
+    def on_hook_error(self, source: Any, error: BaseException) -> None:
+        span = self._span(source)
+        if span is not None:
+            span.record_exception(error)
+            span.set_status('ERROR')
+
+    def on_chunk_progress(self, source: Any, chunkStart: int, chunkEnd: int) -> None:
+        span = self._span(source)
+        if span is not None:
+            span.add_event('batch', {'batch.start': chunkStart, 'batch.end': chunkEnd})
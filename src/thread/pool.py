@@ -0,0 +1,549 @@
+"""
+## Thread Pool
+
+```py
+class ThreadPool: ...
+
+
+class PooledThread(Thread): ...
+```
+"""
+
+import time
+import heapq
+import threading
+from itertools import count
+
+from . import exceptions
+from .thread import Thread
+from .stats import PoolStats
+from .observers import Observers
+from .utils.config import Settings
+
+from ._types import (
+    ThreadState,
+    OverflowMode,
+    Data_In,
+    Overflow_In,
+    TargetFunction,
+    _Target_P,
+    _Target_T,
+)
+from typing import Any, Iterator, List, Mapping, Optional, Sequence, Set, Tuple
+
+
+class PooledThread(Thread[_Target_P, _Target_T]):
+    """
+    A `Thread` executed by a `ThreadPool` worker
+    --------------------------------------------
+
+    Behaves like `thread.Thread` (hooks, errors, status, result) but
+    does not own an OS thread, it is queued onto a reusable pool worker instead.
+    Queued threads with a higher `priority` are picked up first
+    """
+
+    __slots__ = (
+        '_pool',
+        '_submitted',
+        '_done',
+        '_worker_ident',
+        'priority',
+        'deadline',
+    )
+
+    _pool: 'ThreadPool'
+    _submitted: bool
+    _done: threading.Event
+    _worker_ident: Optional[int]
+    priority: int
+    deadline: Optional[float]
+
+    def __init__(
+        self,
+        pool: 'ThreadPool',
+        target: TargetFunction[_Target_P, _Target_T],
+        args: Sequence[Data_In] = (),
+        kwargs: Mapping[str, Data_In] = {},
+        ignore_errors: Sequence[type[Exception]] = (),
+        suppress_errors: bool = False,
+        name: Optional[str] = None,
+        *overflow_args: Overflow_In,
+        priority: int = 0,
+        deadline: Optional[float] = None,
+        **overflow_kwargs: Overflow_In,
+    ) -> None:
+        """
+        Initializes a pooled thread
+
+        Parameters
+        ----------
+        :param pool: The `ThreadPool` which will execute this thread
+        :param target: This should be a function that takes in anything and returns anything
+        :param args: This should be an interable sequence of arguments parsed to the `target` function (e.g. tuple('foo', 'bar'))
+        :param kwargs: This should be the kwargs parsed to the `target` function (e.g. dict(foo = 'bar'))
+        :param ignore_errors: This should be an interable sequence of all exceptions to ignore. To ignore all exceptions, parse tuple(Exception)
+        :param suppress_errors: This should be a boolean indicating whether exceptions will be raised, else will only write to internal `errors` property
+        :param name: This is an argument parsed to `threading.Thread`
+        :param *: These are arguments parsed to `thread.Thread`
+        :param priority: This should be an integer, queued threads with a higher priority are picked up first and equal priorities in the order they were queued
+        :param deadline: This should be the number of seconds the thread may wait in the queue, it is dropped as `Cancelled` without running if no worker picked it up by then. None to wait indefinitely
+        :param **: These are arguments parsed to `thread.Thread`, `daemon` is decided by the pool
+
+        Raises
+        ------
+        ValueError: `deadline` is negative
+        """
+        if deadline is not None and deadline < 0:
+            raise ValueError('`deadline` cannot be negative')
+
+        self._pool = pool
+        self.priority = priority
+        self.deadline = deadline
+        self._submitted = False
+        self._done = threading.Event()
+        self._worker_ident = None
+
+        overflow_kwargs.pop('daemon', None)
+        super().__init__(
+            target,
+            args,
+            kwargs,
+            ignore_errors,
+            suppress_errors,
+            name,
+            pool.daemon,
+            None,
+            *overflow_args,
+            **overflow_kwargs,
+        )
+
+    @property
+    def ident(self) -> Optional[int]:
+        """The ident of the pool worker currently executing this thread"""
+        return self._worker_ident
+
+    def _execute(self) -> None:
+        """Runs the target inside the calling pool worker"""
+        self._worker_ident = threading.get_ident()
+        try:
+            self.run()
+        except SystemExit:
+            # Kill delivered after the target had already returned
+            pass
+        finally:
+            self._worker_ident = None
+            self._done.set()
+
+    def is_alive(self) -> bool:
+        """
+        See if thread is queued or still running
+
+        Raises
+        ------
+        ThreadNotInitializedError: If the thread is not initialized
+        """
+        if not self._initialized:
+            raise exceptions.ThreadNotInitializedError()
+        return self._submitted and not self._done.is_set()
+
+    def _wait(self, timeout: Optional[float] = None) -> bool:
+        """Waits for the thread to finish without raising its errors, returns whether it finished"""
+        return self._done.wait(timeout)
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        """
+        Halts the current thread execution until a thread completes or exceeds the timeout
+
+        Parameters
+        ----------
+        :param timeout: The maximum time allowed to halt the thread
+
+        Raises
+        ------
+        ThreadNotInitializedError: If the thread is not initialized
+        ThreadNotRunningError: If the thread was never submitted to the pool
+        """
+        if not self._initialized:
+            raise exceptions.ThreadNotInitializedError()
+
+        if not self._submitted:
+            raise exceptions.ThreadNotRunningError()
+
+        self._done.wait(timeout)
+        self._handle_exceptions()
+
+    def _drop(self, state: ThreadState) -> None:
+        """Settles a thread removed from the queue before it ran"""
+        self._transition(state)
+        self._resolve_future()
+        if state is ThreadState.KILLED and Observers.active:
+            self._emit('on_kill')
+        self._finish_hooks()
+        self._done.set()
+
+    def _schedule_kill(self) -> None:
+        """Drops the thread if it is still queued, else raises `SystemExit` in the pool worker"""
+        if self._pool._discard(self):
+            self._drop(ThreadState.KILLED)
+            return
+        super()._schedule_kill()
+
+    def start(self) -> None:
+        """
+        Queues the thread onto the pool\n
+        If the queue is full and the pool overflows with `caller_runs`, the thread runs before this returns
+
+        Raises
+        ------
+        ThreadNotInitializedError: If the thread is not initialized
+        ThreadStillRunningError: If the thread is already queued or running
+        RuntimeError: If the thread has already been ran
+        RuntimeError: If the pool has been shutdown
+        QueueFullError: If the queue is full and the pool overflows with `reject`
+        """
+        if self.is_alive():
+            raise exceptions.ThreadStillRunningError()
+        if self._submitted:
+            raise RuntimeError('threads can only be started once')
+
+        self._launch()
+        try:
+            queued = self._pool._enqueue(self)
+        except BaseException:
+            self._abort_launch()
+            raise
+        if not queued:
+            self._execute()
+
+
+class ThreadPool:
+    """
+    Thread Pool
+    -----------
+
+    A bounded set of reusable worker threads.
+    Workers are spawned lazily up to `max_workers` and exit after idling for `idle_timeout` seconds.
+    Once every worker is busy, at most `queue_size` threads wait in the queue and `overflow` decides what happens to the next.
+    The queue is a heap ordered by priority, threads whose deadline passed while queued are dropped instead of ran
+    """
+
+    max_workers: int
+    idle_timeout: Optional[float]
+    name: str
+    daemon: bool
+    queue_size: Optional[int]
+    overflow: OverflowMode
+
+    stats: PoolStats
+
+    # (-priority, sequence, queued at, expires at, thread)
+    _tasks: List[Tuple[int, int, float, Optional[float], PooledThread]]
+    _sequence: Iterator[int]
+    _workers: Set[threading.Thread]
+    _idle: int
+    _wakeups: int
+    _spawned: int
+    _shutdown: bool
+    _condition: threading.Condition
+    _space: threading.Condition
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        idle_timeout: Optional[float] = 60,
+        name: Optional[str] = None,
+        daemon: bool = True,
+        queue_size: Optional[int] = None,
+        overflow: OverflowMode = 'block',
+    ) -> None:
+        """
+        Initializes a thread pool
+
+        Parameters
+        ----------
+        :param max_workers: This should be the maximum number of worker threads alive at once
+        :param idle_timeout: This should be the number of seconds an idle worker waits for work before exiting, None to never shrink
+        :param name: This should be the prefix used to name worker threads
+        :param daemon: This should be a boolean indicating whether worker threads are daemonic
+        :param queue_size: This should be the maximum number of threads waiting for a busy worker, None for no limit
+        :param overflow: This should be what happens to a thread submitted to a full queue, `block` waits for space, `reject` raises `QueueFullError` and `caller_runs` runs it in the submitting thread
+
+        Raises
+        ------
+        ValueError: `max_workers` is 0 or negative
+        ValueError: `idle_timeout` is negative
+        ValueError: `queue_size` is negative
+        ValueError: `overflow` is not a valid overflow mode
+        """
+        if max_workers <= 0:
+            raise ValueError('`max_workers` must be greater than 0')
+        if idle_timeout is not None and idle_timeout < 0:
+            raise ValueError('`idle_timeout` cannot be negative')
+        if queue_size is not None and queue_size < 0:
+            raise ValueError('`queue_size` cannot be negative')
+        if overflow not in ('block', 'reject', 'caller_runs'):
+            raise ValueError(f'`overflow` cannot be {overflow!r}')
+
+        self.max_workers = max_workers
+        self.idle_timeout = idle_timeout
+        self.name = name or 'ThreadPool-%d' % id(self)
+        self.daemon = daemon
+        self.queue_size = queue_size
+        self.overflow = overflow
+
+        self.stats = PoolStats(Settings.STATS_ENABLED)
+
+        self._tasks = []
+        self._sequence = count()
+        self._workers = set()
+        self._idle = 0
+        self._wakeups = 0
+        self._spawned = 0
+        self._shutdown = False
+        lock = threading.Lock()
+        self._condition = threading.Condition(lock)
+        # Submitters blocked on a full queue
+        self._space = threading.Condition(lock)
+
+    def __enter__(self) -> 'ThreadPool':
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.shutdown()
+
+    @property
+    def size(self) -> int:
+        """The number of live worker threads"""
+        return len(self._workers)
+
+    @property
+    def pending(self) -> int:
+        """The number of queued threads waiting for a worker"""
+        return len(self._tasks)
+
+    def create(
+        self,
+        target: TargetFunction[_Target_P, _Target_T],
+        args: Sequence[Data_In] = (),
+        kwargs: Mapping[str, Data_In] = {},
+        ignore_errors: Sequence[type[Exception]] = (),
+        suppress_errors: bool = False,
+        name: Optional[str] = None,
+        *overflow_args: Overflow_In,
+        **overflow_kwargs: Overflow_In,
+    ) -> PooledThread[_Target_P, _Target_T]:
+        """
+        Creates a pooled thread without queueing it, invoke `start()` to queue it
+
+        Parameters
+        ----------
+        See `PooledThread.__init__`
+
+        Returns
+        -------
+        :returns PooledThread: The unstarted thread
+        """
+        return PooledThread(
+            self,
+            target,
+            args,
+            kwargs,
+            ignore_errors,
+            suppress_errors,
+            name,
+            *overflow_args,
+            **overflow_kwargs,
+        )
+
+    def submit(
+        self,
+        target: TargetFunction[_Target_P, _Target_T],
+        args: Sequence[Data_In] = (),
+        kwargs: Mapping[str, Data_In] = {},
+        ignore_errors: Sequence[type[Exception]] = (),
+        suppress_errors: bool = False,
+        name: Optional[str] = None,
+        *overflow_args: Overflow_In,
+        **overflow_kwargs: Overflow_In,
+    ) -> PooledThread[_Target_P, _Target_T]:
+        """
+        Creates a pooled thread and queues it
+
+        Parameters
+        ----------
+        See `PooledThread.__init__`
+
+        Returns
+        -------
+        :returns PooledThread: The queued thread
+
+        Raises
+        ------
+        RuntimeError: If the pool has been shutdown
+        QueueFullError: If the queue is full and `overflow` is `reject`
+        """
+        job = self.create(
+            target,
+            args,
+            kwargs,
+            ignore_errors,
+            suppress_errors,
+            name,
+            *overflow_args,
+            **overflow_kwargs,
+        )
+        job.start()
+        return job
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stops accepting work, workers exit once the queue is drained
+
+        Parameters
+        ----------
+        :param wait: If true, halts the current thread execution until all workers have exited
+        """
+        with self._condition:
+            self._shutdown = True
+            self._condition.notify_all()
+            self._space.notify_all()
+            workers = list(self._workers)
+
+        if wait:
+            for worker in workers:
+                if worker is not threading.current_thread():
+                    worker.join()
+
+    def _full(self) -> bool:
+        """Whether a new thread would have to wait beyond `queue_size`, the condition lock must be held"""
+        return (
+            self.queue_size is not None
+            and self._idle == 0
+            and len(self._workers) >= self.max_workers
+            and len(self._tasks) >= self.queue_size
+        )
+
+    def _enqueue(self, job: PooledThread) -> bool:
+        """
+        Queues a thread, waking an idle worker or growing the pool
+
+        Returns
+        -------
+        :returns bool: False if the queue is full and `overflow` is `caller_runs`, the caller must run the thread
+
+        Raises
+        ------
+        RuntimeError: If the pool has been shutdown
+        QueueFullError: If the queue is full and `overflow` is `reject`
+        """
+        with self._condition:
+            if self._full() and self.overflow == 'block':
+                self._space.wait_for(lambda: self._shutdown or not self._full())
+            if self._shutdown:
+                raise RuntimeError('cannot schedule new threads after shutdown')
+
+            # Marked before any worker can pick it up
+            job._submitted = True
+            if self._full():
+                if self.overflow == 'reject':
+                    job._submitted = False
+                    raise exceptions.QueueFullError()
+                return False
+
+            job._transition(ThreadState.QUEUED)
+            now = time.perf_counter()
+            heapq.heappush(
+                self._tasks,
+                (
+                    -job.priority,
+                    next(self._sequence),
+                    now,
+                    None if job.deadline is None else now + job.deadline,
+                    job,
+                ),
+            )
+            if self.stats.enabled:
+                self.stats._queue(len(self._tasks))
+            if self._idle > 0:
+                # Reserve an idle worker so concurrent submits do not share it
+                self._idle -= 1
+                self._wakeups += 1
+                self._condition.notify()
+            elif len(self._workers) < self.max_workers:
+                self._spawn()
+            return True
+
+    def _discard(self, job: PooledThread) -> bool:
+        """Removes a queued thread before any worker picks it up"""
+        with self._condition:
+            remaining = [entry for entry in self._tasks if entry[-1] is not job]
+            if len(remaining) == len(self._tasks):
+                return False
+
+            heapq.heapify(remaining)
+            self._tasks = remaining
+            if self.stats.enabled:
+                self.stats.depth = len(self._tasks)
+            return True
+
+    def _spawn(self) -> None:
+        """Starts a new worker, the condition lock must be held"""
+        self._spawned += 1
+        worker = threading.Thread(
+            target=self._work,
+            name='%s_%d' % (self.name, self._spawned),
+            daemon=self.daemon,
+        )
+        self._workers.add(worker)
+        worker.start()
+
+    def _rest(self) -> bool:
+        """
+        Waits as an idle worker until reserved by `_enqueue` or shutdown, the condition lock must be held
+
+        Returns
+        -------
+        :returns bool: False if it idled for `idle_timeout` seconds without being reserved
+        """
+        deadline = (
+            None if self.idle_timeout is None else time.monotonic() + self.idle_timeout
+        )
+        self._idle += 1
+        self._space.notify()
+        while True:
+            if self._wakeups > 0:
+                # `_enqueue` already took a worker off `_idle` for this wakeup
+                self._wakeups -= 1
+                return True
+            if self._shutdown:
+                self._idle -= 1
+                return True
+
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                self._idle -= 1
+                return False
+            self._condition.wait(remaining)
+
+    def _work(self) -> None:
+        """Worker loop, runs queued threads until idle for too long or shutdown"""
+        me = threading.current_thread()
+        while True:
+            with self._condition:
+                while not self._tasks:
+                    if self._shutdown or (not self._rest() and not self._tasks):
+                        self._workers.discard(me)
+                        return
+
+                _, _, queued, expires, job = heapq.heappop(self._tasks)
+                self._space.notify()
+
+                now = time.perf_counter()
+                expired = expires is not None and now > expires
+                if self.stats.enabled:
+                    self.stats._dequeue(len(self._tasks), now - queued, expired)
+
+            if expired:
+                job._drop(ThreadState.CANCELLED)
+            else:
+                job._execute()
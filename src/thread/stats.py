@@ -0,0 +1,311 @@
+"""
+## Execution Stats
+
+```py
+class ThreadStats: ...
+
+
+class WorkerStats: ...
+
+
+class ProcessingStats: ...
+
+
+class PoolStats: ...
+```
+"""
+
+import time
+
+from typing import Any, Dict, List, Optional, Union
+
+
+def _elapsed(start: Optional[float], end: Optional[float]) -> Optional[float]:
+    """Seconds between two timestamps, None if either has not been recorded"""
+    return None if start is None or end is None else end - start
+
+
+class ThreadStats:
+    """
+    Thread Stats
+    ------------
+
+    Timestamps of a thread's lifecycle, taken from `time.perf_counter()`,
+    and the CPU time its target spent in the thread from `time.thread_time()`.
+    Nothing is recorded if stats were disabled through `Settings` when the thread was created
+    """
+
+    __slots__ = (
+        'enabled',
+        'created',
+        'started',
+        'finished',
+        'hooks_done',
+        'cpu_time',
+        '_thread_time',
+    )
+
+    enabled: bool
+    created: Optional[float]
+    started: Optional[float]
+    finished: Optional[float]
+    hooks_done: Optional[float]
+    cpu_time: Optional[float]
+    _thread_time: float
+
+    def __init__(self, enabled: bool = True) -> None:
+        self.enabled = enabled
+        self.created = time.perf_counter() if enabled else None
+        self.started = None
+        self.finished = None
+        self.hooks_done = None
+        self.cpu_time = None
+        self._thread_time = 0
+
+    def __repr__(self) -> str:
+        return f'<ThreadStats run_time={self.run_time} cpu_time={self.cpu_time}>'
+
+    def _start(self) -> None:
+        """Records the target starting, must be called from the thread running it"""
+        self._thread_time = time.thread_time()
+        self.started = time.perf_counter()
+
+    def _finish(self) -> None:
+        """Records the target exiting, must be called from the thread running it"""
+        self.finished = time.perf_counter()
+        self.cpu_time = time.thread_time() - self._thread_time
+
+    def _finish_hooks(self) -> None:
+        """Records the hooks having been invoked"""
+        self.hooks_done = time.perf_counter()
+
+    @property
+    def queue_wait(self) -> Optional[float]:
+        """Seconds between creating and starting the target, including time queued on a pool"""
+        return _elapsed(self.created, self.started)
+
+    @property
+    def run_time(self) -> Optional[float]:
+        """Seconds the target ran for"""
+        return _elapsed(self.started, self.finished)
+
+    @property
+    def hook_time(self) -> Optional[float]:
+        """Seconds between the target exiting and the hooks being invoked"""
+        return _elapsed(self.finished, self.hooks_done)
+
+    def as_dict(self) -> Dict[str, Optional[float]]:
+        """The recorded stats as a dictionary"""
+        return {
+            'created': self.created,
+            'started': self.started,
+            'finished': self.finished,
+            'hooks_done': self.hooks_done,
+            'cpu_time': self.cpu_time,
+            'queue_wait': self.queue_wait,
+            'run_time': self.run_time,
+            'hook_time': self.hook_time,
+        }
+
+
+class WorkerStats:
+    """
+    Worker Stats
+    ------------
+
+    Stats of one chunk thread of a `ConcurrentProcessing` job, read live from the worker
+    """
+
+    __slots__ = ('_worker',)
+
+    _worker: Any
+
+    def __init__(self, worker: Any) -> None:
+        self._worker = worker
+
+    def __repr__(self) -> str:
+        return (
+            f'<WorkerStats items={self.items} items_per_second={self.items_per_second}>'
+        )
+
+    @property
+    def thread(self) -> ThreadStats:
+        """The stats of the chunk thread"""
+        return self._worker.thread.stats
+
+    @property
+    def items(self) -> int:
+        """Data entries processed so far"""
+        return self._worker.completed
+
+    @property
+    def queue_wait(self) -> Optional[float]:
+        """Seconds the chunk waited before it started"""
+        return self.thread.queue_wait
+
+    @property
+    def cpu_time(self) -> Optional[float]:
+        """CPU time spent in the chunk thread, time spent in worker processes is not included"""
+        return self.thread.cpu_time
+
+    @property
+    def items_per_second(self) -> Optional[float]:
+        """Throughput of the chunk, up to now if it is still running"""
+        stats = self.thread
+        if stats.started is None:
+            return None
+        elapsed = (stats.finished or time.perf_counter()) - stats.started
+        return self.items / elapsed if elapsed > 0 else None
+
+    def as_dict(self) -> Dict[str, Optional[Union[int, float]]]:
+        """The recorded stats as a dictionary"""
+        return {
+            **self.thread.as_dict(),
+            'items': self.items,
+            'items_per_second': self.items_per_second,
+        }
+
+
+class ProcessingStats:
+    """
+    Processing Stats
+    ----------------
+
+    Timestamps of a `ConcurrentProcessing` job, taken from `time.perf_counter()`,
+    and the stats of each of its chunk threads
+    """
+
+    __slots__ = ('enabled', 'created', 'started', 'finished', 'workers')
+
+    enabled: bool
+    created: Optional[float]
+    started: Optional[float]
+    finished: Optional[float]
+    workers: List[WorkerStats]
+
+    def __init__(self, enabled: bool = True) -> None:
+        self.enabled = enabled
+        self.created = time.perf_counter() if enabled else None
+        self.started = None
+        self.finished = None
+        self.workers = []
+
+    def __repr__(self) -> str:
+        return f'<ProcessingStats items={self.items} items_per_second={self.items_per_second}>'
+
+    @property
+    def run_time(self) -> Optional[float]:
+        """Seconds the job ran for"""
+        return _elapsed(self.started, self.finished)
+
+    @property
+    def cpu_time(self) -> Optional[float]:
+        """CPU time spent across the chunk threads"""
+        if not self.enabled:
+            return None
+        return sum(worker.cpu_time or 0 for worker in self.workers)
+
+    @property
+    def items(self) -> int:
+        """Data entries processed so far"""
+        return sum(worker.items for worker in self.workers)
+
+    @property
+    def items_per_second(self) -> Optional[float]:
+        """Throughput of the job, up to now if it is still running"""
+        if self.started is None:
+            return None
+        elapsed = (self.finished or time.perf_counter()) - self.started
+        return self.items / elapsed if elapsed > 0 else None
+
+    def as_dict(self) -> Dict[str, Any]:
+        """The recorded stats as a dictionary"""
+        return {
+            'created': self.created,
+            'started': self.started,
+            'finished': self.finished,
+            'run_time': self.run_time,
+            'cpu_time': self.cpu_time,
+            'items': self.items,
+            'items_per_second': self.items_per_second,
+            'workers': [worker.as_dict() for worker in self.workers],
+        }
+
+
+class PoolStats:
+    """
+    Pool Stats
+    ----------
+
+    Queue depth and wait times of a `ThreadPool`, recorded under the pool lock.
+    Wait times are taken from `time.perf_counter()`, between a thread being queued and a worker picking it up
+    """
+
+    __slots__ = (
+        'enabled',
+        'submitted',
+        'started',
+        'expired',
+        'depth',
+        'peak_depth',
+        'total_wait',
+        'max_wait',
+    )
+
+    enabled: bool
+    submitted: int
+    started: int
+    expired: int
+    depth: int
+    peak_depth: int
+    total_wait: float
+    max_wait: float
+
+    def __init__(self, enabled: bool = True) -> None:
+        self.enabled = enabled
+        self.submitted = 0
+        self.started = 0
+        self.expired = 0
+        self.depth = 0
+        self.peak_depth = 0
+        self.total_wait = 0
+        self.max_wait = 0
+
+    def __repr__(self) -> str:
+        return f'<PoolStats depth={self.depth} mean_wait={self.mean_wait}>'
+
+    def _queue(self, depth: int) -> None:
+        """Records a thread being queued, with the depth after it was"""
+        self.submitted += 1
+        self.depth = depth
+        if depth > self.peak_depth:
+            self.peak_depth = depth
+
+    def _dequeue(self, depth: int, wait: float, expired: bool) -> None:
+        """Records a worker picking up a thread, with the depth after it did"""
+        self.depth = depth
+        if expired:
+            self.expired += 1
+            return
+        self.started += 1
+        self.total_wait += wait
+        if wait > self.max_wait:
+            self.max_wait = wait
+
+    @property
+    def mean_wait(self) -> Optional[float]:
+        """Mean seconds a started thread waited in the queue"""
+        return self.total_wait / self.started if self.started else None
+
+    def as_dict(self) -> Dict[str, Optional[Union[int, float]]]:
+        """The recorded stats as a dictionary"""
+        return {
+            'submitted': self.submitted,
+            'started': self.started,
+            'expired': self.expired,
+            'depth': self.depth,
+            'peak_depth': self.peak_depth,
+            'total_wait': self.total_wait,
+            'max_wait': self.max_wait,
+            'mean_wait': self.mean_wait,
+        }
@@ -11,17 +11,33 @@ class ConcurrentProcessing: ...
 
 import sys
 import time
+import queue
 import ctypes
 import signal
 import threading
+from array import array, typecodes
+from itertools import islice
 from functools import wraps
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 
-from . import exceptions
-from .utils.config import Settings
-from .utils.algorithm import chunk_split
+from . import exceptions, _process
+from .cancellation import CancellationToken, accepts_token
+from .cache import ResultCache
+from .stats import ThreadStats, WorkerStats, ProcessingStats
+from .observers import Observer, Observers
+from ._registry import ThreadRegistry
+from .utils.config import Settings, EscalationPolicy
+from .utils.algorithm import chunk_split, batch_split, guided_split
 
 from ._types import (
     ThreadStatus,
+    ThreadState,
+    THREAD_STATUSES,
+    TERMINAL_STATES,
+    ScheduleMode,
+    ExecutorMode,
+    WaitMode,
+    HookMode,
     Data_In,
     Data_Out,
     Overflow_In,
@@ -48,12 +64,27 @@ from typing import (
     Sequence,
     Tuple,
     Callable,
+    Iterable,
+    Iterator,
     Generator,
+    AsyncGenerator,
+    Sized,
     overload,
+    TYPE_CHECKING,
 )
 
+if TYPE_CHECKING:
+    from .pool import ThreadPool
 
-Threads: set['Thread'] = set()
+
+Threads = ThreadRegistry()
+
+# Shared by threads with `hook_mode='async'`, a thread submits all its hooks as one task to keep their order
+_hook_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='HookWorker')
+
+# States `Thread.result` checks against
+_NOT_RUNNING_STATES = frozenset({ThreadState.IDLE, ThreadState.KILLED})
+_RESULT_STATES = frozenset({ThreadState.INVOKING_HOOKS, ThreadState.COMPLETED})
 
 
 class Thread(threading.Thread, Generic[_Target_P, _Target_T]):
@@ -64,14 +95,53 @@ class Thread(threading.Thread, Generic[_Target_P, _Target_T]):
     Type-Safe and provides more functionality on top
     """
 
-    status: ThreadStatus
-    hooks: List[HookFunction]
+    __slots__ = (
+        '_state',
+        '_visited',
+        '_lock',
+        '_condition',
+        '_returned_value',
+        '_hooks',
+        '_hook_timings',
+        '_hooks_finished',
+        '_errors',
+        '_observers',
+        '_launched',
+        '_attached',
+        '_token',
+        '_future',
+        '_settled',
+        'hook_mode',
+        'ignore_errors',
+        'suppress_errors',
+        'stats',
+    )
+
+    _state: ThreadState
+    _visited: int
+    _lock: threading.Lock
     _returned_value: Data_Out
+    hook_mode: HookMode
+    stats: ThreadStats
 
-    errors: List[Exception]
     ignore_errors: Sequence[type[Exception]]
     suppress_errors: bool
 
+    # Allocated on first use
+    _hooks: Optional[List[HookFunction]]
+    _hook_timings: Optional[List[Tuple[str, float]]]
+    _hooks_finished: bool
+    _condition: Optional[threading.Condition]
+    _errors: Optional[List[Exception]]
+    _observers: Optional[List[Observer]]
+
+    # Whether `start` was called, and whether the thread is counted by `Observers.active`
+    _launched: bool
+    _attached: bool
+    _token: Optional[CancellationToken]
+    _future: 'Optional[Future[_Target_T]]'
+    _settled: bool
+
     # threading.Thread stuff
     _initialized: bool
 
@@ -86,6 +156,8 @@ class Thread(threading.Thread, Generic[_Target_P, _Target_T]):
         daemon: bool = False,
         group=None,
         *overflow_args: Overflow_In,
+        cancellation_token: Optional[CancellationToken] = None,
+        hook_mode: HookMode = 'inline',
         **overflow_kwargs: Overflow_In,
     ) -> None:
         """
@@ -102,20 +174,49 @@ class Thread(threading.Thread, Generic[_Target_P, _Target_T]):
         :param daemon: This is an argument parsed to `threading.Thread`
         :param group: This does nothing right now, but should be left as None
         :param *: These are arguments parsed to `threading.Thread`
+        :param cancellation_token: This should be a `CancellationToken` to share, a new one is created when first needed if None. It is parsed to `target` if it declares a `cancellation_token` parameter
+        :param hook_mode: This should be `inline` to invoke hooks in the thread before it completes, or `async` to hand them to a shared hook executor once the thread completes. Errors of async hooks are raised by `wait_hooks` only
         :param **: These are arguments parsed to `thread.Thread`
+
+        Raises
+        ------
+        ValueError: If the hook mode is not valid
         """
-        _target = self._wrap_target(target)
-        self._returned_value = None
-        self.status = 'Idle'
-        self.hooks = []
+        if hook_mode not in ('inline', 'async'):
+            raise ValueError(f'`hook_mode` cannot be {hook_mode!r}')
 
-        self.errors = []
+        self._lock = threading.Lock()
+        self._condition = None
+        self._state = ThreadState.IDLE
+        self._visited = 1 << ThreadState.IDLE
+        self._returned_value = None
+        self.hook_mode = hook_mode
+        self.stats = ThreadStats(Settings.STATS_ENABLED)
         self.ignore_errors = ignore_errors
         self.suppress_errors = suppress_errors
 
+        self._hooks = None
+        self._hook_timings = None
+        self._hooks_finished = False
+        self._errors = None
+        self._observers = None
+        self._launched = False
+        self._attached = False
+        self._future = None
+        self._settled = False
+
+        # Adopt a token parsed straight to the target, e.g. through `@threaded`
+        given = kwargs.get('cancellation_token')
+        if cancellation_token is None and isinstance(given, CancellationToken):
+            cancellation_token = given
+
+        self._token = cancellation_token
+        if 'cancellation_token' not in kwargs and accepts_token(target):
+            kwargs = {**kwargs, 'cancellation_token': self.cancellation_token}
+
         super().__init__(
             group,
-            _target,
+            target,
             name,
             args,
             kwargs,
@@ -124,61 +225,336 @@ class Thread(threading.Thread, Generic[_Target_P, _Target_T]):
             **overflow_kwargs,
         )
 
-    def _wrap_target(
-        self, target: TargetFunction[_Target_P, _Target_T]
-    ) -> TargetFunction[_Target_P, Union[_Target_T, None]]:
-        """Wraps the target function"""
+    @property
+    def status(self) -> ThreadStatus:
+        """The current status of the thread"""
+        return THREAD_STATUSES[self._state]
 
-        @wraps(target)
-        def wrapper(
-            *args: _Target_P.args, **kwargs: _Target_P.kwargs
-        ) -> Union[_Target_T, None]:
+    @status.setter
+    def status(self, status: Union[ThreadStatus, ThreadState]) -> None:
+        """
+        Raises
+        ------
+        InvalidStateTransitionError: If the status cannot be reached from the current status
+        """
+        state = ThreadState.of(status)
+        if not self._transition(state):
+            raise exceptions.InvalidStateTransitionError(
+                f'Thread cannot go from {self.status!r} to {state.status!r}'
+            )
+
+    @property
+    def state(self) -> ThreadState:
+        """The current status of the thread as an integer enum"""
+        return self._state
+
+    def _transition(self, state: ThreadState) -> bool:
+        """Moves the thread to `state`, returns False if it cannot be reached from the current state"""
+        with self._lock:
+            return self._move(state)
+
+    def _move(self, state: ThreadState) -> bool:
+        """`_transition` with the lock already held"""
+        if not self._state.can_become(state):
+            return False
+        Threads.set_status(self, state)
+        self._visited |= 1 << state
+        if self._condition is not None:
+            self._condition.notify_all()
+        return True
+
+    def _wait_until(
+        self, predicate: Callable[[], Any], timeout: Optional[float] = None
+    ) -> bool:
+        """Waits for a predicate over the lock-guarded state to hold, returns whether it did"""
+        with self._lock:
+            if predicate():
+                return True
+            if self._condition is None:
+                self._condition = threading.Condition(self._lock)
+            return bool(self._condition.wait_for(predicate, timeout))
+
+    def wait_for(
+        self,
+        status: Union[
+            ThreadStatus, ThreadState, Iterable[Union[ThreadStatus, ThreadState]]
+        ],
+        timeout: Optional[float] = None,
+    ) -> bool:
+        """
+        Halts the current thread execution until the thread reaches a status or the timeout is exceeded\n
+        A status counts as reached once the thread has entered it, even if it has since moved on
+
+        Parameters
+        ----------
+        :param status: This should be a status, or an iterable of statuses to wait for any of
+        :param timeout: The maximum time allowed to halt the thread
+
+        Returns
+        -------
+        :returns: True if the status was reached, False if the timeout was exceeded
+        """
+        statuses = [status] if isinstance(status, (str, ThreadState)) else status
+        mask = 0
+        for each in statuses:
+            mask |= 1 << ThreadState.of(each)
+        return self._wait_until(lambda: self._visited & mask, timeout)
+
+    @property
+    def hooks(self) -> List[HookFunction]:
+        """The hooks invoked with the return value"""
+        if self._hooks is None:
+            self._hooks = []
+        return self._hooks
+
+    @property
+    def hook_timings(self) -> List[Tuple[str, float]]:
+        """The name and duration in seconds of every invoked hook, in order"""
+        if self._hook_timings is None:
+            self._hook_timings = []
+        return self._hook_timings
+
+    @property
+    def errors(self) -> List[Exception]:
+        """The errors raised by the target and hooks"""
+        if self._errors is None:
+            self._errors = []
+        return self._errors
+
+    @property
+    def observers(self) -> List[Observer]:
+        """The observers of this thread only"""
+        if self._observers is None:
+            self._observers = []
+        return self._observers
+
+    @property
+    def cancellation_token(self) -> CancellationToken:
+        """The token `cancel()` cancels"""
+        token = self._token
+        if token is None:
+            with self._lock:
+                if self._token is None:
+                    self._token = CancellationToken()
+                token = self._token
+        return token
+
+    @property
+    def future(self) -> 'Future[_Target_T]':
+        """
+        A `concurrent.futures.Future` resolved once the thread exits\n
+        Usable with `concurrent.futures.wait`, `as_completed` and `asyncio.wrap_future`
+
+        It resolves with the return value, or with what `result` would raise:
+        the first error unless suppressed, `CancelledError` or `ThreadNotRunningError` if killed.
+        Cancelling it before the thread starts prevents `target` from running
+        """
+        future = self._future
+        if future is not None:
+            return future
+
+        with self._lock:
+            if self._future is None:
+                future = Future()
+                if self._settled:
+                    self._settle(future)
+                elif self._state not in (ThreadState.IDLE, ThreadState.QUEUED):
+                    # Already running, it can no longer be cancelled
+                    future.set_running_or_notify_cancel()
+                self._future = future
+            return self._future
+
+    def __await__(self) -> Generator[Any, None, _Target_T]:
+        """
+        Awaits the started thread without blocking the event loop, resolving as `future` does\n
+        Cancelling the awaiting task cancels the thread's cancellation token
+        """
+        return _await_future(self.future, self.cancel).__await__()
+
+    def _resolve_future(self) -> None:
+        """Settles the future from the final status, or marks it to be settled once created"""
+        with self._lock:
+            self._settled = True
+            future = self._future
+        if future is not None:
+            self._settle(future)
+
+    def _settle(self, future: 'Future[_Target_T]') -> None:
+        """Resolves the future with the outcome of the thread"""
+        if future.done():
+            return
+
+        state = self._state
+        if state is ThreadState.KILLED:
+            future.set_exception(exceptions.ThreadNotRunningError())
+        elif state is ThreadState.CANCELLED:
+            future.set_exception(exceptions.CancelledError())
+        elif self._errors and not self.suppress_errors:
+            future.set_exception(self._errors[0])
+        else:
+            future.set_result(self._returned_value)
+
+    def _start_future(self) -> bool:
+        """Marks the future as running, returns False if it was cancelled before starting"""
+        with self._lock:
+            future = self._future
+            if future is not None and not future.set_running_or_notify_cancel():
+                self._move(ThreadState.CANCELLED)
+                return False
+            self._move(ThreadState.RUNNING)
+        return True
+
+    def run(self) -> None:
+        """Runs the target, recording its return value, errors and status"""
+        stats = self.stats if self.stats.enabled else None
+        dispatched = False
+        try:
+            if not self._start_future():
+                return
+            Threads.add(self)
+
+            if stats is not None:
+                stats._start()
+            if Observers.active:
+                self._emit('on_start')
             try:
-                self.status = 'Running'
-
-                global Threads
-                Threads.add(self)
-
-                try:
-                    self._returned_value = target(*args, **kwargs)
-                except Exception as e:
-                    if not any(isinstance(e, ignore) for ignore in self.ignore_errors):
-                        self.status = 'Errored'
-                        self.errors.append(e)
-                        return
-
-                self.status = 'Invoking hooks'
-                self._invoke_hooks()
-                Threads.remove(self)
-                self.status = 'Completed'
-
-            except SystemExit:
-                self.status = 'Killed'
-                if Settings.VERBOSITY > 'quiet':
-                    print('KILLED ident: %s' % self.ident)
+                self._returned_value = self._target(*self._args, **self._kwargs)
+            except exceptions.CancelledError:
+                self._transition(ThreadState.CANCELLED)
+                return
+            except Exception as e:
+                if not any(isinstance(e, ignore) for ignore in self.ignore_errors):
+                    self._transition(ThreadState.ERRORED)
+                    self.errors.append(e)
+                    if Observers.active:
+                        self._emit('on_error', e)
+                    return
+            finally:
+                if stats is not None:
+                    stats._finish()
+
+            if self.hook_mode == 'async' and self._hooks:
+                dispatched = True
+                self._transition(ThreadState.COMPLETED)
+                # Settled first so hook errors cannot race the return value
+                self._resolve_future()
+                _hook_executor.submit(self._invoke_hooks_async)
                 return
 
-        return wrapper
+            self._transition(ThreadState.INVOKING_HOOKS)
+            self._invoke_hooks()
+            self._transition(ThreadState.COMPLETED)
+
+        except SystemExit:
+            # Landing after the thread settled keeps its final status
+            if not self._transition(ThreadState.KILLED):
+                return
+            if Observers.active:
+                self._emit('on_kill')
+            if Settings.VERBOSITY > 'quiet':
+                print('KILLED ident: %s' % self.ident)
+            return
+
+        finally:
+            # Break reference cycles like `threading.Thread.run`
+            del self._target, self._args, self._kwargs
+            Threads.discard(self)
+            self._resolve_future()
+            if not dispatched:
+                self._finish_hooks()
 
     def _invoke_hooks(self) -> None:
-        """Invokes hooks in the thread"""
+        """Invokes hooks in order, timing each of them"""
         errors: List[Tuple[Exception, str]] = []
-        for hook in self.hooks:
+        for hook in self._hooks or ():
+            start = time.perf_counter()
             try:
                 hook(self._returned_value)
             except Exception as e:
                 if not any(isinstance(e, ignore) for ignore in self.ignore_errors):
                     errors.append((e, hook.__name__))
+            finally:
+                self.hook_timings.append((hook.__name__, time.perf_counter() - start))
 
         if len(errors) > 0:
-            self.errors.append(exceptions.HookRuntimeError(None, errors))
+            error = exceptions.HookRuntimeError(None, errors)
+            self.errors.append(error)
+            if Observers.active:
+                self._emit('on_hook_error', error)
+
+    def _invoke_hooks_async(self) -> None:
+        """Invokes hooks on the hook executor, then finishes the thread's lifecycle"""
+        try:
+            self._invoke_hooks()
+        finally:
+            self._finish_hooks()
+
+    def _finish_hooks(self) -> None:
+        """Marks the hooks as invoked, the last step of a thread's lifecycle"""
+        if self.stats.enabled:
+            self.stats._finish_hooks()
+        with self._lock:
+            self._hooks_finished = True
+            attached, self._attached = self._attached, False
+            if self._condition is not None:
+                self._condition.notify_all()
+
+        if Observers.active:
+            self._emit('on_finish')
+        if attached:
+            Observers._detach()
+
+    def _emit(self, event: str, *args: Any) -> None:
+        """Invokes an event on the global and the thread's observers"""
+        Observers.emit(self._observers or (), event, self, *args)
+
+    def add_observer(self, observer: Observer) -> None:
+        """
+        Adds an observer receiving this thread's lifecycle events
+        ---------------------------------------------------------
+        Should be added before the thread is started to receive every event
+
+        Parameters
+        ----------
+        :param observer: This should be an `Observer`
+        """
+        with self._lock:
+            self.observers.append(observer)
+            self._hold_observers()
+
+    def _hold_observers(self) -> None:
+        """Counts the thread in `Observers.active` while it is started, unfinished and observed, the lock must be held"""
+        if (
+            self._observers
+            and self._launched
+            and not self._attached
+            and not self._hooks_finished
+        ):
+            self._attached = True
+            Observers._attach()
+
+    def _launch(self) -> None:
+        """Marks the thread as started, before it is handed to a thread or pool"""
+        with self._lock:
+            self._launched = True
+            self._hold_observers()
+
+    def _abort_launch(self) -> None:
+        """Reverts `_launch` for a thread which could not be started"""
+        with self._lock:
+            self._launched = False
+            attached, self._attached = self._attached, False
+        if attached:
+            Observers._detach()
 
     def _handle_exceptions(self) -> None:
-        """Raises exceptions if not suppressed in the main thread"""
+        """Raises exceptions if not suppressed in the main thread, errors of asynchronous hooks are left to `wait_hooks`"""
         if self.suppress_errors:
             return
 
-        for e in self.errors:
+        for e in self._errors or ():
+            if self.hook_mode == 'async' and isinstance(e, exceptions.HookRuntimeError):
+                continue
             raise e
 
     @property
@@ -194,11 +570,14 @@ class Thread(threading.Thread, Generic[_Target_P, _Target_T]):
         """
         if not self._initialized:
             raise exceptions.ThreadNotInitializedError()
-        if self.status in ['Idle', 'Killed']:
+        state = self._state
+        if state in _NOT_RUNNING_STATES:
             raise exceptions.ThreadNotRunningError()
+        if state is ThreadState.CANCELLED:
+            raise exceptions.CancelledError()
 
         self._handle_exceptions()
-        if self.status in ['Invoking hooks', 'Completed']:
+        if state in _RESULT_STATES:
             return self._returned_value
         else:
             raise exceptions.ThreadStillRunningError()
@@ -228,6 +607,33 @@ class Thread(threading.Thread, Generic[_Target_P, _Target_T]):
         """
         self.hooks.append(hook)
 
+    def wait_hooks(self, timeout: Optional[float] = None) -> bool:
+        """
+        Halts the current thread execution until the hooks have been invoked or the timeout is exceeded\n
+        With `hook_mode='async'` hooks may still be running after the thread has completed,
+        their errors are raised here and never by `join`, `result` or `future`
+
+        Parameters
+        ----------
+        :param timeout: The maximum time allowed to halt the thread
+
+        Returns
+        -------
+        :returns: True if the hooks have finished, False if the timeout was exceeded
+
+        Raises
+        ------
+        HookRuntimeError: If `hook_mode` is `async`, the hooks have finished and any of them raised, unless errors are suppressed
+        """
+        if not self._wait_until(lambda: self._hooks_finished, timeout):
+            return False
+
+        if self.hook_mode == 'async' and not self.suppress_errors:
+            for e in self._errors or ():
+                if isinstance(e, exceptions.HookRuntimeError):
+                    raise e
+        return True
+
     def join(self, timeout: Optional[float] = None) -> None:
         """
         Halts the current thread execution until a thread completes or exceeds the timeout
@@ -239,17 +645,23 @@ class Thread(threading.Thread, Generic[_Target_P, _Target_T]):
         Raises
         ------
         ThreadNotInitializedError: If the thread is not initialized
-        ThreadNotRunningError: If the thread is not running
+        ThreadNotRunningError: If the thread was never started
         """
         if not self._initialized:
             raise exceptions.ThreadNotInitializedError()
 
-        if self.status == ['Idle', 'Killed']:
+        # A started thread stays `Idle` until `run` begins, killed threads can still be joined
+        if self.ident is None:
             raise exceptions.ThreadNotRunningError()
 
         super().join(timeout)
         self._handle_exceptions()
 
+    def _wait(self, timeout: Optional[float] = None) -> bool:
+        """Waits for the thread to exit without raising its errors, returns whether it exited"""
+        threading.Thread.join(self, timeout)
+        return not threading.Thread.is_alive(self)
+
     def get_return_value(self) -> _Target_T:
         """
         Halts the current thread execution until the thread completes
@@ -261,6 +673,15 @@ class Thread(threading.Thread, Generic[_Target_P, _Target_T]):
         self.join()
         return self.result
 
+    def cancel(self) -> None:
+        """
+        Requests the thread to stop through its cancellation token
+        ----------------------------------------------------------
+        The target is expected to check `cancellation_token` and stop by
+        returning or by raising `CancelledError` with `raise_if_cancelled()`
+        """
+        self.cancellation_token.cancel()
+
     def kill(self, yielding: bool = False, timeout: float = 5) -> bool:
         """
         Schedules a thread to be killed
@@ -280,10 +701,29 @@ class Thread(threading.Thread, Generic[_Target_P, _Target_T]):
         ThreadNotInitializedError: If the thread is not initialized
         ThreadNotRunningError: If the thread is not running
         """
+        self._schedule_kill()
+        if not yielding:
+            return True
+
+        deadline = time.monotonic() + timeout
+        if not self.wait_for(TERMINAL_STATES, timeout):
+            return False
+        return self._wait(_remaining(deadline))
+
+    def _schedule_kill(self) -> None:
+        """
+        Raises `SystemExit` asynchronously in the thread
+
+        Raises
+        ------
+        ValueError: If the thread ident does not exist
+        ThreadNotInitializedError: If the thread is not initialized
+        ThreadNotRunningError: If the thread is not running or has already settled
+        """
         if not self.is_alive():
             raise exceptions.ThreadNotRunningError()
-
-        self.status = 'Kill Scheduled'
+        if not self._transition(ThreadState.KILL_SCHEDULED):
+            raise exceptions.ThreadNotRunningError()
 
         res: Optional[int] = self.ident and ctypes.pythonapi.PyThreadState_SetAsyncExc(
             ctypes.c_long(self.ident), ctypes.py_object(SystemExit)
@@ -299,17 +739,6 @@ class Thread(threading.Thread, Generic[_Target_P, _Target_T]):
                 f'Killing thread with ident [{self.ident}] failed!\nPyThreadState_SetAsyncExc returned: {res}'
             )
 
-        if not yielding:
-            return True
-
-        start = time.perf_counter()
-        while self.status != 'Killed':
-            time.sleep(0.01)
-            if (time.perf_counter() - start) >= timeout:
-                return False
-
-        return True
-
     def start(self) -> None:
         """
         Starts the thread
@@ -322,16 +751,116 @@ class Thread(threading.Thread, Generic[_Target_P, _Target_T]):
         if self.is_alive():
             raise exceptions.ThreadStillRunningError()
 
-        super().start()
+        self._launch()
+        try:
+            super().start()
+        except BaseException:
+            self._abort_launch()
+            raise
+
+
+def kill_all(threads: Iterable[Thread], timeout: float = 5) -> List[Thread]:
+    """
+    Schedules every thread to be killed, then waits for them to exit with a shared deadline
+
+    Parameters
+    ----------
+    :param threads: This should be an iterable of threads to kill, threads which are not running are skipped
+    :param timeout: The maximum number of seconds to wait for all of the threads to exit
+
+    Returns
+    -------
+    :returns list[Thread]: The threads which did not exit before the timeout
+    """
+    scheduled: List[Thread] = []
+    for thread in threads:
+        try:
+            thread._schedule_kill()
+        except (
+            exceptions.ThreadNotRunningError,
+            exceptions.ThreadNotInitializedError,
+        ):
+            continue
+        except Exception:
+            if Settings.VERBOSITY > 'quiet':
+                print('Failed to kill ident: %s' % thread.ident)
+        scheduled.append(thread)
+
+    deadline = time.monotonic() + timeout
+    return [thread for thread in scheduled if not thread._wait(_remaining(deadline))]
+
+
+def _slice(dataset: Any, chunkStart: int, chunkEnd: int) -> Any:
+    """Default `_get_slice` for datasets which support slicing"""
+    return dataset[chunkStart:chunkEnd]
+
+
+def _supports_slicing(dataset: Any) -> bool:
+    """Whether `dataset[a:b]` returns the entries in between, e.g. lists and NumPy arrays"""
+    try:
+        return len(dataset[0:1]) == 1
+    except Exception:
+        return False
+
+
+# Workers flush their progress counter every 64 entries
+_PROGRESS_MASK = 0x3F
+
+
+async def _await_future(future: 'Future[Any]', cancel: Callable[[], None]) -> Any:
+    """Awaits a future resolved by another thread, the loop is woken with `call_soon_threadsafe`"""
+    import asyncio
+
+    try:
+        return await asyncio.wrap_future(future)
+    except asyncio.CancelledError:
+        cancel()
+        raise
+
+
+def _remaining(deadline: Optional[float]) -> Optional[float]:
+    """Seconds left until a `time.monotonic()` deadline, None if there is none"""
+    return None if deadline is None else max(0, deadline - time.monotonic())
 
 
 class _ThreadWorker:
-    progress: float
+    __slots__ = ('thread', 'completed', 'claimed', 'failed', 'cancelled')
+
     thread: Thread
+    completed: int
+    claimed: int
+    failed: bool
+    cancelled: bool
 
-    def __init__(self, thread: Thread, progress: float = 0) -> None:
+    def __init__(self, thread: Thread) -> None:
         self.thread = thread
-        self.progress = progress
+        self.completed = 0
+        self.claimed = 0
+        self.failed = False
+        self.cancelled = False
+
+    @property
+    def progress(self) -> float:
+        """Fraction of the claimed entries this worker has processed"""
+        return round(self.completed / self.claimed, 5) if self.claimed else 0
+
+
+class _BatchCursor:
+    """Thread-safe iterator handing out `(start, end)` batches to whichever thread asks first"""
+
+    _batches: Iterator[Tuple[int, int]]
+    _lock: threading.Lock
+
+    def __init__(self, batches: Iterator[Tuple[int, int]]) -> None:
+        self._batches = batches
+        self._lock = threading.Lock()
+
+    def __iter__(self) -> '_BatchCursor':
+        return self
+
+    def __next__(self) -> Tuple[int, int]:
+        with self._lock:
+            return next(self._batches)
 
 
 class ConcurrentProcessing(Generic[_Target_P, _Target_T, _Dataset_T]):
@@ -342,10 +871,30 @@ class ConcurrentProcessing(Generic[_Target_P, _Target_T, _Dataset_T]):
     Type-Safe and provides more functionality on top
     """
 
-    _length: int
-    _retrieve_value: Callable[[Any, int], _Dataset_T]
+    _length: Optional[int]
+    _retrieve_value: Optional[Callable[[Any, int], _Dataset_T]]
+    _retrieve_slice: Optional[Callable[[Any, int, int], Iterable[_Dataset_T]]]
     _threads: List[_ThreadWorker]
     _completed: int
+    _finished: List[_ThreadWorker]
+    _function: TargetFunction
+    _executor: Optional[ProcessPoolExecutor]
+    _active_workers: int
+    _condition: threading.Condition
+    _segments: List[Tuple[int, int]]
+    _output: Union[List[_Target_T], 'array[Any]']
+    _queue: Optional['queue.Queue[Optional[Tuple[int, List[_Dataset_T]]]]']
+    _feeder: Optional[Thread]
+    _stream_closed: bool
+    _future: 'Future[List[_Target_T]]'
+    _unresolved: int
+    _listeners: List[Callable[[], None]]
+    _launched: bool
+    _attached: bool
+    _killed: bool
+    _partial: bool
+    stats: ProcessingStats
+    observers: List[Observer]
 
     status: ThreadStatus
     function: TargetFunction
@@ -356,6 +905,15 @@ class ConcurrentProcessing(Generic[_Target_P, _Target_T, _Dataset_T]):
         Any,
     ]
     max_threads: int
+    pool: Optional['ThreadPool']
+    schedule: ScheduleMode
+    chunk_size: Optional[int]
+    executor: ExecutorMode
+    queue_size: Optional[int]
+    output_dtype: Optional[str]
+    batched: bool
+    cancellation_token: CancellationToken
+    cache: Optional[ResultCache]
 
     overflow_args: Sequence[Overflow_In]
     overflow_kwargs: Mapping[str, Overflow_In]
@@ -370,6 +928,15 @@ class ConcurrentProcessing(Generic[_Target_P, _Target_T, _Dataset_T]):
         *overflow_args: Overflow_In,
         _get_value: Optional[Callable[[LengthandGetLike_T, int], _Dataset_T]] = None,
         _length: Optional[Union[int, Callable[[Any], int]]] = None,
+        _get_slice: Optional[Callable[[Any, int, int], Iterable[_Dataset_T]]] = None,
+        pool: Optional['ThreadPool'] = None,
+        schedule: ScheduleMode = 'static',
+        chunk_size: Optional[int] = None,
+        executor: ExecutorMode = 'thread',
+        output_dtype: Optional[str] = None,
+        batched: bool = False,
+        cancellation_token: Optional[CancellationToken] = None,
+        cache: Optional[Union[bool, ResultCache]] = None,
         **overflow_kwargs: Overflow_In,
     ) -> None: ...
 
@@ -383,6 +950,15 @@ class ConcurrentProcessing(Generic[_Target_P, _Target_T, _Dataset_T]):
         *overflow_args: Overflow_In,
         _get_value: Callable[[LengthLike_T, int], _Dataset_T],
         _length: Optional[Union[int, Callable[[Any], int]]] = None,
+        _get_slice: Optional[Callable[[Any, int, int], Iterable[_Dataset_T]]] = None,
+        pool: Optional['ThreadPool'] = None,
+        schedule: ScheduleMode = 'static',
+        chunk_size: Optional[int] = None,
+        executor: ExecutorMode = 'thread',
+        output_dtype: Optional[str] = None,
+        batched: bool = False,
+        cancellation_token: Optional[CancellationToken] = None,
+        cache: Optional[Union[bool, ResultCache]] = None,
         **overflow_kwargs: Overflow_In,
     ) -> None: ...
 
@@ -396,6 +972,15 @@ class ConcurrentProcessing(Generic[_Target_P, _Target_T, _Dataset_T]):
         *overflow_args: Overflow_In,
         _get_value: Optional[Callable[[GetLike_T, int], _Dataset_T]] = None,
         _length: Union[int, Callable[[GetLike_T], int]],
+        _get_slice: Optional[Callable[[Any, int, int], Iterable[_Dataset_T]]] = None,
+        pool: Optional['ThreadPool'] = None,
+        schedule: ScheduleMode = 'static',
+        chunk_size: Optional[int] = None,
+        executor: ExecutorMode = 'thread',
+        output_dtype: Optional[str] = None,
+        batched: bool = False,
+        cancellation_token: Optional[CancellationToken] = None,
+        cache: Optional[Union[bool, ResultCache]] = None,
         **overflow_kwargs: Overflow_In,
     ) -> None: ...
 
@@ -409,6 +994,33 @@ class ConcurrentProcessing(Generic[_Target_P, _Target_T, _Dataset_T]):
         *overflow_args: Overflow_In,
         _get_value: Callable[[Any, int], _Dataset_T],
         _length: Union[int, Callable[[Any], int]],
+        _get_slice: Optional[Callable[[Any, int, int], Iterable[_Dataset_T]]] = None,
+        pool: Optional['ThreadPool'] = None,
+        schedule: ScheduleMode = 'static',
+        chunk_size: Optional[int] = None,
+        executor: ExecutorMode = 'thread',
+        output_dtype: Optional[str] = None,
+        batched: bool = False,
+        cancellation_token: Optional[CancellationToken] = None,
+        cache: Optional[Union[bool, ResultCache]] = None,
+        **overflow_kwargs: Overflow_In,
+    ) -> None: ...
+
+    # Only supports __iter__, streamed through a bounded queue
+    @overload
+    def __init__(
+        self,
+        function: DatasetFunction[_Dataset_T, _Target_P, _Target_T],
+        dataset: Iterable[_Dataset_T],
+        max_threads: int = 8,
+        *overflow_args: Overflow_In,
+        pool: Optional['ThreadPool'] = None,
+        chunk_size: Optional[int] = None,
+        queue_size: Optional[int] = None,
+        output_dtype: Optional[str] = None,
+        batched: bool = False,
+        cancellation_token: Optional[CancellationToken] = None,
+        cache: Optional[Union[bool, ResultCache]] = None,
         **overflow_kwargs: Overflow_In,
     ) -> None: ...
 
@@ -432,27 +1044,55 @@ class ConcurrentProcessing(Generic[_Target_P, _Target_T, _Dataset_T]):
             ]
         ] = None,
         _length: Optional[Union[int, Callable[[Any], int]]] = None,
+        _get_slice: Optional[Callable[[Any, int, int], Iterable[_Dataset_T]]] = None,
+        pool: Optional['ThreadPool'] = None,
+        schedule: ScheduleMode = 'static',
+        chunk_size: Optional[int] = None,
+        executor: ExecutorMode = 'thread',
+        queue_size: Optional[int] = None,
+        output_dtype: Optional[str] = None,
+        batched: bool = False,
+        cancellation_token: Optional[CancellationToken] = None,
+        cache: Optional[Union[bool, ResultCache]] = None,
         **overflow_kwargs: Overflow_In,
     ) -> None:
         """
         Initializes a new Concurrent Process\n
         Best for data processing
 
-        Splits a dataset as evenly as it can among the threads and run them concurrently
+        Splits a dataset as evenly as it can among the threads and run them concurrently\n
+        Datasets which only support `__iter__` are streamed to the threads through a bounded queue instead,
+        this bounds the input read ahead but every result is kept, so the results buffer grows with the stream
 
         Parameters
         ----------
         :param function: This should be the function to validate each data entry in the `dataset`, the first argument parsed will be a value of the dataset
-        :param dataset: This should be an iterable sequence of data entries
+        :param dataset: This should be an iterable sequence of data entries, or any iterable to stream it
         :param max_threads: This should be an integer value of the max threads allowed
         :param *: These are arguments parsed to `threading.Thread` and `Thread`
         :param _get_value: This should be a function that takes in the dataset and the index and returns the data entry
         :param _length: This should be an integer or a function that takes in the dataset and returns the length
+        :param _get_slice: This should be a function that takes in the dataset, start and stop indexes and returns the data entries in between, detected for datasets which support slicing if `_get_value` is None
+        :param pool: This should be a `ThreadPool` to run the chunks on, a new `Thread` is spawned per chunk if None
+        :param schedule: This should be how the dataset is distributed, `static` splits it evenly up front, `dynamic` and `guided` have threads claim batches as they go
+        :param chunk_size: This should be the batch size for `static` chunks, `dynamic` and streamed datasets, or the minimum batch size for `guided`
+        :param executor: This should be where `function` runs, `process` ships index ranges to worker processes and falls back to `thread` if `function` or `dataset` cannot be pickled. Worker processes are never forked from the running threads, they are started with `forkserver` where available or `spawn`
+        :param queue_size: This should be the maximum number of input batches buffered from a streamed dataset, defaults to twice `max_threads`. Results are not bounded by it
+        :param output_dtype: This should be an `array` typecode (e.g. 'd') to store results unboxed in a typed `array.array`, results are stored in a `list` if None
+        :param batched: If true, `function` is called once per batch with a list of `chunk_size` data entries and must return as many results
+        :param cancellation_token: This should be a `CancellationToken` shared by every chunk thread, a new one is created if None. Threads stop at the next data entry once it is cancelled, or at the next batch with the `process` executor
+        :param cache: This should be True to compute repeated data entries once, or a `ResultCache` to share results across jobs. Only applies when `function` is called per hashable data entry on threads
         :param **: These are arguments parsed to `thread.Thread` and `Thread`
 
         Raises
         ------
         ValueError: `max_threads` is 0 or negative
+        ValueError: `schedule` is not a valid schedule
+        ValueError: `chunk_size` is 0 or negative
+        ValueError: `executor` is not a valid executor
+        ValueError: `queue_size` is 0 or negative
+        ValueError: `output_dtype` is not a valid `array` typecode
+        ValueError: `executor` is `process` for a streamed dataset
         ValueError: `_length` is not an integer
         ValueError: empty dataset or `_length` is/returned 0
         TypeError: missing `_length`
@@ -460,6 +1100,16 @@ class ConcurrentProcessing(Generic[_Target_P, _Target_T, _Dataset_T]):
         """
         if max_threads <= 0:
             raise ValueError('`max_threads` must be greater than 0')
+        if schedule not in ('static', 'dynamic', 'guided'):
+            raise ValueError(f'`schedule` cannot be {schedule!r}')
+        if chunk_size is not None and chunk_size <= 0:
+            raise ValueError('`chunk_size` must be greater than 0')
+        if executor not in ('thread', 'process'):
+            raise ValueError(f'`executor` cannot be {executor!r}')
+        if queue_size is not None and queue_size <= 0:
+            raise ValueError('`queue_size` must be greater than 0')
+        if output_dtype is not None and output_dtype not in typecodes:
+            raise ValueError(f'`output_dtype` cannot be {output_dtype!r}')
 
         # Impose requirements
         if isinstance(dataset, SupportsLengthGetItem):
@@ -487,6 +1137,13 @@ class ConcurrentProcessing(Generic[_Target_P, _Target_T, _Dataset_T]):
 
             get_value = _get_value or dataset.__class__.__getitem__
 
+        elif _length is None and _get_value is None and isinstance(dataset, Iterable):
+            if executor == 'process':
+                raise ValueError('`executor` must be `thread` for streamed datasets')
+
+            length = None
+            get_value = None
+
         else:
             if not _length:
                 raise TypeError(
@@ -500,22 +1157,61 @@ class ConcurrentProcessing(Generic[_Target_P, _Target_T, _Dataset_T]):
             length = _length(dataset) if callable(_length) else _length
             get_value = _get_value
 
-        if not isinstance(length, int):
-            raise TypeError('`_length` must be an integer')
-        if length <= 0:
-            raise ValueError('dataset cannot be empty')
-        if not get_value:
-            raise TypeError('`_get_value` must be set')
+        if get_value is not None:
+            if not isinstance(length, int):
+                raise TypeError('`_length` must be an integer')
+            if length <= 0:
+                raise ValueError('dataset cannot be empty')
+
+            if _get_slice is None and _get_value is None and _supports_slicing(dataset):
+                _get_slice = _slice
 
         self._length = length
         self._retrieve_value = get_value
+        self._retrieve_slice = _get_slice
         self._threads = []
         self._completed = 0
+        self._finished = []
+        self._function = function
+        self._executor = None
+        self._active_workers = 0
+        self._condition = threading.Condition()
+        self._segments = []
+        self._output = self._allocate(length or 0, output_dtype)
+        self._queue = None
+        self._feeder = None
+        self._stream_closed = False
+        self._future = Future()
+        self._unresolved = 0
+        self._listeners = []
+        self._launched = False
+        self._attached = False
+        self._killed = False
+        self._partial = False
+        self.stats = ProcessingStats(Settings.STATS_ENABLED)
+        self.observers = []
 
         self.status = 'Idle'
-        self.function = self._wrap_function(function)
+        if cache is True:
+            cache = ResultCache(maxsize=None)
+        self.cache = cache if isinstance(cache, ResultCache) else None
+        self.function = self._wrap_function(
+            function if self.cache is None else self.cache.memoize(function)
+        )
         self.dataset = dataset
         self.max_threads = max_threads
+        self.pool = pool
+        self.schedule = schedule
+        self.chunk_size = chunk_size
+        self.executor = executor
+        self.queue_size = queue_size
+        self.output_dtype = output_dtype
+        self.batched = batched
+
+        given = overflow_kwargs.get('kwargs', {}).get('cancellation_token')
+        if cancellation_token is None and isinstance(given, CancellationToken):
+            cancellation_token = given
+        self.cancellation_token = cancellation_token or CancellationToken()
 
         self.overflow_args = overflow_args
         self.overflow_kwargs = overflow_kwargs
@@ -524,32 +1220,253 @@ class ConcurrentProcessing(Generic[_Target_P, _Target_T, _Dataset_T]):
         @wraps(function)
         def wrapper(
             index: int,
-            length: int,
-            data_chunk: Generator[_Dataset_T, None, None],
+            batches: Iterable[Tuple[int, int, Optional[Iterable[_Dataset_T]]]],
             *args: _Target_P.args,
             **kwargs: _Target_P.kwargs,
-        ) -> List[_Target_T]:
-            computed: List[_Target_T] = []
+        ) -> int:
+            output = self._output
+            worker = self._threads[index]
+            token = self.cancellation_token
+            # Static chunks are claimed in full when the worker is spawned
+            claims = self.schedule != 'static' or self._length is None
 
             i = 0
-            for data_entry in data_chunk:
-                v = function(data_entry, *args, **kwargs)
-                computed.append(v)
-                self._threads[index].progress = round((i + 1) / length, 5)
-                i += 1
+            error: Optional[BaseException] = None
+            try:
+                for chunkStart, chunkEnd, data_chunk in batches:
+                    if token.cancelled:
+                        worker.cancelled = True
+                        break
+
+                    if claims:
+                        worker.claimed += chunkEnd - chunkStart
+                    if self._executor is not None or self.batched:
+                        if self._executor is not None:
+                            computed = self._executor.submit(
+                                _process.run_batch, chunkStart, chunkEnd
+                            ).result()
+                        else:
+                            computed = function(
+                                data_chunk
+                                if isinstance(data_chunk, Sized)
+                                else list(data_chunk),
+                                *args,
+                                **kwargs,
+                            )
+                        self._store(chunkStart, chunkEnd, computed)
+                    else:
+                        offset = i - chunkStart + 1
+                        for x, data_entry in enumerate(data_chunk, chunkStart):
+                            if token.cancelled:
+                                # Keep the entries processed so far
+                                worker.cancelled = True
+                                chunkEnd = x
+                                break
+                            output[x] = function(data_entry, *args, **kwargs)
+                            if not x & _PROGRESS_MASK:
+                                worker.completed = x + offset
+                    i += chunkEnd - chunkStart
+                    worker.completed = i
+                    self._publish(chunkStart, chunkEnd)
+            except exceptions.CancelledError:
+                worker.cancelled = True
+            except BaseException as e:
+                error = e
+                raise
+            finally:
+                self._release_worker(worker, error)
+
+            return i
 
-            self._completed += 1
-            if self._completed == len(self._threads):
-                self.status = 'Completed'
+        return wrapper
 
-            return computed
+    @staticmethod
+    def _allocate(
+        length: int, output_dtype: Optional[str]
+    ) -> Union[List[Any], 'array[Any]']:
+        """Allocates an index-addressed results buffer"""
+        if output_dtype is None:
+            return [None] * length
+        return array(output_dtype, bytes(array(output_dtype).itemsize * length))
 
-        return wrapper
+    def _store(self, chunkStart: int, chunkEnd: int, computed: Iterable[Any]) -> None:
+        """
+        Writes a batch of results into the buffer
+
+        Raises
+        ------
+        ValueError: The batch returned a different number of results than it was given
+        """
+        if not isinstance(computed, Sized):
+            computed = list(computed)
+        if len(computed) != chunkEnd - chunkStart:
+            raise ValueError(
+                f'Expected {chunkEnd - chunkStart} results for the batch, got {len(computed)}'
+            )
+
+        output = self._output
+        output[chunkStart:chunkEnd] = (
+            computed if isinstance(output, list) else array(output.typecode, computed)
+        )
+
+    def _publish(self, chunkStart: int, chunkEnd: int) -> None:
+        """Records a finished batch and wakes up `iter_results()` consumers"""
+        with self._condition:
+            self._segments.append((chunkStart, chunkEnd))
+            self._condition.notify_all()
+            for listener in self._listeners:
+                listener()
+
+        if Observers.active:
+            self._emit('on_chunk_progress', chunkStart, chunkEnd)
+
+    def _release_worker(
+        self, worker: _ThreadWorker, error: Optional[BaseException]
+    ) -> None:
+        """Records how a chunk thread exited, tearing down shared resources once the last one does"""
+        with self._condition:
+            if error is None:
+                self._completed += 1
+            elif isinstance(error, Exception) and not any(
+                isinstance(error, ignore) for ignore in worker.thread.ignore_errors
+            ):
+                worker.failed = True
+            self._finished.append(worker)
+            self._active_workers -= 1
+            self._condition.notify_all()
+            for listener in self._listeners:
+                listener()
+            last = self._active_workers == 0
+
+        if worker.failed and Observers.active:
+            self._emit('on_error', error)
+        if last:
+            self._settle()
+
+    def _settle(self) -> None:
+        """Sets the final status and tears down shared resources once no chunk thread is left"""
+        with self._condition:
+            self._launched = False
+            attached, self._attached = self._attached, False
+            if self.stats.enabled:
+                self.stats.finished = time.perf_counter()
+
+            # Settled even if chunks failed, errors are kept by the chunk threads
+            if self._completed == len(self._finished) and not self._partial:
+                self.status = (
+                    'Cancelled'
+                    if any(entry.cancelled for entry in self._finished)
+                    else 'Completed'
+                )
+            else:
+                self.status = 'Killed' if self._killed else 'Errored'
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+
+        if self._queue is not None:
+            # Unblock the feeder if every consumer is gone
+            self._stream_closed = True
+            try:
+                while True:
+                    self._queue.get_nowait()
+            except queue.Empty:
+                pass
+
+        if Observers.active:
+            self._emit('on_finish')
+        if attached:
+            Observers._detach()
+
+    def _emit(self, event: str, *args: Any) -> None:
+        """Invokes an event on the global and the job's observers"""
+        Observers.emit(self.observers, event, self, *args)
+
+    def add_observer(self, observer: Observer) -> None:
+        """
+        Adds an observer receiving this job's lifecycle and batch progress events
+        -------------------------------------------------------------------------
+        Should be added before the job is started to receive every event.
+        Chunk threads only report to global observers
+
+        Parameters
+        ----------
+        :param observer: This should be an `Observer`
+        """
+        with self._condition:
+            self.observers.append(observer)
+            self._hold_observers()
+
+    def _hold_observers(self) -> None:
+        """Counts the job in `Observers.active` while it runs and is observed, the condition must be held"""
+        if self.observers and self._launched and not self._attached:
+            self._attached = True
+            Observers._attach()
+
+    def _fetch(self, chunkStart: int, chunkEnd: int) -> Iterable[_Dataset_T]:
+        """Retrieves `[chunkStart, chunkEnd)` from the dataset, in one slice if supported"""
+        if self._retrieve_slice is not None:
+            return self._retrieve_slice(self.dataset, chunkStart, chunkEnd)
+        return (
+            self._retrieve_value(self.dataset, x) for x in range(chunkStart, chunkEnd)
+        )
+
+    def _claim(
+        self, ranges: Iterable[Tuple[int, int]]
+    ) -> Generator[Tuple[int, int, Optional[Iterable[_Dataset_T]]], None, None]:
+        """
+        Turns `(start, end)` ranges into batches as they are claimed\n
+        Worker processes fetch their own slice, so only the range is yielded with the process executor
+        """
+        if self._executor is not None:
+            for chunkStart, chunkEnd in ranges:
+                yield chunkStart, chunkEnd, None
+            return
+
+        for chunkStart, chunkEnd in ranges:
+            yield chunkStart, chunkEnd, self._fetch(chunkStart, chunkEnd)
+
+    def _stream(self) -> Generator[Tuple[int, int, Iterable[_Dataset_T]], None, None]:
+        """Consumes batches from the feeder until it is exhausted"""
+        while True:
+            batch = self._queue.get()
+            if batch is None:
+                # Pass the sentinel on to the other consumers
+                self._queue.put(None)
+                return
+
+            chunkStart, data_chunk = batch
+            yield chunkStart, chunkStart + len(data_chunk), data_chunk
+
+    def _feed(self) -> int:
+        """
+        Pulls the streamed dataset into the bounded queue, blocking while it is full\n
+        The results buffer is grown by every batch read and kept until the job is discarded
+        """
+        size = self.chunk_size or 1
+        iterator = iter(self.dataset)
+
+        i = 0
+        try:
+            while not self._stream_closed and not self.cancellation_token.cancelled:
+                data_chunk = list(islice(iterator, size))
+                if not data_chunk:
+                    break
+                # Grow the results buffer before any thread can write to it
+                self._output.extend(self._allocate(len(data_chunk), self.output_dtype))
+                self._queue.put((i, data_chunk))
+                i += len(data_chunk)
+        finally:
+            if not self._stream_closed:
+                self._queue.put(None)
+
+        return i
 
     @property
     def results(self) -> List[_Target_T]:
         """
-        The return value of the threads if completed
+        The return value of the threads if completed\n
+        This is the internal buffer, an `array.array` if `output_dtype` was set
 
         Raises
         ------
@@ -560,10 +1477,220 @@ class ConcurrentProcessing(Generic[_Target_P, _Target_T, _Dataset_T]):
         if len(self._threads) == 0:
             raise exceptions.ThreadNotInitializedError()
 
-        results: List[_Target_T] = []
         for entry in self._threads:
-            results += entry.thread.result
-        return results
+            _ = entry.thread.result
+        if self._feeder is not None:
+            self._feeder._handle_exceptions()
+        return self._output
+
+    @property
+    def futures(self) -> List['Future[Any]']:
+        """
+        The `concurrent.futures.Future` of every chunk thread, and of the feeder thread for streamed datasets
+
+        Raises
+        ------
+        ThreadNotInitializedError: If the threads are not initialized
+        """
+        if len(self._threads) == 0:
+            raise exceptions.ThreadNotInitializedError()
+
+        futures = [entry.thread.future for entry in self._threads]
+        if self._feeder is not None:
+            futures.append(self._feeder.future)
+        return futures
+
+    @property
+    def future(self) -> 'Future[List[_Target_T]]':
+        """
+        A `concurrent.futures.Future` resolved with `results` once every chunk thread exits\n
+        It resolves with the first exception raised by a chunk thread instead, if any
+        """
+        return self._future
+
+    def _resolve_future(self, _: 'Future[Any]') -> None:
+        """Chunk future callback, settles the job future once the last one resolves"""
+        with self._condition:
+            self._unresolved -= 1
+            if self._unresolved > 0 or self._future.done():
+                return
+
+        for future in self.futures:
+            error = None if future.cancelled() else future.exception()
+            if error is not None:
+                self._future.set_exception(error)
+                return
+        self._future.set_result(self._output)
+
+    @property
+    def progress(self) -> float:
+        """
+        Fraction of the dataset processed so far, streamed datasets count the entries received so far\n
+        Workers report every 64 entries and at the end of each batch
+
+        Raises
+        ------
+        ThreadNotInitializedError: If the threads are not initialized
+        """
+        if len(self._threads) == 0:
+            raise exceptions.ThreadNotInitializedError()
+
+        completed = sum(entry.completed for entry in self._threads)
+        total = (
+            self._length
+            if self._length is not None
+            else sum(entry.claimed for entry in self._threads)
+        )
+        return round(completed / total, 5) if total else 0
+
+    @property
+    def progress_per_worker(self) -> List[float]:
+        """
+        Fraction of its claimed entries each worker has processed so far
+
+        Raises
+        ------
+        ThreadNotInitializedError: If the threads are not initialized
+        """
+        if len(self._threads) == 0:
+            raise exceptions.ThreadNotInitializedError()
+        return [entry.progress for entry in self._threads]
+
+    def iter_results(self, ordered: bool = True) -> Generator[_Target_T, None, None]:
+        """
+        Yields the return values of the threads as batches complete
+
+        Parameters
+        ----------
+        :param ordered: If true, values are yielded in the `dataset` arrangement, else in completion order
+
+        Returns
+        -------
+        :returns Generator[Any, None, None]: The return values of the target function
+
+        Raises
+        ------
+        ThreadNotInitializedError: If the threads are not initialized
+        """
+        if len(self._threads) == 0:
+            raise exceptions.ThreadNotInitializedError()
+
+        cursor = 0
+        expected = 0
+        pending: dict[int, int] = {}
+        while True:
+            with self._condition:
+                while cursor == len(self._segments) and self._active_workers > 0:
+                    self._condition.wait()
+                finished = self._active_workers == 0
+                published = self._segments[cursor:]
+                cursor += len(published)
+
+            for chunkStart, chunkEnd in published:
+                if not ordered:
+                    yield from self._output[chunkStart:chunkEnd]
+                    continue
+
+                pending[chunkStart] = chunkEnd
+                while expected in pending:
+                    chunkEnd = pending.pop(expected)
+                    yield from self._output[expected:chunkEnd]
+                    expected = chunkEnd
+
+            if finished and cursor == len(self._segments):
+                break
+
+        for entry in self._threads:
+            entry.thread.join()
+        if self._feeder is not None:
+            self._feeder.join()
+
+        # Only reachable with gaps left by ignored errors
+        for chunkStart in sorted(pending):
+            yield from self._output[chunkStart : pending[chunkStart]]
+
+    async def aiter_results(
+        self, ordered: bool = True
+    ) -> AsyncGenerator[_Target_T, None]:
+        """
+        Asynchronously yields the return values of the threads as batches complete\n
+        Threads wake the event loop with `call_soon_threadsafe`, nothing blocks or polls
+
+        Parameters
+        ----------
+        :param ordered: If true, values are yielded in the `dataset` arrangement, else in completion order
+
+        Returns
+        -------
+        :returns AsyncGenerator[Any, None]: The return values of the target function
+
+        Raises
+        ------
+        ThreadNotInitializedError: If the threads are not initialized
+        """
+        import asyncio
+
+        if len(self._threads) == 0:
+            raise exceptions.ThreadNotInitializedError()
+
+        loop = asyncio.get_running_loop()
+        wakeup = asyncio.Event()
+
+        def listener() -> None:
+            loop.call_soon_threadsafe(wakeup.set)
+
+        with self._condition:
+            self._listeners.append(listener)
+
+        try:
+            cursor = 0
+            expected = 0
+            pending: dict[int, int] = {}
+            while True:
+                with self._condition:
+                    # Cleared under the lock so no batch published after it is missed
+                    wakeup.clear()
+                    finished = self._active_workers == 0
+                    published = self._segments[cursor:]
+                    cursor += len(published)
+
+                for chunkStart, chunkEnd in published:
+                    if not ordered:
+                        for value in self._output[chunkStart:chunkEnd]:
+                            yield value
+                        continue
+
+                    pending[chunkStart] = chunkEnd
+                    while expected in pending:
+                        chunkEnd = pending.pop(expected)
+                        for value in self._output[expected:chunkEnd]:
+                            yield value
+                        expected = chunkEnd
+
+                if finished and cursor == len(self._segments):
+                    break
+                if not published:
+                    await wakeup.wait()
+        finally:
+            with self._condition:
+                self._listeners.remove(listener)
+
+        await self
+
+        # Only reachable with gaps left by ignored errors
+        for chunkStart in sorted(pending):
+            for value in self._output[chunkStart : pending[chunkStart]]:
+                yield value
+
+    def __aiter__(self) -> AsyncGenerator[_Target_T, None]:
+        return self.aiter_results()
+
+    def __await__(self) -> Generator[Any, None, List[_Target_T]]:
+        """
+        Awaits the started job without blocking the event loop, resolving as `future` does\n
+        Cancelling the awaiting task cancels the job's cancellation token
+        """
+        return _await_future(self._future, self.cancel).__await__()
 
     def is_alive(self) -> bool:
         """
@@ -585,15 +1712,20 @@ class ConcurrentProcessing(Generic[_Target_P, _Target_T, _Dataset_T]):
         -------
         :returns Any: The return value of the target function
         """
-        results: List[_Target_T] = []
         for entry in self._threads:
             entry.thread.join()
-            results += entry.thread.result
-        return results
+            _ = entry.thread.result
+        if self._feeder is not None:
+            self._feeder.join()
+        return self._output
 
-    def join(self) -> None:
+    def join(self, timeout: Optional[float] = None) -> None:
         """
-        Halts the current thread execution until a thread completes or exceeds the timeout
+        Halts the current thread execution until all threads complete or exceeds the timeout
+
+        Parameters
+        ----------
+        :param timeout: The maximum time allowed to halt the thread
 
         Raises
         ------
@@ -606,20 +1738,144 @@ class ConcurrentProcessing(Generic[_Target_P, _Target_T, _Dataset_T]):
         if self.status == 'Idle':
             raise exceptions.ThreadNotRunningError()
 
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            self._condition.wait_for(lambda: self._active_workers == 0, timeout)
+
         for entry in self._threads:
-            entry.thread.join()
+            entry.thread.join(_remaining(deadline))
+        if self._feeder is not None:
+            self._feeder.join(_remaining(deadline))
 
-    def kill(self) -> None:
+    def wait(
+        self,
+        timeout: Optional[float] = None,
+        return_when: WaitMode = 'ALL_COMPLETED',
+    ) -> Tuple[List[Thread], List[Thread]]:
         """
-        Kills the threads
+        Halts the current thread execution until the `return_when` condition is met or exceeds the timeout
+
+        Parameters
+        ----------
+        :param timeout: The maximum time allowed to halt the thread
+        :param return_when: This should be `FIRST_COMPLETED`, `FIRST_EXCEPTION` or `ALL_COMPLETED`, as with `concurrent.futures.wait`
+
+        Returns
+        -------
+        :returns tuple[list[Thread], list[Thread]]: The chunk threads which have exited and those which have not
 
         Raises
         ------
+        ValueError: `return_when` is not a valid mode
         ThreadNotInitializedError: If the thread is not initialized
-        ThreadNotRunningError: If the thread is not running
         """
-        for entry in self._threads:
-            entry.thread.kill()
+        if return_when not in ('FIRST_COMPLETED', 'FIRST_EXCEPTION', 'ALL_COMPLETED'):
+            raise ValueError(f'`return_when` cannot be {return_when!r}')
+        if len(self._threads) == 0:
+            raise exceptions.ThreadNotInitializedError()
+
+        def predicate() -> bool:
+            if self._active_workers == 0:
+                return True
+            if return_when == 'FIRST_COMPLETED':
+                return len(self._finished) > 0
+            if return_when == 'FIRST_EXCEPTION':
+                return any(entry.failed for entry in self._finished)
+            return False
+
+        with self._condition:
+            self._condition.wait_for(predicate, timeout)
+            finished = list(self._finished)
+
+        # The latch is released just before the thread records its status
+        for entry in finished:
+            entry.thread._wait()
+
+        done = [entry.thread for entry in finished]
+        return done, [
+            entry.thread for entry in self._threads if entry.thread not in done
+        ]
+
+    def as_completed(
+        self, timeout: Optional[float] = None
+    ) -> Generator[Thread, None, None]:
+        """
+        Yields the chunk threads as they exit
+
+        Parameters
+        ----------
+        :param timeout: The maximum time allowed to wait for all threads, measured from the first call
+
+        Returns
+        -------
+        :returns Generator[Thread, None, None]: The chunk threads in completion order
+
+        Raises
+        ------
+        TimeoutError: If the threads did not all exit before the timeout
+        ThreadNotInitializedError: If the thread is not initialized
+        """
+        if len(self._threads) == 0:
+            raise exceptions.ThreadNotInitializedError()
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        total = len(self._threads)
+        cursor = 0
+        while cursor < total:
+            with self._condition:
+                if not self._condition.wait_for(
+                    lambda cursor=cursor: cursor < len(self._finished),
+                    _remaining(deadline),
+                ):
+                    raise TimeoutError(
+                        f'{total - cursor} (of {total}) threads did not complete'
+                    )
+                finished = self._finished[cursor:]
+                cursor += len(finished)
+
+            for entry in finished:
+                entry.thread._wait()
+                yield entry.thread
+
+    def cancel(self) -> None:
+        """
+        Requests the threads to stop through the shared cancellation token
+        -------------------------------------------------------------------
+        Threads stop before their next data entry, `results` then holds the entries
+        processed so far and the status becomes `Cancelled`
+        """
+        self.cancellation_token.cancel()
+
+    def kill(self, yielding: bool = False, timeout: float = 5) -> bool:
+        """
+        Schedules the threads to be killed
+
+        Parameters
+        ----------
+        :param yielding: If true, halts the current thread execution until the threads are killed
+        :param timeout: The maximum number of seconds to wait before exiting
+
+        Returns
+        -------
+        :returns bool: False if the it exceeded the timeout without every thread being killed
+
+        Raises
+        ------
+        ThreadNotInitializedError: If the thread is not initialized
+        """
+        if len(self._threads) == 0:
+            raise exceptions.ThreadNotInitializedError()
+
+        self._killed = True
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+        threads = [entry.thread for entry in self._threads]
+        if self._feeder is not None:
+            threads.append(self._feeder)
+
+        survivors = kill_all(threads, timeout if yielding else 0)
+        return not yielding or len(survivors) == 0
 
     def start(self) -> None:
         """
@@ -628,12 +1884,30 @@ class ConcurrentProcessing(Generic[_Target_P, _Target_T, _Dataset_T]):
         Raises
         ------
         ThreadStillRunningError: If there already is a running thread
+        InvalidStateTransitionError: If the threads have already been started, a job only runs once
+        QueueFullError: If `pool` rejects a chunk thread, those already started keep running and the job settles as `Errored`
+        RuntimeError: If `pool` has been shutdown
         """
         if self.status == 'Running':
             raise exceptions.ThreadStillRunningError()
+        if self.status != 'Idle':
+            raise exceptions.InvalidStateTransitionError(
+                f"Threads cannot go from {self.status!r} to 'Running', create a new instance to run again"
+            )
 
         self.status = 'Running'
-        max_threads = min(self.max_threads, self._length)
+        with self._condition:
+            self._launched = True
+            self._hold_observers()
+        if self.stats.enabled:
+            self.stats.started = time.perf_counter()
+        if Observers.active:
+            self._emit('on_start')
+        max_threads = (
+            self.max_threads
+            if self._length is None
+            else min(self.max_threads, self._length)
+        )
 
         parsed_args = self.overflow_kwargs.get('args', [])
         name_format = (
@@ -643,26 +1917,181 @@ class ConcurrentProcessing(Generic[_Target_P, _Target_T, _Dataset_T]):
             i: v for i, v in self.overflow_kwargs.items() if i != 'name' and i != 'args'
         }
 
-        i = 0
-        for chunkStart, chunkEnd in chunk_split(self._length, max_threads):
-            chunk_thread = Thread(
-                target=self.function,
-                args=[
-                    i,
-                    chunkEnd - chunkStart,
-                    (
-                        self._retrieve_value(self.dataset, x)
-                        for x in range(chunkStart, chunkEnd)
-                    ),
-                    *parsed_args,
-                    *self.overflow_args,
-                ],
-                name=name_format and name_format % i or None,
-                **self.overflow_kwargs,
+        spawn = Thread if self.pool is None else self.pool.create
+        self._active_workers = max_threads
+
+        if self.executor == 'process':
+            args = (*parsed_args, *self.overflow_args)
+            kwargs = self.overflow_kwargs.get('kwargs', {})
+            initargs = (
+                self._function,
+                self.dataset,
+                self._retrieve_value,
+                self._retrieve_slice,
+                args,
+                kwargs,
+                self.batched,
             )
-            self._threads.append(_ThreadWorker(chunk_thread, 0))
-            chunk_thread.start()
-            i += 1
+            # Workers are not forked, so everything they are initialized with is pickled
+            if _process.is_picklable(*initargs):
+                self._executor = ProcessPoolExecutor(
+                    max_threads,
+                    mp_context=_process.get_context(),
+                    initializer=_process.initialize,
+                    initargs=initargs,
+                )
+            elif Settings.VERBOSITY > 'quiet':
+                print(
+                    'Unable to pickle `function` or `dataset`, falling back to threads'
+                )
+
+        assignments: List[Iterable[Tuple[int, int, Optional[Iterable[_Dataset_T]]]]]
+        claimed: Optional[List[int]] = None
+        if self._length is None:
+            self._queue = queue.Queue(self.queue_size or max_threads * 2)
+            assignments = [self._stream() for _ in range(max_threads)]
+
+            # Never pooled, a busy pool would leave the consumers starved
+            self._feeder = Thread(
+                target=self._feed,
+                name=name_format and name_format % 'feeder' or None,
+                cancellation_token=self.cancellation_token,
+                **{i: v for i, v in self.overflow_kwargs.items() if i != 'kwargs'},
+            )
+        elif self.schedule == 'static':
+            # Each thread keeps its contiguous chunk but reports it in batches
+            chunks = list(chunk_split(self._length, max_threads))
+            claimed = [chunkEnd - chunkStart for chunkStart, chunkEnd in chunks]
+            assignments = [
+                self._claim(
+                    batch_split(
+                        chunkEnd,
+                        self.chunk_size or max(1, (chunkEnd - chunkStart) // 16),
+                        chunkStart,
+                    )
+                )
+                for chunkStart, chunkEnd in chunks
+            ]
+        else:
+            if self.schedule == 'dynamic':
+                ranges = batch_split(
+                    self._length,
+                    self.chunk_size or max(1, self._length // (max_threads * 16)),
+                )
+            else:
+                ranges = guided_split(self._length, max_threads, self.chunk_size or 1)
+            cursor = _BatchCursor(ranges)
+            assignments = [self._claim(cursor) for _ in range(max_threads)]
+
+        started = 0
+        try:
+            for i, batches in enumerate(assignments):
+                chunk_thread = spawn(
+                    target=self.function,
+                    args=[i, batches, *parsed_args, *self.overflow_args],
+                    name=name_format and name_format % i or None,
+                    cancellation_token=self.cancellation_token,
+                    **self.overflow_kwargs,
+                )
+                worker = _ThreadWorker(chunk_thread)
+                if claimed is not None:
+                    worker.claimed = claimed[i]
+                self._threads.append(worker)
+                if self.stats.enabled:
+                    self.stats.workers.append(WorkerStats(worker))
+                chunk_thread.start()
+                started += 1
+        except BaseException as e:
+            # e.g. `QueueFullError` from a rejecting pool
+            self._abort_start(started, max_threads, e)
+            raise
+
+        if self._feeder is not None:
+            self._feeder.start()
+
+        self._future.set_running_or_notify_cancel()
+        futures = self.futures
+        self._unresolved = len(futures)
+        for future in futures:
+            future.add_done_callback(self._resolve_future)
+
+    def _abort_start(self, started: int, reserved: int, error: BaseException) -> None:
+        """Releases the chunk threads which never started after `start` failed midway"""
+        del self._threads[started:]
+        if self.stats.enabled:
+            del self.stats.workers[started:]
+        if self._feeder is not None:
+            # The feeder never runs, let the consumers which did start exit
+            self._feeder = None
+            self._queue.put(None)  # type: ignore[union-attr]
+        self._future.set_exception(error)
+
+        with self._condition:
+            self._partial = True
+            self._active_workers -= reserved - started
+            last = self._active_workers == 0
+        if last:
+            self._settle()
+
+
+def graceful_shutdown(
+    grace_period: Optional[float] = None,
+    timeout: Optional[float] = None,
+    escalation: Optional[EscalationPolicy] = None,
+) -> List[Thread]:
+    """
+    Drains every running thread within a single deadline
+
+    Threads are first cancelled and given `grace_period` seconds to exit on their own,
+    those still running are then escalated according to `escalation`
+
+    Parameters
+    ----------
+    :param grace_period: Seconds threads are given to exit on their own, defaults to `Settings.SHUTDOWN_GRACE_PERIOD`
+    :param timeout: Seconds the whole shutdown may take, defaults to `Settings.SHUTDOWN_TIMEOUT`
+    :param escalation: `kill` or `abandon` for threads still running after the grace period, defaults to `Settings.SHUTDOWN_ESCALATION`
+
+    Returns
+    -------
+    :returns list[Thread]: The threads which did not exit before the deadline
+
+    Raises
+    ------
+    ValueError: If the escalation policy is not valid
+    """
+    grace_period = (
+        Settings.SHUTDOWN_GRACE_PERIOD if grace_period is None else grace_period
+    )
+    timeout = Settings.SHUTDOWN_TIMEOUT if timeout is None else timeout
+    escalation = escalation or Settings.SHUTDOWN_ESCALATION
+    if escalation not in ('kill', 'abandon'):
+        raise ValueError(f'{escalation!r} is not a valid escalation policy')
+
+    started = time.monotonic()
+    deadline = started + timeout
+    grace_deadline = min(deadline, started + grace_period)
+
+    snapshot = [
+        thread
+        for thread in Threads.snapshot()
+        if thread is not threading.current_thread()
+    ]
+
+    for thread in snapshot:
+        thread.cancel()
+
+    running = [
+        thread for thread in snapshot if not thread._wait(_remaining(grace_deadline))
+    ]
+    if running and escalation == 'kill':
+        running = kill_all(running, max(0, deadline - time.monotonic()))
+
+    if running and Settings.VERBOSITY > 'quiet':
+        print(
+            '%d thread(s) did not exit: %s'
+            % (len(running), ', '.join(thread.name for thread in running))
+        )
+    return running
 
 
 # Handle abrupt exit
@@ -670,20 +2099,9 @@ def service_shutdown(signum, _):
     if Settings.GRACEFUL_EXIT_ENABLED:
         if Settings.VERBOSITY > 'quiet':
             print('\nCaught signal %d' % signum)
-            print('Gracefully killing active threads')
-
-        for thread in Threads:
-            if isinstance(thread, Thread):
-                try:
-                    thread.kill()
-                except (
-                    exceptions.ThreadNotRunningError,
-                    exceptions.ThreadNotInitializedError,
-                ):
-                    pass
-                except Exception:
-                    if Settings.VERBOSITY > 'quiet':
-                        print('Failed to kill ident: %d' % thread.ident or 0)
+            print('Gracefully shutting down active threads')
+
+        graceful_shutdown()
         sys.exit(0)
 
 
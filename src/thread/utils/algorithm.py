@@ -50,3 +50,76 @@ def chunk_split(
         yield (i, b)
         overflow -= 1
         i = b
+
+
+def batch_split(
+    dataset_length: int, batch_size: int, start: int = 0
+) -> Generator[Tuple[int, int], None, None]:
+    """
+    Splits a dataset into fixed size batches
+
+    The last batch holds the remainder
+      > `[ [n], [n], [n], [<=n] ]`
+
+
+    Parameters
+    ----------
+    :param dataset_length: This should be the length of the dataset you want to split into batches
+    :param batch_size: This should be the number of entries in each batch
+    :param start: This should be the index the first batch starts at, to split only `[start, dataset_length)`
+
+
+    Returns
+    -------
+    :returns Generator[tuple[int, int], None, None]: The batched dataset slices
+
+    Raises
+    ------
+    AssertionError: The batch size is not positive
+    """
+    assert batch_size > 0, 'The batch size must be greater than 0'
+
+    i = start
+    while i < dataset_length:
+        b = min(i + batch_size, dataset_length)
+        yield (i, b)
+        i = b
+
+
+def guided_split(
+    dataset_length: int, number_of_chunks: int, minimum_size: int = 1
+) -> Generator[Tuple[int, int], None, None]:
+    """
+    Splits a dataset into batches which shrink as the dataset is consumed
+
+    Each batch is sized to an even share of what remains, but never smaller than `minimum_size`
+      > `[ [N/M], [(N - N/M)/M], ..., [minimum_size] ]`
+
+
+    Parameters
+    ----------
+    :param dataset_length: This should be the length of the dataset you want to split into batches
+    :param number_of_chunks: This should be the number of consumers sharing the batches
+    :param minimum_size: This should be the smallest batch size yielded, except for the final batch
+
+
+    Returns
+    -------
+    :returns Generator[tuple[int, int], None, None]: The batched dataset slices
+
+    Raises
+    ------
+    AssertionError: The number of chunks or minimum size is not positive
+    """
+    assert number_of_chunks > 0, 'The number of chunks must be greater than 0'
+    assert minimum_size > 0, 'The minimum size must be greater than 0'
+
+    i = 0
+    while i < dataset_length:
+        remaining = dataset_length - i
+        b = min(
+            i + max(minimum_size, -(-remaining // number_of_chunks)), dataset_length
+        )
+
+        yield (i, b)
+        i = b
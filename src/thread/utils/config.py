@@ -1,4 +1,4 @@
-from typing import Any, Callable, Literal, Union, cast
+from typing import Any, Callable, Literal, Optional, Union, cast
 
 _Verbosity_Num = Literal[0, 1, 2]
 _Verbosity_Enum = Literal['quiet', 'normal', 'verbose']
@@ -9,6 +9,8 @@ VerbosityMapping: dict[_Verbosity_Enum, _Verbosity_Num] = {
     'verbose': 2,
 }
 
+EscalationPolicy = Literal['kill', 'abandon']
+
 
 class Verbosity:
     """
@@ -116,6 +118,13 @@ class Settings:
 
     # Graceful Exit
     GRACEFUL_EXIT_ENABLED: bool = True
+    EscalationPolicy = EscalationPolicy
+    SHUTDOWN_GRACE_PERIOD: float = 1
+    SHUTDOWN_TIMEOUT: float = 5
+    SHUTDOWN_ESCALATION: EscalationPolicy = 'kill'
+
+    # Stats
+    STATS_ENABLED: bool = True
 
     def __init__(self):
         raise NotImplementedError('This class is not instantiable')
@@ -135,6 +144,63 @@ class Settings:
         """
         Settings.GRACEFUL_EXIT_ENABLED = enabled
 
+    @staticmethod
+    def set_stats(enabled: bool = True) -> None:
+        """
+        Enables/Disables collecting `stats` for threads and jobs created afterwards.
+
+        Parameters
+        ----------
+        :param enabled: True to record timestamps and CPU time, False to skip them.
+
+        Returns
+        -------
+        :returns: None
+        """
+        Settings.STATS_ENABLED = enabled
+
+    @staticmethod
+    def set_shutdown_policy(
+        grace_period: Optional[float] = None,
+        timeout: Optional[float] = None,
+        escalation: Optional[EscalationPolicy] = None,
+    ) -> None:
+        """
+        Configures how running threads are drained on graceful exit.
+
+        Parameters
+        ----------
+        :param grace_period: Seconds threads are given to exit on their own before escalating, None to keep the current value.
+        :param timeout: Seconds the whole shutdown may take, including the grace period, None to keep the current value.
+        :param escalation: `kill` to raise `SystemExit` in threads still running after the grace period, `abandon` to leave them. None to keep the current value.
+
+        Returns
+        -------
+        :returns: None
+
+        Raises
+        ------
+        ValueError: If the grace period or timeout is negative.
+        ValueError: If the grace period exceeds the timeout.
+        ValueError: If the escalation policy is not valid.
+        """
+        grace_period = (
+            Settings.SHUTDOWN_GRACE_PERIOD if grace_period is None else grace_period
+        )
+        timeout = Settings.SHUTDOWN_TIMEOUT if timeout is None else timeout
+        escalation = escalation or Settings.SHUTDOWN_ESCALATION
+
+        if grace_period < 0 or timeout < 0:
+            raise ValueError('Shutdown durations cannot be negative')
+        if grace_period > timeout:
+            raise ValueError('Grace period cannot exceed the shutdown timeout')
+        if escalation not in ('kill', 'abandon'):
+            raise ValueError(f'{escalation!r} is not a valid escalation policy')
+
+        Settings.SHUTDOWN_GRACE_PERIOD = grace_period
+        Settings.SHUTDOWN_TIMEOUT = timeout
+        Settings.SHUTDOWN_ESCALATION = escalation
+
     @staticmethod
     def set_verbosity(verbosity: VerbosityLevel = 'normal') -> None:
         """
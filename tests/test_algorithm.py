@@ -47,3 +47,41 @@ def test_chunking_dynamic():
         )
         expected_chunk_high -= 1
         i = b
+
+
+def test_batching_1():
+    assert list(algorithm.batch_split(5, 2)) == [(0, 2), (2, 4), (4, 5)]
+
+
+def test_batching_2():
+    assert list(algorithm.batch_split(4, 10)) == [(0, 4)]
+
+
+def test_batching_offset():
+    assert list(algorithm.batch_split(10, 4, 3)) == [(3, 7), (7, 10)]
+
+
+def test_guided_1():
+    assert list(algorithm.guided_split(10, 2)) == [
+        (0, 5),
+        (5, 8),
+        (8, 9),
+        (9, 10),
+    ]
+
+
+def test_guided_minimum():
+    assert list(algorithm.guided_split(10, 2, 3)) == [(0, 5), (5, 8), (8, 10)]
+
+
+def test_guided_dynamic():
+    dataset_length = random.randint(400, int(10e5))
+    thread_count = random.randint(2, 100)
+
+    batches = list(algorithm.guided_split(dataset_length, thread_count))
+    sizes = [b - a for a, b in batches]
+
+    assert batches[0][0] == 0
+    assert batches[-1][1] == dataset_length
+    assert all(batches[i][1] == batches[i + 1][0] for i in range(len(batches) - 1))
+    assert sizes == sorted(sizes, reverse=True)
@@ -0,0 +1,175 @@
+import time
+import asyncio
+import pytest
+from thread import (
+    CancellationToken,
+    ConcurrentProcessing,
+    Thread,
+    async_processor,
+    async_threaded,
+)
+
+
+# >>>>>>>>>> Dummy Functions <<<<<<<<<< #
+def _dummy_target_raiseToPower(x: float, power: float, delay: float = 0):
+    time.sleep(delay)
+    return x**power
+
+
+def _dummy_target_untilCancelled(cancellation_token: CancellationToken) -> int:
+    i = 0
+    while not cancellation_token.cancelled:
+        time.sleep(0.001)
+        i += 1
+    return i
+
+
+def _dummy_dataProcessor(data_in: int, delay: float = 0) -> int:
+    time.sleep(delay)
+    return data_in
+
+
+# >>>>>>>>>> Thread <<<<<<<<<< #
+def test_awaitThread():
+    """This test is for testing that a thread can be awaited for its return value"""
+    new = Thread(target=_dummy_target_raiseToPower, args=[3, 2, 0.05], daemon=True)
+
+    async def _main():
+        new.start()
+        return await new
+
+    assert asyncio.run(_main()) == 9
+
+
+def test_awaitDoesNotBlockLoop():
+    """This test is for testing that the event loop keeps running while a thread is awaited"""
+    ticks = []
+
+    async def _ticker():
+        for _ in range(5):
+            ticks.append(time.perf_counter())
+            await asyncio.sleep(0.01)
+
+    async def _main():
+        new = Thread(target=_dummy_target_raiseToPower, args=[2, 2, 0.1], daemon=True)
+        new.start()
+        result, _ = await asyncio.gather(new, _ticker())
+        return result
+
+    assert asyncio.run(_main()) == 4
+    assert len(ticks) == 5
+
+
+def test_awaitCancelled():
+    """This test is for testing that cancelling the awaiting task cancels the thread's token"""
+    new = Thread(target=_dummy_target_untilCancelled, daemon=True)
+
+    async def _main():
+        new.start()
+        task = asyncio.ensure_future(new)
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(_main())
+    new.join(1)
+    assert new.cancellation_token.cancelled
+    assert new.status == 'Completed'
+
+
+def test_awaitMany():
+    """This test is for testing that many threads can be awaited together"""
+
+    async def _main():
+        threads = [
+            Thread(target=_dummy_target_raiseToPower, args=[i, 2, 0.01], daemon=True)
+            for i in range(50)
+        ]
+        for thread in threads:
+            thread.start()
+        return await asyncio.gather(*threads)
+
+    assert asyncio.run(_main()) == [i**2 for i in range(50)]
+
+
+# >>>>>>>>>> Concurrent Processing <<<<<<<<<< #
+def test_awaitProcessing():
+    """This test is for testing that a concurrent processing job can be awaited for its results"""
+    dataset = list(range(0, 100))
+    new = ConcurrentProcessing(
+        function=_dummy_dataProcessor, dataset=dataset, max_threads=4, daemon=True
+    )
+
+    async def _main():
+        new.start()
+        return await new
+
+    assert asyncio.run(_main()) == dataset
+
+
+@pytest.mark.parametrize('ordered', [True, False])
+def test_asyncIterResults(ordered):
+    """This test is for testing that results can be consumed with `async for` as they are published"""
+    dataset = list(range(0, 200))
+    new = ConcurrentProcessing(
+        function=_dummy_dataProcessor,
+        dataset=dataset,
+        max_threads=4,
+        kwargs={'delay': 0.001},
+        daemon=True,
+    )
+
+    async def _main():
+        new.start()
+        return [x async for x in new.aiter_results(ordered=ordered)]
+
+    results = asyncio.run(_main())
+    assert results == dataset if ordered else sorted(results) == dataset
+
+
+def test_asyncIterStreamed():
+    """This test is for testing that `async for` consumes a streamed dataset"""
+    new = ConcurrentProcessing(
+        function=_dummy_dataProcessor, dataset=iter(range(0, 50)), max_threads=2
+    )
+
+    async def _main():
+        new.start()
+        return [x async for x in new]
+
+    assert asyncio.run(_main()) == list(range(0, 50))
+
+
+# >>>>>>>>>> Decorators <<<<<<<<<< #
+def test_asyncThreaded():
+    """This test is for testing that `async_threaded` returns a coroutine function"""
+
+    @async_threaded(daemon=True)
+    def _run(x: int) -> int:
+        return _dummy_target_raiseToPower(x, 2, 0.01)
+
+    assert asyncio.iscoroutinefunction(_run)
+    assert asyncio.run(_run(4)) == 16
+
+
+def test_asyncProcessor():
+    """This test is for testing that `async_processor` awaits the processed dataset"""
+
+    @async_processor(max_threads=4, daemon=True)
+    def _run(data_in: int) -> int:
+        return data_in * 2
+
+    assert asyncio.run(_run(list(range(0, 20)))) == [x * 2 for x in range(0, 20)]
+
+
+# >>>>>>>>>> Raising Exceptions <<<<<<<<<< #
+def test_raises_awaitThread():
+    """This test should raise the error raised by the target"""
+
+    @async_threaded(daemon=True)
+    def _run():
+        raise ValueError()
+
+    with pytest.raises(ValueError):
+        asyncio.run(_run())
@@ -0,0 +1,178 @@
+import time
+import threading
+import pytest
+from thread import (
+    CancellationToken,
+    ConcurrentProcessing,
+    ResultCache,
+    processor,
+    threaded,
+)
+
+
+# >>>>>>>>>> Dummy Functions <<<<<<<<<< #
+class _Counter:
+    def __init__(self) -> None:
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, x, delay: float = 0):
+        with self._lock:
+            self.calls += 1
+        time.sleep(delay)
+        return x * 2
+
+
+def _dummy_raiseException(x: Exception):
+    raise x
+
+
+def _dummy_tokenTarget(x: int, cancellation_token: CancellationToken) -> int:
+    return x * 2
+
+
+# >>>>>>>>>> Result Cache <<<<<<<<<< #
+def test_leastRecentlyUsed():
+    """This test is for testing that the least recently used entry is evicted first"""
+    cache = ResultCache(maxsize=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert cache.get('a') == 1
+    cache.set('c', 3)
+    assert 'a' in cache and 'c' in cache
+    assert 'b' not in cache
+    assert len(cache) == 2
+
+
+def test_timeToLive():
+    """This test is for testing that entries expire after `ttl` seconds"""
+    cache = ResultCache(ttl=0.05)
+    cache.set('a', 1)
+    assert cache.get('a') == 1
+    time.sleep(0.1)
+    assert cache.get('a', 'expired') == 'expired'
+
+
+def test_inFlightDeduplication():
+    """This test is for testing that concurrent misses on a key compute it once"""
+    cache = ResultCache()
+    counter = _Counter()
+    results = []
+
+    def _call():
+        results.append(cache.get_or_call('key', counter, 2, 0.05))
+
+    callers = [threading.Thread(target=_call) for _ in range(8)]
+    for caller in callers:
+        caller.start()
+    for caller in callers:
+        caller.join()
+
+    assert results == [4] * 8
+    assert counter.calls == 1
+    assert cache.misses == 1 and cache.hits == 7
+
+
+def test_errorsNotStored():
+    """This test is for testing that a raising computation stores nothing"""
+    cache = ResultCache()
+    with pytest.raises(ValueError):
+        cache.get_or_call('key', _dummy_raiseException, ValueError())
+    assert 'key' not in cache
+    assert cache.get_or_call('key', lambda: 1) == 1
+
+
+# >>>>>>>>>> Threaded <<<<<<<<<< #
+def test_threadedShared():
+    """This test is for testing that identical calls share one thread"""
+    counter = _Counter()
+    cached = threaded(counter, cache=True)
+
+    first = cached(2, 0.05)
+    second = cached(2, 0.05)
+    other = cached(3)
+
+    assert first is second
+    assert first is not other
+    assert first.get_return_value() == 4
+    assert cached(2, 0.05) is first
+    assert counter.calls == 2
+
+
+def test_threadedUnhashable():
+    """This test is for testing that calls with unhashable arguments are not cached"""
+    cached = threaded(lambda x: len(x), cache=True)
+    assert cached([1, 2]) is not cached([1, 2])
+
+
+def test_threadedErrorsNotReused():
+    """This test is for testing that failed threads are replaced by the next call"""
+    cached = threaded(_dummy_raiseException, cache=True, suppress_errors=True)
+    error = ValueError()
+
+    first = cached(error)
+    first.join()
+    assert first.status == 'Errored'
+    assert cached(error) is not first
+
+
+def test_threadedSharedCache():
+    """This test is for testing that a `ResultCache` honours its limits across calls"""
+    cache = ResultCache(maxsize=1)
+    cached = threaded(_Counter(), cache=cache)
+
+    first = cached(1)
+    cached(2)
+    assert len(cache) == 1
+    assert cached(1) is not first
+
+
+def test_threadedTokenNotKeyed():
+    """This test is for testing that cancellation tokens are left out of the cache key"""
+    cache = ResultCache()
+    cached = threaded(_dummy_tokenTarget, cache=cache)
+
+    first = cached(2)
+    assert cached(2) is first
+    assert cached(2, cancellation_token=CancellationToken()) is first
+    assert first.get_return_value() == 4
+    assert len(cache) == 1
+    assert cache.hits == 2
+
+
+# >>>>>>>>>> Concurrent Processing <<<<<<<<<< #
+def test_processingMemo():
+    """This test is for testing that repeated data entries are computed once"""
+    counter = _Counter()
+    dataset = [1, 2, 3] * 100
+    new = ConcurrentProcessing(
+        function=counter, dataset=dataset, max_threads=4, cache=True
+    )
+    new.start()
+
+    assert new.get_return_values() == [x * 2 for x in dataset]
+    assert counter.calls == 3
+
+
+def test_processorSharedCache():
+    """This test is for testing that jobs sharing a `ResultCache` reuse results"""
+    counter = _Counter()
+    cache = ResultCache()
+    double = processor(counter, cache=cache)
+
+    assert double([1, 2, 3]).get_return_values() == [2, 4, 6]
+    assert double([3, 2, 1]).get_return_values() == [6, 4, 2]
+    assert counter.calls == 3
+
+
+# >>>>>>>>>> Raising Exceptions <<<<<<<<<< #
+def test_raises_invalidMaxsize():
+    """This test should raise ValueError"""
+    with pytest.raises(ValueError):
+        ResultCache(maxsize=0)
+
+
+def test_raises_invalidTtl():
+    """This test should raise ValueError"""
+    with pytest.raises(ValueError):
+        ResultCache(ttl=0)
@@ -0,0 +1,239 @@
+import time
+import pytest
+from thread import (
+    CancellationToken,
+    ConcurrentProcessing,
+    Thread,
+    cancellation,
+    exceptions,
+    processor,
+    threaded,
+)
+
+
+# >>>>>>>>>> Dummy Functions <<<<<<<<<< #
+def _dummy_target_untilCancelled(cancellation_token: CancellationToken) -> int:
+    i = 0
+    while not cancellation_token.cancelled:
+        time.sleep(0.001)
+        i += 1
+    return i
+
+
+def _dummy_target_raiseIfCancelled(cancellation_token: CancellationToken):
+    while True:
+        time.sleep(0.001)
+        cancellation_token.raise_if_cancelled()
+
+
+def _dummy_dataProcessor(data_in: int, delay: float = 0) -> int:
+    time.sleep(delay)
+    return data_in
+
+
+# >>>>>>>>>> Token <<<<<<<<<< #
+def test_tokenCancel():
+    """This test is for testing that callbacks are invoked once and late callbacks run immediately"""
+    token = CancellationToken()
+    calls = []
+    token.add_callback(lambda: calls.append('early'))
+    assert not token.wait(0)
+
+    token.cancel()
+    token.cancel()
+    token.add_callback(lambda: calls.append('late'))
+    assert token.cancelled
+    assert token.wait(0)
+    assert calls == ['early', 'late']
+
+
+# >>>>>>>>>> Thread <<<<<<<<<< #
+def test_threadTokenInjected():
+    """This test is for testing that targets declaring `cancellation_token` receive the thread's token"""
+    new = Thread(target=_dummy_target_untilCancelled, daemon=True)
+    new.start()
+    time.sleep(0.01)
+    new.cancel()
+    new.join(1)
+    assert not new.is_alive()
+    assert new.status == 'Completed'
+    assert new.result > 0
+
+
+def test_threadTokenInspectedOnce(monkeypatch):
+    """This test is for testing that a target's signature is only inspected once across constructions"""
+
+    class Job:
+        def run(self, cancellation_token: CancellationToken) -> bool:
+            return cancellation_token.cancelled
+
+    calls = []
+    signature = cancellation.inspect.signature
+    monkeypatch.setattr(
+        cancellation.inspect,
+        'signature',
+        lambda target: calls.append(target) or signature(target),
+    )
+
+    job = Job()
+    first = Thread(target=job.run)
+    second = Thread(target=job.run)
+    assert first._kwargs['cancellation_token'] is first.cancellation_token
+    assert second._kwargs['cancellation_token'] is second.cancellation_token
+    assert len(calls) == 1
+
+
+def test_threadTokenShared():
+    """This test is for testing that a shared token cancels every thread"""
+    token = CancellationToken()
+    threads = [
+        Thread(
+            target=_dummy_target_untilCancelled,
+            cancellation_token=token,
+            daemon=True,
+        )
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    token.cancel()
+    for thread in threads:
+        thread.join(1)
+        assert thread.status == 'Completed'
+
+
+def test_threadCancelledStatus():
+    """This test is for testing that raising `CancelledError` marks the thread as cancelled"""
+    new = Thread(target=_dummy_target_raiseIfCancelled, daemon=True)
+    new.start()
+    new.cancel()
+    new.join(1)
+    assert new.status == 'Cancelled'
+    assert new.errors == []
+
+
+# >>>>>>>>>> Decorators <<<<<<<<<< #
+def test_threadedToken():
+    """This test is for testing that a token parsed to a decorated function is adopted by the thread"""
+
+    @threaded(daemon=True)
+    def _run(cancellation_token: CancellationToken) -> int:
+        return _dummy_target_untilCancelled(cancellation_token)
+
+    token = CancellationToken()
+    job = _run(cancellation_token=token)
+    assert job.cancellation_token is token
+    job.cancel()
+    assert token.cancelled
+    job.join(1)
+    assert job.status == 'Completed'
+
+
+def test_processorToken():
+    """This test is for testing that decorated processors stop once the token is cancelled"""
+
+    @processor(daemon=True, max_threads=2)
+    def _run(data_in: float, cancellation_token: CancellationToken) -> float:
+        time.sleep(data_in)
+        return data_in
+
+    token = CancellationToken()
+    job = _run([0.01] * 200, cancellation_token=token)
+    assert job.cancellation_token is token
+    time.sleep(0.05)
+    token.cancel()
+    job.join(1)
+    assert job.status == 'Cancelled'
+
+
+# >>>>>>>>>> Concurrent Processing <<<<<<<<<< #
+@pytest.mark.parametrize('schedule', ['static', 'dynamic'])
+def test_processingCancel(schedule):
+    """This test is for testing that cancelling stops within one entry and keeps partial results"""
+    dataset = list(range(0, 1000))
+    new = ConcurrentProcessing(
+        function=_dummy_dataProcessor,
+        dataset=dataset,
+        max_threads=4,
+        kwargs={'delay': 0.005},
+        schedule=schedule,
+        daemon=True,
+    )
+    new.start()
+    time.sleep(0.05)
+    new.cancel()
+    start = time.perf_counter()
+    new.join(1)
+    assert time.perf_counter() - start < 0.1
+    assert new.status == 'Cancelled'
+
+    results = new.get_return_values()
+    processed = [x for x in results if x is not None]
+    assert 0 < len(processed) < len(dataset)
+    assert sum(entry.completed for entry in new._threads) == len(processed)
+    assert all(results[x] == x for x in processed)
+
+
+def test_processingCancelStreamed():
+    """This test is for testing that cancelling a streamed dataset stops the feeder"""
+
+    def _source():
+        i = 0
+        while True:
+            yield i
+            i += 1
+
+    new = ConcurrentProcessing(
+        function=_dummy_dataProcessor,
+        dataset=_source(),
+        max_threads=2,
+        kwargs={'delay': 0.001},
+        daemon=True,
+    )
+    new.start()
+    time.sleep(0.05)
+    new.cancel()
+    new.join(1)
+    assert not new.is_alive()
+    assert new.status == 'Cancelled'
+    assert len(new.results) > 0
+
+
+def test_processingCancelledError():
+    """This test is for testing that `CancelledError` raised by the function stops its thread cleanly"""
+
+    def _run(data_in: int, cancellation_token: CancellationToken) -> int:
+        if data_in == 10:
+            cancellation_token.cancel()
+        cancellation_token.raise_if_cancelled()
+        return data_in
+
+    new = ConcurrentProcessing(
+        function=_run,
+        dataset=list(range(0, 100)),
+        max_threads=1,
+        daemon=True,
+    )
+    new.start()
+    new.join(1)
+    assert new.status == 'Cancelled'
+    assert new.get_return_values()[:10] == list(range(0, 10))
+
+
+# >>>>>>>>>> Raising Exceptions <<<<<<<<<< #
+def test_raises_cancelledResult():
+    """This test should raise CancelledError"""
+    new = Thread(target=_dummy_target_raiseIfCancelled, daemon=True)
+    new.start()
+    new.cancel()
+    with pytest.raises(exceptions.CancelledError):
+        new.get_return_value()
+
+
+def test_raises_raiseIfCancelled():
+    """This test should raise CancelledError"""
+    token = CancellationToken()
+    token.raise_if_cancelled()
+    token.cancel()
+    with pytest.raises(exceptions.CancelledError):
+        token.raise_if_cancelled()
@@ -1,6 +1,8 @@
 import time
+import array
 import pytest
-from thread import ConcurrentProcessing, exceptions
+import threading
+from thread import ConcurrentProcessing, ThreadPool, exceptions
 
 
 # >>>>>>>>>> Dummy Functions <<<<<<<<<< #
@@ -9,11 +11,25 @@ def _dummy_dataProcessor(data_in: int, delay: float = 0) -> int:
     return data_in
 
 
+def _dummy_sleepFor(delay: float) -> float:
+    time.sleep(delay)
+    return delay
+
+
 def _dummy_raiseException(x: Exception, delay: float = 0):
     time.sleep(delay)
     raise x
 
 
+class _dummy_countedSlices(list):
+    slices = 0
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            type(self).slices += 1
+        return list.__getitem__(self, key)
+
+
 # >>>>>>>>>> General Use <<<<<<<<<< #
 def test_threadsScaleDown():
     """This test is for testing if threads scale down `max_threads` when the dataset is lesser than the thread count"""
@@ -39,6 +55,580 @@ def test_threadsProcessing():
     assert new.get_return_values() == dataset
 
 
+@pytest.mark.parametrize('schedule', ['static', 'dynamic', 'guided'])
+def test_scheduleOrdering(schedule):
+    """This test is for testing that every schedule returns data in the `dataset` arrangement"""
+    dataset = list(range(0, 500))
+    new = ConcurrentProcessing(
+        function=_dummy_dataProcessor,
+        dataset=dataset,
+        max_threads=7,
+        schedule=schedule,
+        chunk_size=3,
+        daemon=True,
+    )
+    new.start()
+    assert new.get_return_values() == dataset
+    assert new.results == dataset
+
+
+def test_dynamicScheduleBalances():
+    """This test is for testing that a slow entry does not hold back the rest of its static chunk"""
+    dataset = [0.3] + [0.01] * 15
+    new = ConcurrentProcessing(
+        function=_dummy_sleepFor,
+        dataset=dataset,
+        max_threads=4,
+        schedule='dynamic',
+        chunk_size=1,
+        daemon=True,
+    )
+    new.start()
+
+    assert new.get_return_values() == dataset
+    assert sorted(entry.thread.result for entry in new._threads)[0] == 1
+
+
+@pytest.mark.parametrize('schedule', ['static', 'dynamic'])
+def test_processExecutor(schedule):
+    """This test is for testing that the process backend returns data in the `dataset` arrangement"""
+    dataset = list(range(0, 200))
+    new = ConcurrentProcessing(
+        function=_dummy_dataProcessor,
+        dataset=dataset,
+        max_threads=2,
+        kwargs={'delay': 0},
+        schedule=schedule,
+        executor='process',
+        daemon=True,
+    )
+    new.start()
+    assert new._executor is not None
+    assert new._executor._mp_context.get_start_method() != 'fork'
+    assert new.get_return_values() == dataset
+    assert all(entry.progress == 1 for entry in new._threads)
+
+
+def test_processExecutorNoParentSlicing():
+    """This test is for testing that the process backend leaves slicing to the worker processes"""
+    dataset = _dummy_countedSlices(range(0, 200))
+    new = ConcurrentProcessing(
+        function=_dummy_dataProcessor,
+        dataset=dataset,
+        max_threads=2,
+        chunk_size=20,
+        executor='process',
+        daemon=True,
+    )
+    probed = _dummy_countedSlices.slices
+    new.start()
+    assert new._executor is not None
+    assert new.get_return_values() == list(range(0, 200))
+    assert _dummy_countedSlices.slices == probed
+
+
+def test_processExecutorFallback():
+    """This test is for testing that unpicklable functions fall back to threads"""
+    dataset = list(range(0, 20))
+    new = ConcurrentProcessing(
+        function=lambda x: x * 2, dataset=dataset, executor='process', daemon=True
+    )
+    new.start()
+    assert new._executor is None
+    assert new.get_return_values() == [x * 2 for x in dataset]
+
+
+def test_processExecutorDatasetFallback():
+    """This test is for testing that unpicklable datasets fall back to threads"""
+    dataset = [threading.Lock() for _ in range(4)]
+    new = ConcurrentProcessing(
+        function=_dummy_dataProcessor,
+        dataset=dataset,
+        executor='process',
+        daemon=True,
+    )
+    new.start()
+    assert new._executor is None
+    assert new.get_return_values() == dataset
+
+
+def test_streamedProcessing():
+    """This test is for testing that iterables without `__len__` are streamed in order"""
+    new = ConcurrentProcessing(
+        function=_dummy_dataProcessor,
+        dataset=(x for x in range(0, 500)),
+        max_threads=4,
+        chunk_size=7,
+        daemon=True,
+    )
+    new.start()
+    assert len(new._threads) == 4
+    assert new.get_return_values() == list(range(0, 500))
+
+
+def test_streamedBackpressure():
+    """This test is for testing that streamed datasets are not read far ahead of the threads"""
+    pulled = []
+    processed = []
+
+    def _source():
+        for x in range(0, 50):
+            pulled.append(x)
+            yield x
+
+    def _slow(x: int) -> int:
+        time.sleep(0.002)
+        processed.append(x)
+        assert len(pulled) - len(processed) <= 2 + 2 + 1
+        return x
+
+    new = ConcurrentProcessing(
+        function=_slow, dataset=_source(), max_threads=2, queue_size=2, daemon=True
+    )
+    new.start()
+    assert new.get_return_values() == list(range(0, 50))
+
+
+def test_streamedEmpty():
+    """This test is for testing that an empty stream completes with no results"""
+    new = ConcurrentProcessing(
+        function=_dummy_dataProcessor, dataset=iter([]), daemon=True
+    )
+    new.start()
+    assert new.get_return_values() == []
+
+
+@pytest.mark.parametrize('schedule', ['static', 'dynamic', 'guided'])
+def test_iterResultsOrdered(schedule):
+    """This test is for testing that `iter_results()` yields in the `dataset` arrangement"""
+    dataset = list(range(0, 500))
+    new = ConcurrentProcessing(
+        function=_dummy_dataProcessor,
+        dataset=dataset,
+        max_threads=6,
+        schedule=schedule,
+        daemon=True,
+    )
+    new.start()
+    assert list(new.iter_results()) == dataset
+
+
+def test_iterResultsUnordered():
+    """This test is for testing that `iter_results(ordered = False)` yields every value"""
+    dataset = list(range(0, 500))
+    new = ConcurrentProcessing(
+        function=_dummy_dataProcessor, dataset=dataset, max_threads=6, daemon=True
+    )
+    new.start()
+    assert sorted(new.iter_results(ordered=False)) == dataset
+
+
+def test_iterResultsLazy():
+    """This test is for testing that `iter_results()` yields before every thread completes"""
+    dataset = [0.0] * 4 + [0.1] * 4
+    new = ConcurrentProcessing(
+        function=_dummy_sleepFor,
+        dataset=dataset,
+        max_threads=2,
+        chunk_size=1,
+        daemon=True,
+    )
+    new.start()
+    results = new.iter_results()
+    assert next(results) == 0.0
+    assert new.is_alive()
+    assert list(results) == dataset[1:]
+
+
+def test_resultsBuffer():
+    """This test is for testing that `results` hands back the same buffer without copying"""
+    new = ConcurrentProcessing(
+        function=_dummy_dataProcessor, dataset=list(range(0, 100)), daemon=True
+    )
+    new.start()
+    assert new.get_return_values() is new.results
+
+
+@pytest.mark.parametrize('executor', ['thread', 'process'])
+def test_typedOutput(executor):
+    """This test is for testing that `output_dtype` stores results in a typed `array`"""
+    dataset = list(range(0, 100))
+    new = ConcurrentProcessing(
+        function=_dummy_dataProcessor,
+        dataset=dataset,
+        max_threads=3,
+        output_dtype='q',
+        executor=executor,
+        daemon=True,
+    )
+    new.start()
+    results = new.get_return_values()
+    assert isinstance(results, array.array)
+    assert results.typecode == 'q'
+    assert results.tolist() == dataset
+    assert memoryview(results).nbytes == 8 * len(dataset)
+
+
+def test_typedStreamedOutput():
+    """This test is for testing that streamed datasets grow a typed `array`"""
+    new = ConcurrentProcessing(
+        function=float,
+        dataset=(x for x in range(0, 100)),
+        chunk_size=8,
+        output_dtype='d',
+        daemon=True,
+    )
+    new.start()
+    assert list(new.get_return_values()) == [float(x) for x in range(0, 100)]
+
+
+def _dummy_batchProcessor(data_in: list, offset: int = 0) -> list:
+    return [x + offset for x in data_in]
+
+
+@pytest.mark.parametrize('schedule', ['static', 'dynamic', 'guided'])
+def test_batchedProcessing(schedule):
+    """This test is for testing that batched functions receive lists and are reassembled in order"""
+    calls = []
+
+    def _run(data_in: list) -> list:
+        calls.append(len(data_in))
+        return _dummy_batchProcessor(data_in, 1)
+
+    dataset = list(range(0, 500))
+    new = ConcurrentProcessing(
+        function=_run,
+        dataset=dataset,
+        max_threads=4,
+        chunk_size=50,
+        schedule=schedule,
+        batched=True,
+        daemon=True,
+    )
+    new.start()
+    assert new.get_return_values() == [x + 1 for x in dataset]
+    assert sum(calls) == len(dataset)
+    assert len(calls) < len(dataset) // 10
+    assert sum(entry.thread.result for entry in new._threads) == len(dataset)
+
+
+def test_batchedProcessExecutor():
+    """This test is for testing that batched functions run in worker processes"""
+    dataset = list(range(0, 100))
+    new = ConcurrentProcessing(
+        function=_dummy_batchProcessor,
+        dataset=dataset,
+        max_threads=2,
+        kwargs={'offset': 2},
+        batched=True,
+        executor='process',
+        daemon=True,
+    )
+    new.start()
+    assert new.get_return_values() == [x + 2 for x in dataset]
+
+
+def test_sliceAutoDetected():
+    """This test is for testing that sliceable datasets are fetched one slice per batch"""
+
+    class _Sliceable(list):
+        slices = 0
+        indexes = 0
+
+        def __getitem__(self, key):
+            if isinstance(key, slice):
+                _Sliceable.slices += 1
+            else:
+                _Sliceable.indexes += 1
+            return list.__getitem__(self, key)
+
+    dataset = _Sliceable(range(0, 500))
+    new = ConcurrentProcessing(
+        function=_dummy_dataProcessor,
+        dataset=dataset,
+        max_threads=4,
+        chunk_size=50,
+        daemon=True,
+    )
+    new.start()
+    assert new.get_return_values() == list(range(0, 500))
+    assert _Sliceable.indexes == 0
+    assert _Sliceable.slices < len(dataset) // 10
+
+
+def test_customGetSlice():
+    """This test is for testing that a custom `_get_slice` replaces per-index `_get_value` calls"""
+    seen = []
+
+    def _get_slice(data, start: int, stop: int) -> list:
+        seen.append((start, stop))
+        return [x * 2 for x in range(start, stop)]
+
+    new = ConcurrentProcessing(
+        function=_dummy_dataProcessor,
+        dataset=None,
+        max_threads=2,
+        _length=100,
+        _get_value=lambda _, i: i * 2,
+        _get_slice=_get_slice,
+        batched=False,
+        daemon=True,
+    )
+    new.start()
+    assert new.get_return_values() == [x * 2 for x in range(0, 100)]
+    assert sum(stop - start for start, stop in seen) == 100
+
+
+def test_batchedSliceZeroCopy():
+    """This test is for testing that batched functions receive the dataset slice as is"""
+    received = []
+
+    def _run(data_in):
+        received.append(type(data_in))
+        return list(data_in)
+
+    dataset = array.array('i', range(0, 100))
+    new = ConcurrentProcessing(
+        function=_run,
+        dataset=dataset,
+        max_threads=2,
+        batched=True,
+        daemon=True,
+    )
+    new.start()
+    assert new.get_return_values() == list(range(0, 100))
+    assert set(received) == {array.array}
+
+
+@pytest.mark.parametrize('batched', [False, True])
+def test_progress(batched):
+    """This test is for testing that progress reaches 1 for every worker once completed"""
+    dataset = list(range(0, 500))
+    new = ConcurrentProcessing(
+        function=_dummy_batchProcessor if batched else _dummy_dataProcessor,
+        dataset=dataset,
+        max_threads=4,
+        batched=batched,
+        daemon=True,
+    )
+    new.start()
+    new.join()
+    assert new.progress == 1
+    assert new.progress_per_worker == [1, 1, 1, 1]
+    assert sum(entry.completed for entry in new._threads) == len(dataset)
+
+
+def test_progressPartial():
+    """This test is for testing that progress is reported while the workers are still running"""
+    new = ConcurrentProcessing(
+        function=_dummy_sleepFor,
+        dataset=[0.001] * 128 + [0.5],
+        max_threads=1,
+        chunk_size=129,
+        daemon=True,
+    )
+    new.start()
+    time.sleep(0.3)
+    assert 0 < new.progress < 1
+    assert 0 < new.progress_per_worker[0] < 1
+    new.join()
+    assert new.progress == 1
+
+
+def test_progressStatic():
+    """This test is for testing that static workers claim their whole chunk when spawned"""
+    new = ConcurrentProcessing(
+        function=_dummy_sleepFor,
+        dataset=[0.001] * 64 + [0.5],
+        max_threads=2,
+        chunk_size=4,
+        schedule='static',
+        daemon=True,
+    )
+    new.start()
+    assert [entry.claimed for entry in new._threads] == [33, 32]
+    time.sleep(0.2)
+    assert new.progress_per_worker[0] == 1
+    assert 0 < new.progress_per_worker[1] < 1
+    new.join()
+    assert new.progress_per_worker == [1, 1]
+    assert [entry.claimed for entry in new._threads] == [33, 32]
+
+
+def test_progressStreamed():
+    """This test is for testing that streamed progress is relative to the entries received"""
+    new = ConcurrentProcessing(
+        function=_dummy_dataProcessor,
+        dataset=iter(range(0, 100)),
+        max_threads=2,
+        chunk_size=10,
+        daemon=True,
+    )
+    new.start()
+    new.join()
+    assert new.progress == 1
+    assert sum(entry.claimed for entry in new._threads) == 100
+
+
+def test_statusCompleted():
+    """This test is for testing that the status reaches `Completed` with many short-lived threads"""
+    for _ in range(20):
+        new = ConcurrentProcessing(
+            function=_dummy_dataProcessor,
+            dataset=list(range(0, 64)),
+            max_threads=32,
+            daemon=True,
+        )
+        new.start()
+        new.join()
+        assert new.status == 'Completed'
+
+
+def test_joinTimeout():
+    """This test is for testing that `join()` returns once the timeout is exceeded"""
+    new = ConcurrentProcessing(
+        function=_dummy_sleepFor,
+        dataset=[0.5, 0.5],
+        max_threads=2,
+        daemon=True,
+    )
+    new.start()
+    start = time.perf_counter()
+    new.join(0.1)
+    assert time.perf_counter() - start < 0.4
+    assert new.is_alive()
+    new.join()
+    assert not new.is_alive()
+
+
+def test_waitFirstCompleted():
+    """This test is for testing that `wait()` returns after the first chunk thread exits"""
+    new = ConcurrentProcessing(
+        function=_dummy_sleepFor,
+        dataset=[0.01, 0.5],
+        max_threads=2,
+        daemon=True,
+    )
+    new.start()
+    done, not_done = new.wait(return_when='FIRST_COMPLETED')
+    assert done == [new._threads[0].thread]
+    assert not_done == [new._threads[1].thread]
+    assert done[0].result == 1
+
+
+def test_waitFirstException():
+    """This test is for testing that `wait()` returns after the first chunk thread errors"""
+    new = ConcurrentProcessing(
+        function=_dummy_raiseException,
+        dataset=[ValueError(), ValueError()],
+        max_threads=2,
+        kwargs={'delay': 0},
+        suppress_errors=True,
+        daemon=True,
+    )
+    new.start()
+    done, _ = new.wait(return_when='FIRST_EXCEPTION')
+    assert len(done) >= 1
+    assert done[0].status == 'Errored'
+
+
+def test_waitAllCompleted():
+    """This test is for testing that `wait()` returns every chunk thread once they all exit"""
+    new = ConcurrentProcessing(
+        function=_dummy_sleepFor,
+        dataset=[0.01, 0.05, 0.1],
+        max_threads=3,
+        daemon=True,
+    )
+    new.start()
+    done, not_done = new.wait(timeout=0.01)
+    assert len(done) + len(not_done) == 3
+    done, not_done = new.wait()
+    assert len(done) == 3
+    assert not_done == []
+
+
+@pytest.mark.parametrize(
+    'handling', [{'suppress_errors': True}, {'ignore_errors': [ValueError]}]
+)
+def test_erroredStatus(handling):
+    """This test is for testing that a job with failed chunks settles as `Errored` once every thread exits"""
+    new = ConcurrentProcessing(
+        function=_dummy_raiseException,
+        dataset=[ValueError()] * 20,
+        max_threads=4,
+        daemon=True,
+        **handling,
+    )
+    new.start()
+    new.join()
+    assert not new.is_alive()
+    assert new.status == 'Errored'
+
+
+def test_rejectedByPool():
+    """This test is for testing that chunk threads rejected by the pool are released"""
+    with ThreadPool(max_workers=1, queue_size=0, overflow='reject') as pool:
+        new = ConcurrentProcessing(
+            function=_dummy_dataProcessor,
+            dataset=list(range(0, 8)),
+            max_threads=4,
+            kwargs={'delay': 0.01},
+            pool=pool,
+        )
+        with pytest.raises(exceptions.QueueFullError):
+            new.start()
+
+        assert len(new._threads) == 1
+        new.join()
+        assert new._active_workers == 0
+        assert new.status == 'Errored'
+        assert isinstance(new.future.exception(), exceptions.QueueFullError)
+
+
+def test_shutdownPool():
+    """This test is for testing that a job on a shutdown pool settles without any chunk thread"""
+    pool = ThreadPool(max_workers=1)
+    pool.shutdown()
+    new = ConcurrentProcessing(
+        function=_dummy_dataProcessor, dataset=list(range(0, 8)), pool=pool
+    )
+    with pytest.raises(RuntimeError):
+        new.start()
+    assert new._threads == []
+    assert new.status == 'Errored'
+
+
+def test_asCompleted():
+    """This test is for testing that `as_completed()` yields chunk threads in completion order"""
+    new = ConcurrentProcessing(
+        function=_dummy_sleepFor,
+        dataset=[0.2, 0.1, 0.01],
+        max_threads=3,
+        daemon=True,
+    )
+    new.start()
+    completed = list(new.as_completed())
+    assert completed == [entry.thread for entry in reversed(new._threads)]
+    assert all(thread.status == 'Completed' for thread in completed)
+
+
+def test_killYielding():
+    """This test is for testing that a yielding kill waits for every chunk thread to exit"""
+    new = ConcurrentProcessing(
+        function=_dummy_sleepFor,
+        dataset=[0.01] * 1000,
+        max_threads=4,
+        daemon=True,
+    )
+    new.start()
+    time.sleep(0.05)
+    assert new.kill(True, 2)
+    assert not new.is_alive()
+    assert all(entry.thread.status == 'Killed' for entry in new._threads)
+    assert new.status == 'Killed'
+
+
 # >>>>>>>>>> Raising Exceptions <<<<<<<<<< #
 def test_raises_StillRunningError():
     """This test should raise ThreadStillRunningError"""
@@ -51,6 +641,22 @@ def test_raises_StillRunningError():
         _ = new.results
 
 
+def test_raises_restart():
+    """This test should raise InvalidStateTransitionError without spawning threads"""
+    dataset = list(range(0, 8))
+    new = ConcurrentProcessing(
+        function=_dummy_dataProcessor, dataset=dataset, args=[0], daemon=True
+    )
+    new.start()
+    new.join()
+    threads = list(new._threads)
+    with pytest.raises(exceptions.InvalidStateTransitionError):
+        new.start()
+    assert new._threads == threads
+    assert new.status == 'Completed'
+    assert new.results == dataset
+
+
 def test_raises_RunTimeError():
     """This test should raise a RunTimeError"""
     dataset = [RuntimeError()] * 8
@@ -60,3 +666,132 @@ def test_raises_RunTimeError():
     with pytest.raises(RuntimeError):
         new.start()
         new.join()
+
+
+def test_raises_invalidSchedule():
+    """This test should raise a ValueError"""
+    with pytest.raises(ValueError):
+        ConcurrentProcessing(
+            function=_dummy_dataProcessor,
+            dataset=[1, 2, 3],
+            schedule='random',  # type: ignore
+        )
+
+
+def test_raises_invalidChunkSize():
+    """This test should raise a ValueError"""
+    with pytest.raises(ValueError):
+        ConcurrentProcessing(
+            function=_dummy_dataProcessor,
+            dataset=[1, 2, 3],
+            schedule='dynamic',
+            chunk_size=0,
+        )
+
+
+def test_raises_processRunTimeError():
+    """This test should raise a RunTimeError from a worker process"""
+    dataset = [RuntimeError()] * 4
+    new = ConcurrentProcessing(
+        function=_dummy_raiseException,
+        dataset=dataset,
+        max_threads=2,
+        executor='process',
+        daemon=True,
+    )
+    with pytest.raises(RuntimeError):
+        new.start()
+        new.join()
+
+
+def test_raises_streamedSourceError():
+    """This test should raise the error from the streamed dataset"""
+
+    def _source():
+        yield 1
+        raise KeyError()
+
+    new = ConcurrentProcessing(
+        function=_dummy_dataProcessor, dataset=_source(), daemon=True
+    )
+    with pytest.raises(KeyError):
+        new.start()
+        new.get_return_values()
+
+
+def test_raises_streamedProcessExecutor():
+    """This test should raise a ValueError"""
+    with pytest.raises(ValueError):
+        ConcurrentProcessing(
+            function=_dummy_dataProcessor,
+            dataset=iter([1, 2, 3]),
+            executor='process',  # type: ignore
+        )
+
+
+def test_raises_iterResultsRunTimeError():
+    """This test should raise a RunTimeError while iterating"""
+    dataset = [RuntimeError()] * 8
+    new = ConcurrentProcessing(
+        function=_dummy_raiseException, dataset=dataset, args=[0.01], daemon=True
+    )
+    new.start()
+    with pytest.raises(RuntimeError):
+        list(new.iter_results())
+
+
+def test_raises_iterResultsNotInitializedError():
+    """This test should raise ThreadNotInitializedError"""
+    new = ConcurrentProcessing(function=_dummy_dataProcessor, dataset=[1, 2, 3])
+    with pytest.raises(exceptions.ThreadNotInitializedError):
+        next(new.iter_results())
+
+
+def test_raises_invalidOutputDtype():
+    """This test should raise a ValueError"""
+    with pytest.raises(ValueError):
+        ConcurrentProcessing(
+            function=_dummy_dataProcessor, dataset=[1, 2, 3], output_dtype='float64'
+        )
+
+
+def test_raises_batchedLengthMismatch():
+    """This test should raise a ValueError"""
+    new = ConcurrentProcessing(
+        function=lambda data_in: data_in[1:],
+        dataset=list(range(0, 10)),
+        batched=True,
+        daemon=True,
+    )
+    with pytest.raises(ValueError):
+        new.start()
+        new.join()
+
+
+def test_raises_progressNotInitializedError():
+    """This test should raise ThreadNotInitializedError"""
+    new = ConcurrentProcessing(function=_dummy_dataProcessor, dataset=[1, 2, 3])
+    with pytest.raises(exceptions.ThreadNotInitializedError):
+        _ = new.progress
+
+
+def test_raises_invalidReturnWhen():
+    """This test should raise a ValueError"""
+    new = ConcurrentProcessing(
+        function=_dummy_dataProcessor, dataset=[1, 2, 3], daemon=True
+    )
+    new.start()
+    with pytest.raises(ValueError):
+        new.wait(return_when='FIRST')
+
+
+def test_raises_asCompletedTimeoutError():
+    """This test should raise a TimeoutError"""
+    new = ConcurrentProcessing(
+        function=_dummy_sleepFor, dataset=[0.01, 0.5], max_threads=2, daemon=True
+    )
+    new.start()
+    completed = new.as_completed(timeout=0.1)
+    assert next(completed) is new._threads[0].thread
+    with pytest.raises(TimeoutError):
+        next(completed)
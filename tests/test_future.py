@@ -0,0 +1,169 @@
+import time
+import asyncio
+import pytest
+import concurrent.futures
+from thread import ConcurrentProcessing, Thread, ThreadPool, exceptions
+
+
+# >>>>>>>>>> Dummy Functions <<<<<<<<<< #
+def _dummy_target_raiseToPower(x: float, power: float, delay: float = 0):
+    time.sleep(delay)
+    return x**power
+
+
+def _dummy_raiseException(x: Exception, delay: float = 0):
+    time.sleep(delay)
+    raise x
+
+
+def _dummy_target_loop(stop: float):
+    while time.perf_counter() < stop:
+        time.sleep(0.001)
+
+
+# >>>>>>>>>> Thread <<<<<<<<<< #
+def test_futureResult():
+    """This test is for testing that the future blocks until the return value is available"""
+    new = Thread(target=_dummy_target_raiseToPower, args=[4, 2, 0.05], daemon=True)
+    new.start()
+    assert new.future.result(timeout=1) == 16
+    assert new.future.exception() is None
+
+
+def test_futureCallback():
+    """This test is for testing that done callbacks run once the thread exits"""
+    new = Thread(target=_dummy_target_raiseToPower, args=[2, 3], daemon=True)
+    resolved = []
+    new.future.add_done_callback(lambda future: resolved.append(future.result()))
+    new.start()
+    new.join()
+    assert resolved == [8]
+
+
+def test_futureException():
+    """This test is for testing that the future resolves with the error raised by the target"""
+    error = ValueError()
+    new = Thread(
+        target=_dummy_raiseException, args=[error], suppress_errors=False, daemon=True
+    )
+    new.start()
+    assert new.future.exception(timeout=1) is error
+
+
+def test_futureSuppressed():
+    """This test is for testing that suppressed errors resolve the future with None"""
+    new = Thread(
+        target=_dummy_raiseException,
+        args=[ValueError()],
+        suppress_errors=True,
+        daemon=True,
+    )
+    new.start()
+    assert new.future.result(timeout=1) is None
+
+
+def test_futureKilled():
+    """This test is for testing that killed threads resolve the future with ThreadNotRunningError"""
+    new = Thread(target=_dummy_target_loop, args=[time.perf_counter() + 5], daemon=True)
+    new.start()
+    new.kill(True)
+    assert isinstance(new.future.exception(timeout=1), exceptions.ThreadNotRunningError)
+
+
+def test_futureCancelledBeforeStart():
+    """This test is for testing that cancelling the future before starting skips the target"""
+    calls = []
+    new = Thread(target=lambda: calls.append(1), daemon=True)
+    assert new.future.cancel()
+    new.start()
+    new.join()
+    assert calls == []
+    assert new.status == 'Cancelled'
+
+
+def test_futuresWait():
+    """This test is for testing that futures work with `concurrent.futures` helpers"""
+    threads = [
+        Thread(target=_dummy_target_raiseToPower, args=[i, 2, 0.05 * i], daemon=True)
+        for i in range(1, 4)
+    ]
+    for thread in threads:
+        thread.start()
+
+    done, not_done = concurrent.futures.wait(
+        [thread.future for thread in threads],
+        return_when=concurrent.futures.FIRST_COMPLETED,
+    )
+    assert threads[0].future in done
+    assert [
+        future.result()
+        for future in concurrent.futures.as_completed(
+            [thread.future for thread in threads]
+        )
+    ] == [1, 4, 9]
+
+
+def test_futurePooled():
+    """This test is for testing that pooled threads resolve their future"""
+    with ThreadPool(max_workers=1) as pool:
+        running = pool.submit(_dummy_target_raiseToPower, args=[2, 2, 0.1])
+        queued = pool.submit(_dummy_target_raiseToPower, args=[3, 2])
+        queued.kill()
+        assert running.future.result(timeout=1) == 4
+        assert isinstance(queued.future.exception(), exceptions.ThreadNotRunningError)
+
+
+def test_futureAsyncio():
+    """This test is for testing that futures can be awaited with `asyncio.wrap_future`"""
+    new = Thread(target=_dummy_target_raiseToPower, args=[5, 2, 0.05], daemon=True)
+
+    async def _main():
+        new.start()
+        return await asyncio.wrap_future(new.future)
+
+    assert asyncio.run(_main()) == 25
+
+
+# >>>>>>>>>> Concurrent Processing <<<<<<<<<< #
+def test_processingFutures():
+    """This test is for testing that every chunk exposes a future and the job resolves with the results"""
+    dataset = list(range(0, 100))
+    new = ConcurrentProcessing(
+        function=lambda x: x * 2, dataset=dataset, max_threads=4, daemon=True
+    )
+    new.start()
+    assert new.future.result(timeout=1) == [x * 2 for x in dataset]
+    assert len(new.futures) == 4
+    assert sum(future.result() for future in new.futures) == len(dataset)
+
+
+def test_processingFutureStreamed():
+    """This test is for testing that the job future of a streamed dataset waits for the feeder"""
+    new = ConcurrentProcessing(
+        function=lambda x: x + 1, dataset=iter(range(0, 50)), max_threads=2
+    )
+    new.start()
+    assert new.future.result(timeout=1) == list(range(1, 51))
+    assert len(new.futures) == 3
+
+
+# >>>>>>>>>> Raising Exceptions <<<<<<<<<< #
+def test_raises_futureTimeout():
+    """This test should raise a TimeoutError"""
+    new = Thread(target=_dummy_target_raiseToPower, args=[4, 2, 0.5], daemon=True)
+    new.start()
+    with pytest.raises(concurrent.futures.TimeoutError):
+        new.future.result(timeout=0.01)
+
+
+def test_raises_processingFuture():
+    """This test should raise the error raised in a chunk thread"""
+    new = ConcurrentProcessing(
+        function=_dummy_raiseException,
+        dataset=[ValueError(), ValueError()],
+        max_threads=2,
+        daemon=True,
+    )
+    new.start()
+    with pytest.raises(ValueError):
+        new.future.result(timeout=1)
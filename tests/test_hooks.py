@@ -0,0 +1,177 @@
+import time
+import threading
+import pytest
+from thread import Thread, ThreadPool, exceptions, threaded
+
+
+# >>>>>>>>>> Dummy Functions <<<<<<<<<< #
+def _dummy_target_raiseToPower(x: float, power: float, delay: float = 0):
+    time.sleep(delay)
+    return x**power
+
+
+def _dummy_hook_slow(_):
+    time.sleep(0.2)
+
+
+def _dummy_hook_raise(x: Exception):
+    time.sleep(0.05)
+    raise x
+
+
+# >>>>>>>>>> Inline <<<<<<<<<< #
+def test_inlineTimings():
+    """This test is for testing that inline hooks are timed in the order they ran"""
+    new = Thread(target=_dummy_target_raiseToPower, args=[4, 2], daemon=True)
+    calls = []
+    new.add_hook(calls.append)
+    new.add_hook(_dummy_hook_slow)
+    new.start()
+    new.join()
+    assert new.wait_hooks(0)
+    assert calls == [16]
+    assert [name for name, _ in new.hook_timings] == ['append', '_dummy_hook_slow']
+    assert new.hook_timings[1][1] >= 0.2
+
+
+# >>>>>>>>>> Async <<<<<<<<<< #
+def test_asyncCompletesBeforeHooks():
+    """This test is for testing that async hooks do not delay the thread's completion"""
+    new = Thread(
+        target=_dummy_target_raiseToPower,
+        args=[4, 2],
+        hook_mode='async',
+        daemon=True,
+    )
+    new.add_hook(_dummy_hook_slow)
+    start = time.perf_counter()
+    new.start()
+    new.join()
+    assert time.perf_counter() - start < 0.1
+    assert new.status == 'Completed'
+    assert new.result == 16
+    assert not new.wait_hooks(0)
+
+    assert new.wait_hooks(1)
+    assert len(new.hook_timings) == 1
+
+
+def test_asyncOrdered():
+    """This test is for testing that async hooks of a thread run in order on one executor thread"""
+    seen = []
+    lock = threading.Lock()
+
+    def _hook(tag: str):
+        def hook(value):
+            with lock:
+                seen.append((tag, value, threading.current_thread().name))
+
+        hook.__name__ = tag
+        return hook
+
+    threads = []
+    for i in range(20):
+        new = Thread(
+            target=_dummy_target_raiseToPower,
+            args=[i, 1],
+            hook_mode='async',
+            daemon=True,
+        )
+        for tag in 'abc':
+            new.add_hook(_hook(tag))
+        threads.append(new)
+
+    for new in threads:
+        new.start()
+    for new in threads:
+        new.join()
+        assert new.wait_hooks(1)
+
+    for i in range(20):
+        entries = [entry for entry in seen if entry[1] == i]
+        assert [tag for tag, _, _ in entries] == ['a', 'b', 'c']
+        assert len({name for _, _, name in entries}) == 1
+        assert entries[0][2] != threads[i].name
+
+
+def test_asyncWithoutHooks():
+    """This test is for testing that threads without hooks report their hooks as done"""
+    new = Thread(
+        target=_dummy_target_raiseToPower,
+        args=[4, 2],
+        hook_mode='async',
+        daemon=True,
+    )
+    new.start()
+    new.join()
+    assert new.wait_hooks(0)
+
+
+def test_threadedHookMode():
+    """This test is for testing that `@threaded` parses the hook mode to the thread"""
+
+    @threaded(hook_mode='async', daemon=True)
+    def _run(x: int) -> int:
+        return x * 2
+
+    job = _run(2)
+    assert job.hook_mode == 'async'
+    assert job.get_return_value() == 4
+
+
+def test_asyncPooled():
+    """This test is for testing that pooled threads dispatch async hooks off the pool worker"""
+    hooked = []
+    with ThreadPool(max_workers=1) as pool:
+        pool.submit(_dummy_target_raiseToPower, args=[1, 1, 0.05])
+        job = pool.submit(_dummy_target_raiseToPower, args=[2, 3], hook_mode='async')
+        job.add_hook(hooked.append)
+        job.join()
+        assert job.wait_hooks(1)
+    assert hooked == [8]
+
+
+# >>>>>>>>>> Raising Exceptions <<<<<<<<<< #
+def test_raises_asyncHookError():
+    """This test should raise HookRuntimeError from `wait_hooks` only, once the async hooks have run"""
+    new = Thread(
+        target=_dummy_target_raiseToPower,
+        args=[4, 2],
+        hook_mode='async',
+        daemon=True,
+    )
+
+    def newhook(_: int):
+        raise RuntimeError()
+
+    new.add_hook(newhook)
+    new.start()
+    assert new.future.result(timeout=1) == 16
+    with pytest.raises(exceptions.HookRuntimeError):
+        new.wait_hooks(1)
+
+    new.join()
+    assert new.result == 16
+    assert new.future.exception() is None
+    assert isinstance(new.errors[0], exceptions.HookRuntimeError)
+
+
+def test_asyncHookErrorsSuppressed():
+    """This test is for testing that suppressed async hook errors are only recorded"""
+    new = Thread(
+        target=_dummy_target_raiseToPower,
+        args=[4, 2],
+        hook_mode='async',
+        suppress_errors=True,
+        daemon=True,
+    )
+    new.add_hook(lambda _: _dummy_hook_raise(RuntimeError()))
+    new.start()
+    assert new.wait_hooks(1)
+    assert isinstance(new.errors[0], exceptions.HookRuntimeError)
+
+
+def test_raises_hookMode():
+    """This test should raise ValueError"""
+    with pytest.raises(ValueError):
+        Thread(target=_dummy_target_raiseToPower, hook_mode='deferred')
@@ -0,0 +1,269 @@
+import time
+import threading
+import pytest
+from thread import (
+    ConcurrentProcessing,
+    Observer,
+    Thread,
+    ThreadPool,
+    add_observer,
+    exceptions,
+    remove_observer,
+)
+from thread.observers import InMemorySpanExporter, Observers, SpanObserver
+
+
+# >>>>>>>>>> Dummy Functions <<<<<<<<<< #
+def _dummy_target_raiseToPower(x: float, power: float, delay: float = 0):
+    time.sleep(delay)
+    return x**power
+
+
+def _dummy_raiseException(x: Exception):
+    raise x
+
+
+def _dummy_target_loop(stop: float):
+    while time.perf_counter() < stop:
+        time.sleep(0.001)
+
+
+class _RecordingObserver(Observer):
+    def __init__(self) -> None:
+        self.events = []
+        self._lock = threading.Lock()
+
+    def _record(self, *event) -> None:
+        with self._lock:
+            self.events.append(event)
+
+    def on_start(self, source):
+        self._record('start', source)
+
+    def on_finish(self, source):
+        self._record('finish', source)
+
+    def on_error(self, source, error):
+        self._record('error', source, error)
+
+    def on_kill(self, source):
+        self._record('kill', source)
+
+    def on_hook_error(self, source, error):
+        self._record('hook_error', source, error)
+
+    def on_chunk_progress(self, source, chunkStart, chunkEnd):
+        self._record('progress', source, chunkStart, chunkEnd)
+
+    def names(self, source=None):
+        return [event[0] for event in self.events if source in (None, event[1])]
+
+
+@pytest.fixture
+def globalObserver():
+    observer = _RecordingObserver()
+    add_observer(observer)
+    yield observer
+    remove_observer(observer)
+
+
+# >>>>>>>>>> Flag <<<<<<<<<< #
+def test_inactiveByDefault():
+    """This test is for testing that the flag is only set while observers are registered"""
+    assert not Observers.active
+    observer = _RecordingObserver()
+    add_observer(observer)
+    assert Observers.active
+    remove_observer(observer)
+    assert not Observers.active
+
+
+def test_instanceObserverReleased():
+    """This test is for testing that instance observers only hold the flag until the thread finishes"""
+    new = Thread(target=_dummy_target_raiseToPower, args=[2, 2, 0.05], daemon=True)
+    observer = _RecordingObserver()
+    new.add_observer(observer)
+    assert not Observers.active
+    new.start()
+    assert Observers.active
+    new.join()
+    assert not Observers.active
+    assert observer.names() == ['start', 'finish']
+
+    # Never started or rejected, nothing is left holding the flag
+    Thread(target=_dummy_target_raiseToPower).add_observer(observer)
+    ConcurrentProcessing(_dummy_target_raiseToPower, [1], args=[2]).add_observer(
+        observer
+    )
+    with ThreadPool(max_workers=1, queue_size=0, overflow='reject') as pool:
+        release = threading.Event()
+        assert pool.submit(release.wait).wait_for('Running', 1)
+        rejected = pool.create(_dummy_target_raiseToPower, args=[2, 2])
+        rejected.add_observer(observer)
+        with pytest.raises(exceptions.QueueFullError):
+            rejected.start()
+        release.set()
+    assert not Observers.active
+
+
+# >>>>>>>>>> Thread <<<<<<<<<< #
+def test_threadEvents(globalObserver):
+    """This test is for testing that errors, hook errors and kills are reported in order"""
+    errored = Thread(
+        target=_dummy_raiseException,
+        args=[ValueError()],
+        suppress_errors=True,
+        daemon=True,
+    )
+    hooked = Thread(target=_dummy_target_raiseToPower, args=[2, 2], daemon=True)
+    hooked.add_hook(lambda _: _dummy_raiseException(RuntimeError()))
+    killed = Thread(
+        target=_dummy_target_loop, args=[time.perf_counter() + 5], daemon=True
+    )
+
+    for new in (errored, hooked, killed):
+        new.start()
+    killed.kill(True)
+    errored.join()
+    with pytest.raises(exceptions.HookRuntimeError):
+        hooked.join()
+
+    assert globalObserver.names(errored) == ['start', 'error', 'finish']
+    assert globalObserver.names(hooked) == ['start', 'hook_error', 'finish']
+    assert globalObserver.names(killed) == ['start', 'kill', 'finish']
+
+
+def test_asyncHooksFinishLast(globalObserver):
+    """This test is for testing that `on_finish` waits for asynchronously invoked hooks"""
+    new = Thread(
+        target=_dummy_target_raiseToPower,
+        args=[2, 2],
+        hook_mode='async',
+        daemon=True,
+    )
+    new.add_hook(lambda _: _dummy_raiseException(RuntimeError()))
+    new.start()
+    with pytest.raises(exceptions.HookRuntimeError):
+        new.wait_hooks(1)
+    assert globalObserver.names(new) == ['start', 'hook_error', 'finish']
+
+
+def test_asyncModeWithoutHooks():
+    """This test is for testing that a thread in async hook mode without hooks finishes once"""
+    new = Thread(
+        target=_dummy_target_raiseToPower,
+        args=[2, 2],
+        hook_mode='async',
+        daemon=True,
+    )
+    observer = _RecordingObserver()
+    new.add_observer(observer)
+    new.start()
+    new.join()
+    assert new.wait_hooks(1)
+    assert observer.names() == ['start', 'finish']
+    assert Observers._attached == 0
+    assert not Observers.active
+
+
+def test_pooledQueuedKill(globalObserver):
+    """This test is for testing that killing a queued pooled thread is reported"""
+    with ThreadPool(max_workers=1) as pool:
+        pool.submit(_dummy_target_raiseToPower, args=[1, 1, 0.05])
+        queued = pool.submit(_dummy_target_raiseToPower, args=[2, 2])
+        queued.kill()
+    assert globalObserver.names(queued) == ['kill', 'finish']
+
+
+def test_observerErrorsSwallowed():
+    """This test is for testing that a raising observer does not break the thread"""
+
+    class _Broken(Observer):
+        def on_start(self, source):
+            raise RuntimeError()
+
+    new = Thread(target=_dummy_target_raiseToPower, args=[2, 2], daemon=True)
+    new.add_observer(_Broken())
+    new.start()
+    assert new.get_return_value() == 4
+
+
+# >>>>>>>>>> Concurrent Processing <<<<<<<<<< #
+def test_processingEvents():
+    """This test is for testing that jobs report batch progress covering the dataset"""
+    observer = _RecordingObserver()
+    new = ConcurrentProcessing(
+        function=lambda x: x, dataset=list(range(0, 100)), max_threads=4, chunk_size=5
+    )
+    new.add_observer(observer)
+    new.start()
+    new.join()
+
+    names = observer.names(new)
+    assert names[0] == 'start' and names[-1] == 'finish'
+    progress = sorted(
+        (event[2], event[3]) for event in observer.events if event[0] == 'progress'
+    )
+    assert sum(end - start for start, end in progress) == 100
+    assert not Observers.active
+
+
+def test_processingError():
+    """This test is for testing that failed chunk threads are reported on the job"""
+    observer = _RecordingObserver()
+    new = ConcurrentProcessing(
+        function=_dummy_raiseException,
+        dataset=[ValueError()],
+        max_threads=1,
+        suppress_errors=True,
+    )
+    new.add_observer(observer)
+    new.start()
+    new.join()
+    assert observer.names(new) == ['start', 'error', 'finish']
+
+
+# >>>>>>>>>> Spans <<<<<<<<<< #
+def test_spanExporter():
+    """This test is for testing that spans are exported with their status and events"""
+    exporter = InMemorySpanExporter()
+    observer = SpanObserver(exporter)
+    add_observer(observer)
+    try:
+        ok = Thread(target=_dummy_target_raiseToPower, args=[2, 2], name='spanOk')
+        failed = Thread(
+            target=_dummy_raiseException, args=[ValueError()], suppress_errors=True
+        )
+        job = ConcurrentProcessing(
+            function=lambda x: x, dataset=list(range(0, 20)), max_threads=2
+        )
+        for source in (ok, failed, job):
+            source.start()
+            source.join()
+    finally:
+        remove_observer(observer)
+
+    spans = exporter.get_finished_spans()
+    by_name = {span.attributes.get('thread.name'): span for span in spans}
+    assert by_name['spanOk'].status == 'OK'
+    assert by_name['spanOk'].end_time >= by_name['spanOk'].start_time
+
+    failed_span = by_name[failed.name]
+    assert failed_span.status == 'ERROR'
+    assert failed_span.events[0][0] == 'exception'
+    assert failed_span.events[0][2]['exception.type'] == 'ValueError'
+
+    job_span = [span for span in spans if span.name == 'ConcurrentProcessing.run']
+    assert len(job_span) == 1
+    assert job_span[0].status == 'OK'
+    assert all(name == 'batch' for name, _, _ in job_span[0].events)
+
+    exporter.clear()
+    assert exporter.get_finished_spans() == []
+
+
+# >>>>>>>>>> Raising Exceptions <<<<<<<<<< #
+def test_raises_removeObserver():
+    """This test should raise ValueError"""
+    with pytest.raises(ValueError):
+        remove_observer(Observer())
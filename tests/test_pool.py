@@ -0,0 +1,325 @@
+import time
+import threading
+import pytest
+from thread import ThreadPool, ConcurrentProcessing, processor, threaded, exceptions
+
+
+# >>>>>>>>>> Dummy Functions <<<<<<<<<< #
+def _dummy_target_raiseToPower(x: float, power: float, delay: float = 0):
+    time.sleep(delay)
+    return x**power
+
+
+def _dummy_raiseException(x: Exception, delay: float = 0):
+    time.sleep(delay)
+    raise x
+
+
+# >>>>>>>>>> General Use <<<<<<<<<< #
+def test_submitResult():
+    """This test is for testing that pooled threads return like `Thread`"""
+    with ThreadPool(max_workers=2) as pool:
+        job = pool.submit(_dummy_target_raiseToPower, args=[4], kwargs={'power': 2})
+        assert job.get_return_value() == 16
+        assert job.status == 'Completed'
+        assert not job.is_alive()
+
+
+def test_workerReuse():
+    """This test is for testing that sequential jobs reuse the same worker"""
+    with ThreadPool(max_workers=4) as pool:
+        idents = set()
+        for _ in range(10):
+            pool.submit(lambda: idents.add(threading.get_ident())).join()
+        assert len(idents) == 1
+        assert pool.size == 1
+
+
+def test_bounded():
+    """This test is for testing that the pool never grows past `max_workers`"""
+    with ThreadPool(max_workers=2) as pool:
+        jobs = [pool.submit(time.sleep, args=[0.05]) for _ in range(6)]
+        assert pool.size == 2
+        assert pool.pending > 0
+        for job in jobs:
+            job.join()
+
+
+def test_idleShrink():
+    """This test is for testing that idle workers exit after `idle_timeout`"""
+    pool = ThreadPool(max_workers=2, idle_timeout=0.05)
+    pool.submit(time.sleep, args=[0]).join()
+    time.sleep(0.3)
+    assert pool.size == 0
+
+    assert pool.submit(_dummy_target_raiseToPower, args=[2, 2]).get_return_value() == 4
+    pool.shutdown()
+
+
+def test_hooks():
+    """This test is for testing that hooks run on pooled threads"""
+    hooked = []
+    with ThreadPool() as pool:
+        job = pool.create(_dummy_target_raiseToPower, args=[2, 3])
+        job.add_hook(hooked.append)
+        job.start()
+        job.join()
+    assert hooked == [8]
+
+
+def test_suppressErrors():
+    """This test is for testing that errors are suppressed properly"""
+    with ThreadPool() as pool:
+        job = pool.submit(
+            _dummy_raiseException, args=[ValueError()], suppress_errors=True
+        )
+        job.join()
+        assert job.status == 'Errored'
+        assert isinstance(job.errors[0], ValueError)
+
+
+def test_killQueued():
+    """This test is for testing that queued threads are dropped when killed"""
+    with ThreadPool(max_workers=1) as pool:
+        blocker = pool.submit(time.sleep, args=[0.1])
+        queued = pool.submit(_dummy_target_raiseToPower, args=[2, 2])
+        assert queued.status == 'Queued'
+        assert queued.kill()
+        assert queued.status == 'Killed'
+        blocker.join()
+
+
+def test_concurrentProcessingPool():
+    """This test is for testing that `ConcurrentProcessing` runs chunks on a pool"""
+    dataset = list(range(0, 100))
+    with ThreadPool(max_workers=4) as pool:
+        for _ in range(3):
+            new = ConcurrentProcessing(
+                function=lambda x: x * 2, dataset=dataset, max_threads=4, pool=pool
+            )
+            new.start()
+            assert new.get_return_values() == [x * 2 for x in dataset]
+        assert pool.size <= 4
+
+
+def test_processorPool():
+    """This test is for testing that `@processor` submits to a pool"""
+    with ThreadPool(max_workers=2) as pool:
+
+        @processor(pool=pool)
+        def _run(x: int) -> int:
+            return x + 1
+
+        assert _run([1, 2, 3]).get_return_values() == [2, 3, 4]
+
+
+# >>>>>>>>>> Bounded Queue <<<<<<<<<< #
+def test_overflowBlock():
+    """This test is for testing that submitting to a full queue waits for space"""
+    with ThreadPool(max_workers=1, queue_size=1) as pool:
+        pool.submit(time.sleep, args=[0.1])
+        pool.submit(time.sleep, args=[0])
+        start = time.perf_counter()
+        pool.submit(time.sleep, args=[0]).join()
+        assert time.perf_counter() - start >= 0.05
+        assert pool.pending <= 1
+
+
+def test_overflowCallerRuns():
+    """This test is for testing that a full pool runs the thread in the submitting thread"""
+    with ThreadPool(max_workers=1, queue_size=0, overflow='caller_runs') as pool:
+        pool.submit(time.sleep, args=[0.1])
+        job = pool.submit(threading.get_ident)
+        assert job.status == 'Completed'
+        assert job.result == threading.get_ident()
+
+
+def test_threadedMaxConcurrency():
+    """This test is for testing that `@threaded` calls beyond the limit queue instead of spawning"""
+    running = []
+    peak = []
+    lock = threading.Lock()
+
+    @threaded(max_concurrency=2)
+    def _run(delay: float) -> None:
+        with lock:
+            running.append(1)
+            peak.append(len(running))
+        time.sleep(delay)
+        with lock:
+            running.pop()
+
+    before = threading.active_count()
+    jobs = [_run(0.02) for _ in range(10)]
+    assert threading.active_count() - before <= 2
+    for job in jobs:
+        job.join()
+    assert max(peak) == 2
+    assert all(job.status == 'Completed' for job in jobs)
+
+
+def test_idleChurn():
+    """This test is for testing that idle reservations stay consistent as workers time out"""
+    pool = ThreadPool(
+        max_workers=2, idle_timeout=0.001, queue_size=1, overflow='reject'
+    )
+
+    def _churn() -> None:
+        for i in range(100):
+            try:
+                pool.submit(time.sleep, args=[0]).join()
+            except exceptions.QueueFullError:
+                pass
+            time.sleep(0.001 * (i % 3))
+
+    submitters = [threading.Thread(target=_churn) for _ in range(4)]
+    for submitter in submitters:
+        submitter.start()
+    for submitter in submitters:
+        submitter.join()
+    assert pool._idle >= 0
+
+    release = threading.Event()
+    accepted = []
+    for _ in range(50):
+        try:
+            accepted.append(pool.submit(release.wait))
+        except exceptions.QueueFullError:
+            pass
+    assert len(accepted) <= 3
+    release.set()
+    for job in accepted:
+        job.join()
+    assert pool._idle >= 0
+    pool.shutdown()
+
+
+# >>>>>>>>>> Priority <<<<<<<<<< #
+def test_priorityOrder():
+    """This test is for testing that queued threads with a higher priority run first"""
+    order = []
+    release = threading.Event()
+    with ThreadPool(max_workers=1) as pool:
+        assert pool.submit(release.wait).wait_for('Running', 1)
+        jobs = [
+            pool.submit(order.append, args=[priority], priority=priority)
+            for priority in (0, 5, 1, 5, 10)
+        ]
+        release.set()
+        for job in jobs:
+            job.join()
+    assert order == [10, 5, 5, 1, 0]
+
+
+def test_deadlineDropped():
+    """This test is for testing that threads still queued past their deadline are dropped"""
+    with ThreadPool(max_workers=1) as pool:
+        pool.submit(time.sleep, args=[0.1])
+        expired = pool.submit(_dummy_target_raiseToPower, args=[2, 2], deadline=0.01)
+        kept = pool.submit(_dummy_target_raiseToPower, args=[2, 3], deadline=5)
+        expired.join()
+        assert expired.status == 'Cancelled'
+        assert kept.get_return_value() == 8
+        with pytest.raises(exceptions.CancelledError):
+            _ = expired.result
+
+    assert pool.stats.expired == 1
+    assert pool.stats.started == 2
+
+
+def test_queueStats():
+    """This test is for testing that queue depth and wait times are recorded"""
+    with ThreadPool(max_workers=1) as pool:
+        jobs = [pool.submit(time.sleep, args=[0.02]) for _ in range(4)]
+        for job in jobs:
+            job.join()
+
+    stats = pool.stats
+    assert stats.submitted == stats.started == 4
+    assert stats.depth == 0
+    assert stats.peak_depth >= 2
+    assert stats.max_wait >= 0.04
+    assert stats.mean_wait is not None and stats.mean_wait <= stats.max_wait
+    assert stats.as_dict()['peak_depth'] == stats.peak_depth
+
+
+def test_threadedPriority():
+    """This test is for testing that `@threaded` functions sharing a pool are prioritised"""
+    order = []
+    release = threading.Event()
+    with ThreadPool(max_workers=1) as pool:
+
+        @threaded(pool=pool)
+        def _batch() -> None:
+            order.append('batch')
+
+        @threaded(pool=pool, priority=10)
+        def _urgent() -> None:
+            order.append('urgent')
+
+        assert pool.submit(release.wait).wait_for('Running', 1)
+        jobs = [_batch(), _batch(), _urgent()]
+        release.set()
+        for job in jobs:
+            job.join()
+    assert order == ['urgent', 'batch', 'batch']
+
+
+# >>>>>>>>>> Raising Exceptions <<<<<<<<<< #
+def test_raises_RunTimeError():
+    """This test should raise a RunTimeError"""
+    with ThreadPool() as pool:
+        job = pool.submit(_dummy_raiseException, args=[RuntimeError()])
+        with pytest.raises(RuntimeError):
+            job.join()
+
+
+def test_raises_submitAfterShutdown():
+    """This test should raise a RuntimeError"""
+    pool = ThreadPool()
+    pool.shutdown()
+    with pytest.raises(RuntimeError):
+        pool.submit(_dummy_target_raiseToPower, args=[2, 2])
+
+
+def test_raises_notRunningError():
+    """This test should raise ThreadNotRunningError"""
+    with ThreadPool() as pool:
+        job = pool.create(_dummy_target_raiseToPower, args=[2, 2])
+        with pytest.raises(exceptions.ThreadNotRunningError):
+            job.join()
+
+
+def test_raises_queueFullError():
+    """This test should raise QueueFullError"""
+    with ThreadPool(max_workers=1, queue_size=0, overflow='reject') as pool:
+        pool.submit(time.sleep, args=[0.1])
+        job = pool.create(_dummy_target_raiseToPower, args=[2, 2])
+        with pytest.raises(exceptions.QueueFullError):
+            job.start()
+        assert job.status == 'Idle'
+
+
+def test_raises_queueSizeWithoutLimit():
+    """This test should raise ValueError"""
+    with pytest.raises(ValueError):
+        threaded(_dummy_target_raiseToPower, queue_size=4)
+
+
+def test_raises_invalidOverflow():
+    """This test should raise ValueError"""
+    with pytest.raises(ValueError):
+        ThreadPool(overflow='drop')
+
+
+def test_raises_priorityWithoutPool():
+    """This test should raise ValueError"""
+    with pytest.raises(ValueError):
+        threaded(_dummy_target_raiseToPower, priority=1)
+
+
+def test_raises_negativeDeadline():
+    """This test should raise ValueError"""
+    with ThreadPool() as pool:
+        with pytest.raises(ValueError):
+            pool.submit(_dummy_target_raiseToPower, args=[2, 2], deadline=-1)
@@ -0,0 +1,109 @@
+import gc
+import time
+import threading
+import pytest
+from thread import Thread
+from thread.thread import Threads
+from thread._registry import ThreadRegistry
+
+
+# >>>>>>>>>> Dummy Functions <<<<<<<<<< #
+def _dummy_target_wait(event: threading.Event):
+    event.wait(5)
+
+
+def _dummy_raiseException(x: Exception):
+    raise x
+
+
+def _dummy_target_loop(stop: float):
+    while time.perf_counter() < stop:
+        time.sleep(0.001)
+
+
+# >>>>>>>>>> General Use <<<<<<<<<< #
+def test_registeredWhileRunning():
+    """This test is for testing that running threads are indexed by ident, name and status"""
+    event = threading.Event()
+    new = Thread(
+        target=_dummy_target_wait, args=[event], name='registryThread', daemon=True
+    )
+    new.start()
+    while new.status != 'Running':
+        time.sleep(0.001)
+
+    assert new in Threads
+    assert Threads.get(new.ident) is new
+    assert Threads.by_name('registryThread') == [new]
+    assert new in Threads.by_status('Running')
+
+    event.set()
+    new.join()
+    assert new not in Threads
+    assert Threads.by_name('registryThread') == []
+    assert new not in Threads.by_status('Running')
+
+
+@pytest.mark.parametrize(
+    'target, args',
+    [
+        (_dummy_raiseException, [ValueError()]),
+        (_dummy_target_loop, []),
+    ],
+)
+def test_removedOnEveryExit(target, args):
+    """This test is for testing that errored and killed threads are unregistered"""
+    if target is _dummy_target_loop:
+        args = [time.perf_counter() + 5]
+    new = Thread(target=target, args=args, suppress_errors=True, daemon=True)
+    new.start()
+    if target is _dummy_target_loop:
+        new.kill(True)
+    new.join()
+    assert new.status in ('Errored', 'Killed')
+    assert new not in Threads
+
+
+def test_registryDoesNotGrow():
+    """This test is for testing that the registry returns to its size after many short threads"""
+    before = len(Threads)
+    threads = [
+        Thread(target=_dummy_raiseException, args=[ValueError()], suppress_errors=True)
+        for _ in range(100)
+    ]
+    threads += [Thread(target=_dummy_target_loop, args=[0]) for _ in range(100)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(Threads) == before
+
+
+def test_weakReferences():
+    """This test is for testing that garbage collected threads drop out of the registry"""
+    registry = ThreadRegistry()
+    new = Thread(target=_dummy_target_loop, args=[0], name='collectedThread')
+    registry.add(new)
+    assert len(registry) == 1
+
+    del new
+    gc.collect()
+    assert len(registry) == 0
+    assert registry.by_name('collectedThread') == []
+    assert registry.by_status('Idle') == []
+
+
+def test_statusIndex():
+    """This test is for testing that status changes move threads between indexes"""
+    registry = ThreadRegistry()
+    new = Thread(target=_dummy_target_loop, args=[0])
+    registry.add(new)
+    registry.set_status(new, 'Kill Scheduled')
+    assert new.status == 'Kill Scheduled'
+    assert registry.by_status('Idle') == []
+    assert registry.by_status('Kill Scheduled') == [new]
+
+    registry.discard(new)
+    registry.set_status(new, 'Killed')
+    assert new.status == 'Killed'
+    assert registry.by_status('Killed') == []
@@ -0,0 +1,109 @@
+import time
+import pytest
+from thread import Settings, Thread, graceful_shutdown
+
+
+# >>>>>>>>>> Dummy Functions <<<<<<<<<< #
+def _dummy_target_loop(stop: float):
+    while time.perf_counter() < stop:
+        time.sleep(0.001)
+
+
+def _dummy_target_shielded(stop: float):
+    while time.perf_counter() < stop:
+        try:
+            time.sleep(0.001)
+        except SystemExit:
+            pass
+
+
+# >>>>>>>>>> General Use <<<<<<<<<< #
+def test_drainWithinGracePeriod():
+    """This test is for testing that threads finishing within the grace period are left to complete"""
+    new = Thread(
+        target=_dummy_target_loop, args=[time.perf_counter() + 0.1], daemon=True
+    )
+    new.start()
+    survivors = graceful_shutdown(grace_period=1, timeout=2)
+    assert new not in survivors
+    assert new.status == 'Completed'
+
+
+def test_escalateKill():
+    """This test is for testing that threads still running after the grace period are killed"""
+    threads = [
+        Thread(target=_dummy_target_loop, args=[time.perf_counter() + 5], daemon=True)
+        for _ in range(20)
+    ]
+    for thread in threads:
+        thread.start()
+
+    start = time.perf_counter()
+    survivors = graceful_shutdown(grace_period=0.05, timeout=2, escalation='kill')
+    assert time.perf_counter() - start < 2
+    assert not any(thread in survivors for thread in threads)
+    assert all(thread.status == 'Killed' for thread in threads)
+
+
+def test_escalateAbandon():
+    """This test is for testing that the abandon policy reports threads without killing them"""
+    new = Thread(
+        target=_dummy_target_loop, args=[time.perf_counter() + 0.5], daemon=True
+    )
+    new.start()
+    survivors = graceful_shutdown(grace_period=0.05, timeout=0.1, escalation='abandon')
+    assert new in survivors
+    assert new.status == 'Running'
+    new.join()
+
+
+def test_reportSurvivors():
+    """This test is for testing that threads which ignore the kill are reported"""
+    new = Thread(
+        target=_dummy_target_shielded, args=[time.perf_counter() + 0.5], daemon=True
+    )
+    new.start()
+    survivors = graceful_shutdown(grace_period=0, timeout=0.1)
+    assert new in survivors
+    new.join()
+
+
+def test_shutdownPolicy():
+    """This test is for testing that the shutdown policy is stored in Settings"""
+    Settings.set_shutdown_policy(grace_period=2, timeout=10, escalation='abandon')
+    assert Settings.SHUTDOWN_GRACE_PERIOD == 2
+    assert Settings.SHUTDOWN_TIMEOUT == 10
+    assert Settings.SHUTDOWN_ESCALATION == 'abandon'
+
+    Settings.set_shutdown_policy(grace_period=1, timeout=5, escalation='kill')
+
+
+# >>>>>>>>>> Raising Exceptions <<<<<<<<<< #
+def test_raises_negativeGracePeriod():
+    """This test should raise a ValueError"""
+    with pytest.raises(ValueError):
+        Settings.set_shutdown_policy(grace_period=-1)
+
+
+def test_raises_gracePeriodExceedsTimeout():
+    """This test should raise a ValueError"""
+    with pytest.raises(ValueError):
+        Settings.set_shutdown_policy(grace_period=10, timeout=1)
+
+
+def test_raises_invalidEscalation():
+    """This test should raise a ValueError"""
+    with pytest.raises(ValueError):
+        Settings.set_shutdown_policy(escalation='terminate')  # type: ignore
+
+
+def test_raises_shutdownInvalidEscalation():
+    """This test should raise a ValueError before any thread is cancelled"""
+    new = Thread(
+        target=_dummy_target_loop, args=[time.perf_counter() + 0.2], daemon=True
+    )
+    new.start()
+    with pytest.raises(ValueError):
+        graceful_shutdown(escalation='terminate')  # type: ignore
+    assert not new.cancellation_token.cancelled
+    new.join()
@@ -0,0 +1,110 @@
+import time
+import pytest
+from thread import ConcurrentProcessing, Settings, Thread, ThreadPool
+
+
+# >>>>>>>>>> Dummy Functions <<<<<<<<<< #
+def _dummy_target_sleep(delay: float):
+    time.sleep(delay)
+
+
+def _dummy_target_spin(duration: float):
+    # A fixed amount of CPU time, however long the thread is descheduled for
+    stop = time.thread_time() + duration
+    while time.thread_time() < stop:
+        pass
+
+
+def _dummy_dataProcessor(data_in: int, delay: float = 0) -> int:
+    time.sleep(delay)
+    return data_in
+
+
+@pytest.fixture
+def statsDisabled():
+    Settings.set_stats(False)
+    yield
+    Settings.set_stats(True)
+
+
+# >>>>>>>>>> Thread <<<<<<<<<< #
+def test_threadTimestamps():
+    """This test is for testing that a thread records ordered timestamps and its run time"""
+    new = Thread(target=_dummy_target_sleep, args=[0.05], daemon=True)
+    new.add_hook(lambda _: time.sleep(0.02))
+    new.start()
+    new.join()
+
+    stats = new.stats
+    assert stats.created <= stats.started <= stats.finished <= stats.hooks_done
+    assert stats.run_time >= 0.05
+    assert stats.hook_time >= 0.02
+    assert stats.as_dict()['run_time'] == stats.run_time
+
+
+def test_threadCpuTime():
+    """This test is for testing that CPU time counts busy targets but not sleeping ones"""
+    busy = Thread(target=_dummy_target_spin, args=[0.05], daemon=True)
+    idle = Thread(target=_dummy_target_sleep, args=[0.1], daemon=True)
+    busy.start()
+    idle.start()
+    busy.join()
+    idle.join()
+
+    assert busy.stats.cpu_time >= 0.05
+    assert busy.stats.cpu_time > idle.stats.cpu_time
+
+
+def test_pooledQueueWait():
+    """This test is for testing that time queued on a pool is recorded as queue wait"""
+    with ThreadPool(max_workers=1) as pool:
+        pool.submit(_dummy_target_sleep, args=[0.1])
+        queued = pool.submit(_dummy_target_sleep, args=[0])
+        queued.join()
+    assert queued.stats.queue_wait >= 0.05
+
+
+def test_threadDisabled(statsDisabled):
+    """This test is for testing that nothing is recorded while stats are disabled"""
+    new = Thread(target=_dummy_target_sleep, args=[0], daemon=True)
+    new.start()
+    new.join()
+    assert not new.stats.enabled
+    assert all(value is None for value in new.stats.as_dict().values())
+
+
+# >>>>>>>>>> Concurrent Processing <<<<<<<<<< #
+def test_processingStats():
+    """This test is for testing that a job records per worker items and throughput"""
+    dataset = list(range(0, 200))
+    new = ConcurrentProcessing(
+        function=_dummy_dataProcessor,
+        dataset=dataset,
+        max_threads=4,
+        kwargs={'delay': 0.001},
+        daemon=True,
+    )
+    new.start()
+    new.join()
+
+    stats = new.stats
+    assert stats.started <= stats.finished
+    assert stats.items == len(dataset)
+    assert len(stats.workers) == 4
+    assert sum(worker.items for worker in stats.workers) == len(dataset)
+    assert all(worker.items_per_second > 0 for worker in stats.workers)
+    assert all(worker.queue_wait >= 0 for worker in stats.workers)
+    assert stats.items_per_second > 0
+    assert len(stats.as_dict()['workers']) == 4
+
+
+def test_processingDisabled(statsDisabled):
+    """This test is for testing that jobs skip stats while they are disabled"""
+    new = ConcurrentProcessing(
+        function=_dummy_dataProcessor, dataset=list(range(0, 10)), max_threads=2
+    )
+    new.start()
+    new.join()
+    assert new.stats.workers == []
+    assert new.stats.items_per_second is None
+    assert new.stats.cpu_time is None
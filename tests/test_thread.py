@@ -1,6 +1,7 @@
 import time
 import pytest
-from thread import Thread, exceptions
+from thread import Thread, exceptions, kill_all
+from thread._types import ThreadState
 
 
 # >>>>>>>>>> Dummy Functions <<<<<<<<<< #
@@ -94,7 +95,161 @@ def test_threadKilling():
     assert len(stdout) != 4
 
 
+def _dummy_target_loop(stop: float):
+    while time.perf_counter() < stop:
+        time.sleep(0.001)
+
+
+def test_threadKillingLatency():
+    """This test is for testing that a yielding kill returns as soon as the thread exits"""
+    new = Thread(target=_dummy_target_loop, args=[time.perf_counter() + 5], daemon=True)
+    new.start()
+    start = time.perf_counter()
+    assert new.kill(True)
+    assert time.perf_counter() - start < 0.5
+    assert new.status == 'Killed'
+    assert not new.is_alive()
+
+
+def test_killAll():
+    """This test is for testing that `kill_all()` kills every running thread and skips finished ones"""
+    stop = time.perf_counter() + 5
+    threads = [
+        Thread(target=_dummy_target_loop, args=[stop], daemon=True) for _ in range(50)
+    ]
+    finished = Thread(target=_dummy_target_raiseToPower, args=[2, 2], daemon=True)
+    for thread in [*threads, finished]:
+        thread.start()
+    finished.join()
+
+    start = time.perf_counter()
+    assert kill_all([*threads, finished], timeout=2) == []
+    assert time.perf_counter() - start < 2
+    assert all(thread.status == 'Killed' for thread in threads)
+    assert finished.status == 'Completed'
+
+
+def test_killAllTimeout():
+    """This test is for testing that `kill_all()` reports threads which do not exit in time"""
+
+    def _dummy_target_shielded(stop: float):
+        while time.perf_counter() < stop:
+            try:
+                time.sleep(0.001)
+            except SystemExit:
+                pass
+
+    new = Thread(
+        target=_dummy_target_shielded, args=[time.perf_counter() + 0.5], daemon=True
+    )
+    new.start()
+    assert kill_all([new], timeout=0.1) == [new]
+    new.join()
+
+
+# >>>>>>>>>> Compact State <<<<<<<<<< #
+def test_slottedState():
+    """This test is for testing that thread state is slotted and allocated lazily"""
+    new = Thread(target=_dummy_target_raiseToPower, args=[4, 2], daemon=True)
+    assert 'errors' not in new.__dict__ and '_future' not in new.__dict__
+    assert new._hooks is None and new._errors is None
+    assert new._future is None and new._token is None
+
+    new.start()
+    new.join()
+    assert new._errors is None and new._future is None
+    assert new.future.result(timeout=0) == 16
+    assert new.errors == []
+
+
+def test_lazyFutureWhileRunning():
+    """This test is for testing that a future created while running can no longer be cancelled"""
+    new = Thread(target=_dummy_target_raiseToPower, args=[4, 2, 0.1], daemon=True)
+    new.start()
+    time.sleep(0.02)
+    assert not new.future.cancel()
+    assert new.future.result(timeout=1) == 16
+
+
+def test_integerState():
+    """This test is for testing that the integer state mirrors the status string"""
+    new = Thread(target=_dummy_target_raiseToPower, args=[4, 2], daemon=True)
+    assert new.state is ThreadState.IDLE and new.status == 'Idle'
+    new.start()
+    new.join()
+    assert new.state is ThreadState.COMPLETED
+    assert new.state.status == new.status == 'Completed'
+    assert ThreadState.of('Kill Scheduled') is ThreadState.KILL_SCHEDULED
+
+
+# >>>>>>>>>> State Machine <<<<<<<<<< #
+def test_waitForStatus():
+    """This test is for testing waiting on a status instead of polling it"""
+    new = Thread(target=_dummy_target_raiseToPower, args=[4, 2, 0.05], daemon=True)
+    assert not new.wait_for('Running', 0.01)
+    new.start()
+    assert new.wait_for('Completed', 1)
+    assert new.wait_for(ThreadState.RUNNING, 0)
+    assert new.result == 16
+
+
+def test_waitForAny():
+    """This test is for testing waiting for any of several statuses"""
+    new = Thread(
+        target=_dummy_raiseException,
+        args=[ValueError()],
+        suppress_errors=True,
+        daemon=True,
+    )
+    new.start()
+    assert new.wait_for(['Completed', 'Errored'], 1)
+    assert new.status == 'Errored'
+
+
+def test_transitions():
+    """This test is for testing which transitions are allowed"""
+    assert ThreadState.IDLE.can_become(ThreadState.RUNNING)
+    assert not ThreadState.IDLE.can_become(ThreadState.COMPLETED)
+    assert ThreadState.KILLED.terminal
+    assert not ThreadState.KILL_SCHEDULED.terminal
+
+
+def test_killSettledThread():
+    """This test is for testing that a thread which has settled cannot be scheduled for a kill"""
+    new = Thread(target=_dummy_target_raiseToPower, args=[4, 2], daemon=True)
+    new.start()
+    new.join()
+    with pytest.raises(exceptions.ThreadNotRunningError):
+        new.kill()
+    assert new.status == 'Completed'
+
+
+def test_joinKilled():
+    """This test is for testing that a killed thread can still be joined"""
+    new = Thread(target=_dummy_target_loop, args=[time.perf_counter() + 5], daemon=True)
+    new.start()
+    assert new.kill(True)
+    new.join()
+    assert new.status == 'Killed'
+
+
 # >>>>>>>>>> Raising Exceptions <<<<<<<<<< #
+def test_raises_invalidTransition():
+    """This test should raise InvalidStateTransitionError"""
+    new = Thread(target=_dummy_target_raiseToPower, args=[4, 2], daemon=True)
+    new.start()
+    new.join()
+    with pytest.raises(exceptions.InvalidStateTransitionError):
+        new.status = 'Running'
+
+
+def test_raises_joinNotStarted():
+    """This test should raise ThreadNotRunningError"""
+    new = Thread(target=_dummy_target_raiseToPower, args=[4, 2], daemon=True)
+    with pytest.raises(exceptions.ThreadNotRunningError):
+        new.join()
+
+
 def test_raises_stillRunningError():
     """This test should raise ThreadStillRunningError"""
     new = Thread(target=_dummy_target_raiseToPower, args=[4, 2, 5], daemon=True)